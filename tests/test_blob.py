@@ -3,7 +3,9 @@
 Tests for the text processor.
 """
 from __future__ import unicode_literals
+import io
 import json
+import pickle
 from unittest import TestCase, main
 from datetime import datetime
 import warnings
@@ -21,6 +23,7 @@ from textblob.sentiments import NaiveBayesAnalyzer, PatternAnalyzer
 from textblob.parsers import PatternParser
 from textblob.classifiers import NaiveBayesClassifier
 import textblob.wordnet as wn
+from textblob.utils import PUNCTUATION_REGEX
 
 Synset = nltk.corpus.reader.Synset
 
@@ -94,6 +97,14 @@ class WordListTest(TestCase):
         wl = tb.WordList(["cat", "dogs", "oxen"])
         assert_equal(wl.lemmatize(), tb.WordList(['cat', 'dog', 'ox']))
 
+    @attr('slow')
+    def test_lemmatize_with_pos_tags(self):
+        wl = tb.WordList(["geese", "were", "flying", "better"])
+        assert_equal(wl.lemmatize(["NNS", "VBD", "VBG", "JJR"]),
+                     tb.WordList(['goose', 'be', 'fly', 'good']))
+        assert_equal(wl.lemmatize(["n", "v", "v", "a"]),
+                     tb.WordList(['goose', 'be', 'fly', 'good']))
+
     def test_upper(self):
         wl = tb.WordList(self.words)
         assert_equal(wl.upper(), tb.WordList([w.upper() for w in self.words]))
@@ -118,6 +129,8 @@ class WordListTest(TestCase):
         assert_true(isinstance(wl[1], tb.Word))
         wl.append(('a', 'tuple'))
         assert_true(isinstance(wl[2], tuple))
+        assert_equal(len(wl), 3)
+        assert_equal(list(wl), ['dog', 'cat', ('a', 'tuple')])
 
     def test_extend(self):
         wl = tb.WordList(["cats", "dogs"])
@@ -125,6 +138,23 @@ class WordListTest(TestCase):
         assert_true(isinstance(wl[2], tb.Word))
         assert_true(isinstance(wl[3], int))
 
+    def test_plain(self):
+        wl = tb.WordList(['Dogs', 'cats'], plain=True)
+        assert_equal(wl, ['Dogs', 'cats'])
+        assert_true(type(wl[0]) is unicode)
+        assert_true(wl[0:1].plain)
+        singular = wl.singularize()
+        assert_equal(singular, ['Dog', 'cat'])
+        assert_true(type(singular[0]) is unicode)
+        wl.append('mice')
+        assert_true(type(wl[2]) is unicode)
+
+    def test_pickle(self):
+        wl = tb.WordList(['dogs', 'cats'])
+        loaded = pickle.loads(pickle.dumps(wl))
+        assert_equal(loaded, wl)
+        assert_true(isinstance(loaded[0], tb.Word))
+
 
 class SentenceTest(TestCase):
 
@@ -149,6 +179,25 @@ class SentenceTest(TestCase):
     def test_len(self):
         assert_equal(len(self.sentence), len(self.raw_sentence))
 
+    def test_sentences_of_a_blob(self):
+        blob = tb.TextBlob("Hello world. How do you do?", pos_tagger=NLTKTagger())
+        sentence = blob.sentences[1]
+        assert_equal(sentence.raw, "How do you do?")
+        assert_equal(sentence.stripped, "how do you do")
+        assert_true(sentence.pos_tagger is blob.pos_tagger)
+        assert_true(sentence.tokenizer is blob.tokenizer)
+        # Models can still be overridden on a single sentence
+        sentence.pos_tagger = PatternTagger()
+        assert_true(isinstance(sentence.pos_tagger, PatternTagger))
+        assert_true(isinstance(blob.sentences[0].pos_tagger, NLTKTagger))
+
+    def test_pickle(self):
+        blob = tb.TextBlob("Hello world. How do you do?")
+        sentence = pickle.loads(pickle.dumps(blob.sentences[1]))
+        assert_equal(sentence, blob.sentences[1])
+        assert_equal((sentence.start, sentence.end), (13, 27))
+        assert_true(isinstance(sentence.analyzer, PatternAnalyzer))
+
     @attr('slow')
     def test_dict(self):
         sentence_dict = self.sentence.dict
@@ -300,6 +349,14 @@ is managed by the non-profit Python Software Foundation.'''
             tb.WordList(('am', 'eating', 'a', 'pizza'))
         ])
 
+    def test_plain_words(self):
+        blob = tb.TextBlob("I am eating a pizza.", plain_words=True)
+        assert_equal(blob.words, ['I', 'am', 'eating', 'a', 'pizza'])
+        assert_true(type(blob.words[0]) is unicode)
+        assert_true(type(blob.ngrams(2)[0][0]) is unicode)
+        assert_true(type(blob.tags[0][0]) is unicode)
+        assert_true(type(blob.sentences[0].tokens[0]) is unicode)
+
     @attr("py27_only")
     def test_clean_html(self):
         html = '<b>Python</b> is a widely used <a href="/wiki/General-purpose_programming_language" title="General-purpose programming language">general-purpose</a>, <a href="/wiki/High-level_programming_language" title="High-level programming language">high-level programming language</a>.'
@@ -558,6 +615,19 @@ is managed by the non-profit Python Software Foundation.'''
         assert_equal(blob[sent2.start:sent2.end], tb.TextBlob("How do you do?!"))
         assert_equal(blob[sent3.start:sent3.end], tb.TextBlob("This has an ellipses..."))
 
+    def test_indices_with_repeated_sentences(self):
+        blob = tb.TextBlob("Hi.     Hi.     Hi.")
+        assert_equal([(s.start, s.end) for s in blob.sentences],
+                     [(0, 3), (8, 11), (16, 19)])
+
+    def test_iter_sentences(self):
+        blob = tb.TextBlob("Hello world. How do you do?! This has an ellipses...")
+        sentences = blob.iter_sentences()
+        assert_false(isinstance(sentences, list))
+        assert_equal(list(sentences), blob.sentences)
+        for sentence in blob.iter_sentences():
+            assert_equal(blob.raw[sentence.start:sentence.end], sentence.raw)
+
     def test_indices_short_names(self):
         blob = tb.TextBlob(self.text)
         last_sentence = blob.sentences[len(blob.sentences) - 1]
@@ -685,6 +755,19 @@ is managed by the non-profit Python Software Foundation.'''
         assert_true(isinstance(positive.polarity, float))
         assert_true(positive.polarity > 0)
 
+    def test_sentiment_polarity_and_subjectivity_are_consistent(self):
+        blob = tb.TextBlob("Oh my god this is so amazing! I'm so happy!")
+        assert_equal(blob.sentiment, (blob.polarity, blob.subjectivity))
+        assert_equal(blob.sentiment,
+                     PatternAnalyzer().analyze(blob.raw, assessments=True))
+
+    def test_tags_and_tokens_are_unchanged_by_shared_tokens(self):
+        blob = tb.TextBlob(self.text)
+        assert_equal(blob.tokens, tb.WordList(WordTokenizer().tokenize(blob.raw)))
+        tags = [(word, t) for word, t in PatternTagger().tag(blob.raw)
+                if not PUNCTUATION_REGEX.match(t)]
+        assert_equal(blob.tags, tags)
+
     def test_sentiment_of_emoticons(self):
         b1 = tb.TextBlob("Faces have values =)")
         b2 = tb.TextBlob("Faces have values")
@@ -837,6 +920,9 @@ class WordTest(TestCase):
         assert_true(isinstance(self.cat, tb.Word))
         word = tb.Word('cat', 'NN')
         assert_equal(word.pos_tag, 'NN')
+        assert_true(self.cat.pos_tag is None)
+        assert_equal(self.cat.string, 'cat')
+        assert_true(type(self.cat.string) is unicode)
 
     def test_singularize(self):
         singular = self.cats.singularize()
@@ -844,6 +930,12 @@ class WordTest(TestCase):
         assert_equal(self.cat.singularize(), 'cat')
         assert_true(isinstance(self.cat.singularize(), tb.Word))
 
+    def test_singularize_irregular_and_uppercase(self):
+        assert_equal(tb.Word('Women').singularize(), 'Woman')
+        assert_equal(tb.Word('cookies').singularize(), 'cookie')
+        assert_equal(tb.Word('Buses').singularize(), 'Bus')
+        assert_equal(tb.Word('news').singularize(), 'news')
+
     def test_pluralize(self):
         plural = self.cat.pluralize()
         assert_equal(self.cat.pluralize(), 'cats')
@@ -888,6 +980,16 @@ class WordTest(TestCase):
         assert_equal(tb.Word("A").spellcheck(), [("A", 1.0)])
         assert_equal(tb.Word("a").spellcheck(), [("a", 1.0)])
 
+    def test_spellcheck_edit_distance_2(self):
+        assert_equal(tb.Word("korrect").spellcheck()[0][0], "correct")
+        # Capitalization is preserved
+        assert_equal(tb.Word("Korrect").spellcheck()[0][0], "Correct")
+
+    def test_spellcheck_returns_a_new_list(self):
+        suggestions = tb.Word("speling").spellcheck()
+        suggestions.pop()
+        assert_equal(tb.Word("speling").spellcheck()[0][0], "spelling")
+
     def test_correct(self):
         w = tb.Word('speling')
         correct = w.correct()
@@ -946,6 +1048,19 @@ class TestWordnetInterface(TestCase):
         word = tb.Word("eat")
         assert_equal(word.synsets[0].lemmas[0], lemma)
 
+    def test_lemmatize_many(self):
+        lemmas = tb.blob.lemmatize_many(["dogs", "ran", "dogs"], ["NNS", "VBD", None])
+        assert_equal(lemmas, ["dog", "run", "dog"])
+        assert_true(type(lemmas[0]) is unicode)
+
+    def test_lemmatize_many_with_wrong_number_of_tags(self):
+        assert_raises(ValueError, tb.blob.lemmatize_many, ["dogs", "ran"], ["NNS"])
+        assert_raises(ValueError, tb.blob.lemmatize_many, ["dogs"], ["NNS", "VBD"])
+
+    def test_blob_lemmas(self):
+        blob = tb.TextBlob("The geese were flying south.")
+        assert_equal(blob.lemmas, tb.WordList(["The", "goose", "be", "fly", "south"]))
+
 
 class BlobberTest(TestCase):
 
@@ -999,6 +1114,66 @@ class BlobberTest(TestCase):
         blob = b("I am so amazing")
         assert_equal(blob.classify(), 'pos')
 
+    def test_pipe(self):
+        texts = ["Simple is better than complex.", "I do not like it :("]
+        results = list(self.blobber.pipe(texts, fields=("tags", "sentiment")))
+        assert_equal(len(results), 2)
+        for text, (tags, sentiment) in zip(texts, results):
+            blob = self.blobber(text)
+            assert_equal(tags, [(unicode(w), t) for w, t in blob.tags])
+            assert_false(isinstance(tags[0][0], tb.Word))
+            assert_equal(sentiment, tuple(blob.sentiment))
+
+    def test_pipe_noun_phrases(self):
+        text = "Python is a high-level programming language."
+        (noun_phrases,), = self.blobber.pipe([text], fields=("noun_phrases",))
+        assert_equal(noun_phrases, list(self.blobber(text).noun_phrases))
+
+    def test_pipe_polarity_and_subjectivity(self):
+        texts = ["I love it!", "It is terrible.", ""]
+        results = list(self.blobber.pipe(texts, batch_size=1,
+                                         fields=("polarity", "subjectivity")))
+        assert_equal(results, [(self.blobber(t).polarity, self.blobber(t).subjectivity)
+                               for t in texts])
+
+    def test_pipe_with_multiple_jobs(self):
+        texts = ["I love this car.", "This view is horrible.", ""] * 10
+        fields = ("tags", "sentiment")
+        expected = list(self.blobber.pipe(texts, fields=fields))
+        results = list(self.blobber.pipe(texts, batch_size=4, fields=fields,
+                                         n_jobs=2))
+        assert_equal(results, expected)
+
+    def test_pipe_with_worker_pool(self):
+        texts = ["I love this car.", "This view is horrible.", ""] * 4
+        with self.blobber.worker_pool(2, fields=("polarity",)) as pool:
+            for fields in (("polarity",), ("tags", "sentiment")):
+                results = list(self.blobber.pipe(texts, batch_size=2,
+                                                 fields=fields, pool=pool))
+                assert_equal(results,
+                             list(self.blobber.pipe(texts, fields=fields)))
+
+    def test_pipe_uses_workers_by_default(self):
+        b = tb.Blobber(workers=2)
+        assert_equal(b.workers, 2)
+        texts = ["I love this car.", "This view is horrible."]
+        assert_equal(list(b.pipe(texts, fields=("polarity",))),
+                     list(self.blobber.pipe(texts, fields=("polarity",))))
+
+    def test_pipe_with_bad_field(self):
+        with assert_raises(ValueError):
+            list(self.blobber.pipe(["foo"], fields=("bar",)))
+
+    def test_stream(self):
+        text = "Hello world. How do you do?! This has an ellipses... Hello world."
+        expected = [(s.raw, s.start, s.end) for s in tb.TextBlob(text).sentences]
+        for chunk_size in (1, 10, 1000):
+            sentences = list(self.blobber.stream(io.StringIO(text),
+                                                 chunk_size=chunk_size))
+            assert_equal([(s.raw, s.start, s.end) for s in sentences], expected)
+            assert_true(all(s.pos_tagger is self.blobber.pos_tagger
+                            for s in sentences))
+
 def is_blob(obj):
     return isinstance(obj, tb.TextBlob)
 
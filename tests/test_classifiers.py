@@ -1,4 +1,6 @@
 import os
+import shutil
+import tempfile
 import unittest
 from nose.tools import *  # PEP8 asserts
 from nose.plugins.attrib import attr
@@ -6,13 +8,14 @@ from nose.plugins.attrib import attr
 from textblob.packages import nltk
 from textblob.classifiers import (NaiveBayesClassifier, DecisionTreeClassifier,
                               basic_extractor, contains_extractor, NLTKClassifier,
-                              PositiveNaiveBayesClassifier)
+                              PositiveNaiveBayesClassifier, CompiledNaiveBayes)
 from textblob.compat import unicode
 
 HERE = os.path.abspath(os.path.dirname(__file__))
 CSV_FILE = os.path.join(HERE, 'data.csv')
 JSON_FILE = os.path.join(HERE, "data.json")
 TSV_FILE = os.path.join(HERE, "data.tsv")
+NDJSON_FILE = os.path.join(HERE, "data.ndjson")
 
 train_set = [
       ('I love this car', 'positive'),
@@ -89,6 +92,21 @@ class TestNaiveBayesClassifier(unittest.TestCase):
         acc = self.classifier.accuracy(test_set)
         assert_true(isinstance(acc, float))
 
+    def test_prob_classify_many(self):
+        texts = [text for text, label in test_set]
+        results = self.classifier.prob_classify_many(texts)
+        assert_equal(len(results), len(texts))
+        for text, res in zip(texts, results):
+            expected = self.classifier.classifier.prob_classify(
+                self.classifier.extract_features(text))
+            assert_equal(res.max(), expected.max())
+            assert_almost_equal(res.prob("positive"), expected.prob("positive"))
+
+    def test_classify_many(self):
+        texts = [text for text, label in test_set]
+        assert_equal(self.classifier.classify_many(texts),
+                     [self.classifier.classify(text) for text in texts])
+
     def test_update(self):
         res1 = self.classifier.prob_classify("lorem ipsum")
         original_length = len(self.classifier.train_set)
@@ -98,6 +116,75 @@ class TestNaiveBayesClassifier(unittest.TestCase):
         assert_true(res2.prob("positive") > res1.prob("positive"))
         assert_equal(original_length + 1, new_length)
 
+    def test_update_adds_new_words_to_vocabulary(self):
+        assert_false("adipiscing" in self.classifier._word_set)
+        self.classifier.update([("consectetur adipiscing", "positive")])
+        assert_true("adipiscing" in self.classifier._word_set)
+        feats = self.classifier.extract_features("adipiscing")
+        assert_true(feats["contains(adipiscing)"])
+        assert_equal(feats, basic_extractor("adipiscing", self.classifier.train_set))
+
+    def test_update_matches_retraining(self):
+        new_data = [("lorem ipsum", "positive"),
+                    ("I do not like lorem", "negative")]
+        for extractor in (basic_extractor, contains_extractor):
+            cl = NaiveBayesClassifier(list(train_set), extractor)
+            cl.classify("lorem")
+            cl.update(new_data)
+            retrained = NaiveBayesClassifier(train_set + new_data, extractor)
+            retrained = nltk.classify.NaiveBayesClassifier.train(
+                retrained.train_features)
+            for text, label in test_set + new_data:
+                features = cl.extract_features(text)
+                expected = retrained.prob_classify(features)
+                probs = cl.classifier.prob_classify(features)
+                assert_almost_equal(probs.prob("positive"),
+                                    expected.prob("positive"))
+
+    def test_update_compiles_changed_distributions(self):
+        texts = [text for text, label in test_set] + ["lorem ipsum", ""]
+        for extractor in (basic_extractor, contains_extractor):
+            cl = NaiveBayesClassifier(list(train_set), extractor)
+            model = cl._compiled_model()
+            cl.update([("lorem ipsum", "positive"), ("dolor", "neutral")])
+            assert_true(cl._compiled_model() is model)
+            fresh = NaiveBayesClassifier(list(train_set), extractor)
+            fresh.update([("lorem ipsum", "positive"), ("dolor", "neutral")])
+            for res, expected in zip(cl.prob_classify_many(texts),
+                                     fresh.prob_classify_many(texts)):
+                for label in ("positive", "negative", "neutral"):
+                    assert_almost_equal(res.prob(label), expected.prob(label))
+
+    def test_update_does_not_extract_train_features(self):
+        cl = NaiveBayesClassifier(list(train_set))
+        cl.classify("lorem")
+        cl.update([("lorem ipsum", "positive")])
+        assert_true(cl._train_features is None)
+        assert_equal(len(cl.train_features), len(train_set) + 1)
+
+    def test_update_with_estimator(self):
+        estimator = nltk.probability.LaplaceProbDist
+        cl = NaiveBayesClassifier(list(train_set))
+        cl.update([("lorem ipsum", "positive")], estimator=estimator)
+        retrained = nltk.classify.NaiveBayesClassifier.train(
+            cl.train_features, estimator=estimator)
+        features = cl.extract_features("lorem")
+        assert_almost_equal(cl.classifier.prob_classify(features).prob("positive"),
+                            retrained.prob_classify(features).prob("positive"))
+
+    def test_update_with_filename(self):
+        cl = NaiveBayesClassifier(list(train_set))
+        cl.update(JSON_FILE)
+        assert_equal(cl.train_set[len(train_set)], ('I love this car', 'pos'))
+        assert_true('pos' in cl.labels())
+
+    def test_model_before_update_is_invalidated(self):
+        cl = NaiveBayesClassifier(list(train_set), contains_extractor)
+        old = cl.classifier
+        cl.update([("lorem ipsum", "positive")])
+        with assert_raises(RuntimeError):
+            old.prob_classify({"contains(lorem)": True})
+
     def test_labels(self):
         labels = self.classifier.labels()
         assert_true("positive" in labels)
@@ -148,6 +235,60 @@ class TestNaiveBayesClassifier(unittest.TestCase):
         a = self.classifier.accuracy(JSON_FILE)
         assert_true(isinstance(a, float))
 
+    def test_evaluate(self):
+        evaluation = self.classifier.evaluate(test_set, batch_size=2)
+        assert_equal(evaluation.accuracy, self.classifier.accuracy(test_set))
+        assert_equal(evaluation.total, len(test_set))
+        predicted = self.classifier.classify_many([t for t, l in test_set])
+        for label in ("positive", "negative"):
+            reference = set(i for i, (t, l) in enumerate(test_set) if l == label)
+            test = set(i for i, p in enumerate(predicted) if p == label)
+            assert_equal(evaluation.precision[label],
+                         nltk.metrics.precision(reference, test))
+            assert_equal(evaluation.recall[label],
+                         nltk.metrics.recall(reference, test))
+            assert_almost_equal(evaluation.f_measure[label],
+                                nltk.metrics.f_measure(reference, test))
+        expected = nltk.metrics.ConfusionMatrix([l for t, l in test_set],
+                                                predicted)
+        assert_equal(evaluation.confusion.pp(), expected.pp())
+
+    def test_evaluate_in_parallel(self):
+        evaluation = self.classifier.evaluate(CSV_FILE, batch_size=3, n_jobs=2)
+        expected = self.classifier.evaluate(CSV_FILE)
+        assert_equal(evaluation.total, 10)
+        assert_equal(evaluation.accuracy, expected.accuracy)
+        assert_equal(evaluation.confusion.pp(), expected.confusion.pp())
+
+    def test_workers_receive_no_training_data(self):
+        worker = self.classifier._prepare_for_workers()
+        assert_equal(worker.train_set, [])
+        assert_true("classifier" not in worker.__dict__)
+        texts = [text for text, _ in test_set] + ["lorem ipsum"]
+        assert_equal(worker.classify_many(texts),
+                     self.classifier.classify_many(texts))
+
+    def test_accuracy_on_ndjson_file_with_format(self):
+        a = self.classifier.accuracy(NDJSON_FILE, format="ndjson")
+        assert_equal(a, self.classifier.accuracy(JSON_FILE))
+
+    def test_train_from_file_without_reading_train_set(self):
+        rows = NaiveBayesClassifier(JSON_FILE).train_set
+        for extractor in (basic_extractor, contains_extractor):
+            cl = NaiveBayesClassifier(JSON_FILE, extractor)
+            expected = NaiveBayesClassifier(list(rows), extractor)
+            assert_equal(cl.classify("I feel happy this morning"),
+                         expected.classify("I feel happy this morning"))
+            cl.update([("lorem ipsum", "pos")])
+            assert_true("train_set" not in cl.__dict__)
+            assert_true("trained on {0} instances".format(len(rows) + 1)
+                        in repr(cl))
+            assert_equal(cl.train_set, rows + [("lorem ipsum", "pos")])
+
+    def test_init_with_ndjson_file(self):
+        cl = NaiveBayesClassifier(NDJSON_FILE)
+        assert_equal(cl.train_set, NaiveBayesClassifier(JSON_FILE).train_set)
+
     def test_init_with_tsv_file(self):
         cl = NaiveBayesClassifier(TSV_FILE)
         assert_equal(cl.classify("I feel happy this morning"), 'pos')
@@ -242,6 +383,20 @@ class TestPositiveNaiveBayesClassifier(unittest.TestCase):
         assert_equal(new_pos_length, orig_pos_length + 1)
         assert_equal(new_unlabeled_length, orig_unlabeled_length + 1)
 
+    def test_update_matches_retraining(self):
+        self.classifier.classify("My team lost the game")
+        self.classifier.update(new_positive_data=['He threw the ball to the base.'],
+                               new_unlabeled_data=["I passed a tree today."],
+                               positive_prob_prior=0.3)
+        retrained = nltk.classify.PositiveNaiveBayesClassifier.train(
+            self.classifier.positive_features,
+            self.classifier.unlabeled_features, 0.3)
+        for text in ["My team lost the game", "I passed the ball", "foo"]:
+            features = self.classifier.extract_features(text)
+            assert_almost_equal(
+                self.classifier.classifier.prob_classify(features).prob(True),
+                retrained.prob_classify(features).prob(True))
+
     def test_accuracy(self):
         test_set = [
             ("My team lost the game", True),
@@ -261,6 +416,122 @@ class TestPositiveNaiveBayesClassifier(unittest.TestCase):
                      )
 
 
+@attr("requires_numpy")
+class TestCompiledNaiveBayes(unittest.TestCase):
+
+    def setUp(self):
+        train_features = [(contains_extractor(text), label)
+                          for text, label in train_set]
+        self.nltk_classifier = nltk.classify.NaiveBayesClassifier.train(train_features)
+        self.featuresets = [contains_extractor(text) for text, _ in test_set]
+
+    def test_prob_classify_many(self):
+        compiled = CompiledNaiveBayes(self.nltk_classifier)
+        results = compiled.prob_classify_many(self.featuresets)
+        for featureset, res in zip(self.featuresets, results):
+            expected = self.nltk_classifier.prob_classify(featureset)
+            for label in self.nltk_classifier.labels():
+                assert_almost_equal(res.prob(label), expected.prob(label))
+
+    def test_classify_many(self):
+        compiled = CompiledNaiveBayes(self.nltk_classifier)
+        assert_equal(compiled.classify_many(self.featuresets),
+                     [self.nltk_classifier.classify(f) for f in self.featuresets])
+
+    def test_unseen_features_are_ignored(self):
+        compiled = CompiledNaiveBayes(self.nltk_classifier)
+        featureset = {"contains(lorem)": True, "contains(happy)": "unseen"}
+        res = compiled.prob_classify_many([featureset])[0]
+        expected = self.nltk_classifier.prob_classify(featureset)
+        assert_almost_equal(res.prob("positive"), expected.prob("positive"))
+
+    def test_defaults(self):
+        train_features = [(basic_extractor(text, train_set), label)
+                          for text, label in train_set]
+        classifier = nltk.classify.NaiveBayesClassifier.train(train_features)
+        defaults = dict((fname, False) for fname in train_features[0][0])
+        compiled = CompiledNaiveBayes(classifier, defaults)
+        text = "I feel happy this morning"
+        dense = basic_extractor(text, train_set)
+        sparse = dict((fname, True) for fname, fval in dense.items() if fval)
+        expected = classifier.prob_classify(dense)
+        for featureset in (dense, sparse):
+            res = compiled.prob_classify_many([featureset])[0]
+            assert_almost_equal(res.prob("positive"), expected.prob("positive"))
+
+    def test_save_and_load(self):
+        compiled = CompiledNaiveBayes(self.nltk_classifier)
+        tmpdir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmpdir, "model.nb")
+            compiled.save(path)
+            for mmap in (True, False):
+                loaded = CompiledNaiveBayes.load(path, mmap=mmap)
+                assert_equal(loaded.labels, compiled.labels)
+                assert_equal(loaded.logprob_many(self.featuresets).tolist(),
+                             compiled.logprob_many(self.featuresets).tolist())
+        finally:
+            shutil.rmtree(tmpdir)
+
+
+class TestSaveNaiveBayesClassifier(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "model.nb")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_load_classifies_like_the_saved_classifier(self):
+        texts = [text for text, _ in test_set] + ["lorem ipsum", ""]
+        for extractor in (basic_extractor, contains_extractor):
+            classifier = NaiveBayesClassifier(list(train_set), extractor)
+            classifier.save(self.path)
+            loaded = NaiveBayesClassifier.load(self.path, extractor)
+            assert_equal(sorted(loaded.labels()), sorted(classifier.labels()))
+            assert_equal(loaded.classify_many(texts),
+                         classifier.classify_many(texts))
+            for res, expected in zip(loaded.prob_classify_many(texts),
+                                     classifier.prob_classify_many(texts)):
+                assert_almost_equal(res.prob("positive"),
+                                    expected.prob("positive"))
+            assert_equal(loaded.accuracy(test_set),
+                         classifier.accuracy(test_set))
+            assert_equal(loaded.evaluate(test_set, n_jobs=2).accuracy,
+                         classifier.accuracy(test_set))
+
+    def test_loaded_classifier_cannot_be_trained(self):
+        NaiveBayesClassifier(list(train_set)).save(self.path)
+        loaded = NaiveBayesClassifier.load(self.path)
+        assert_true("loaded from" in repr(loaded))
+        with assert_raises(ValueError):
+            loaded.update([("lorem ipsum", "positive")])
+        with assert_raises(ValueError):
+            loaded.informative_features()
+
+    def test_save_requires_plain_labels(self):
+        classifier = NaiveBayesClassifier([("lorem", ("a", "tuple"))])
+        with assert_raises(ValueError):
+            classifier.save(self.path)
+        assert_false(os.listdir(self.tmpdir))
+
+    def test_load_rejects_other_files(self):
+        with assert_raises(ValueError):
+            NaiveBayesClassifier.load(CSV_FILE)
+
+
+def test_confusion_matrix_from_counts():
+    reference = 'DET NN VB DET JJ NN NN IN DET NN'.split()
+    test = 'DET VB VB DET NN NN NN IN DET NN'.split()
+    counts = {}
+    for pair in zip(reference, test):
+        counts[pair] = counts.get(pair, 0) + 1
+    matrix = nltk.metrics.ConfusionMatrix.from_counts(counts)
+    assert_equal(matrix['NN', 'NN'], 3)
+    assert_equal(matrix.pp(), nltk.metrics.ConfusionMatrix(reference, test).pp())
+
+
 def test_basic_extractor():
     text = "I feel happy this morning."
     feats = basic_extractor(text, train_set)
@@ -275,6 +546,14 @@ def test_basic_extractor_with_list():
     assert_true(feats['contains(morning)'])
     assert_false(feats["contains(amazing)"])
 
+def test_basic_extractor_with_word_set():
+    text = "I feel happy this morning."
+    word_set = set(["feel", "morning", "amazing"])
+    feats = basic_extractor(text, word_set)
+    assert_equal(len(feats), 3)
+    assert_true(feats["contains(feel)"])
+    assert_false(feats["contains(amazing)"])
+
 def test_contains_extractor_with_string():
     text = "Simple is better than complex"
     features = contains_extractor(text)
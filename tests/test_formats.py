@@ -1,7 +1,13 @@
 # -*- coding: utf-8 -*-
 import os
+import contextlib
+import gzip
+import io
+import shutil
+import tempfile
 import unittest
 import logging
+import json
 from nose.tools import *  # PEP8 asserts
 
 from textblob import formats
@@ -12,6 +18,7 @@ HERE = os.path.abspath(os.path.dirname(__file__))
 CSV_FILE = os.path.join(HERE, 'data.csv')
 JSON_FILE = os.path.join(HERE, "data.json")
 TSV_FILE = os.path.join(HERE, "data.tsv")
+NDJSON_FILE = os.path.join(HERE, "data.ndjson")
 
 class TestFormats(unittest.TestCase):
 
@@ -26,10 +33,65 @@ class TestFormats(unittest.TestCase):
         format = formats.detect(JSON_FILE)
         assert_equal(format, formats.JSON)
 
+    def test_detect_tsv(self):
+        format = formats.detect(TSV_FILE)
+        assert_equal(format, formats.TSV)
+
+    def test_detect_ndjson(self):
+        format = formats.detect(NDJSON_FILE)
+        assert_equal(format, formats.NDJSON)
+
+    def test_detect_json_larger_than_max_read(self):
+        format = formats.detect(JSON_FILE, max_read=100)
+        assert_equal(format, formats.JSON)
+
     def test_available(self):
         assert_true('csv' in formats.AVAILABLE.keys())
         assert_true('json' in formats.AVAILABLE.keys())
         assert_true('tsv' in formats.AVAILABLE.keys())
+        assert_true('ndjson' in formats.AVAILABLE.keys())
+
+    def test_all_formats_read_the_same_rows(self):
+        expected = [tuple(row) for row in formats.CSV(CSV_FILE)]
+        assert_equal(len(expected), 10)
+        for Format, fname in [(formats.TSV, TSV_FILE),
+                              (formats.JSON, JSON_FILE),
+                              (formats.NDJSON, NDJSON_FILE)]:
+            assert_equal([tuple(row) for row in Format(fname)], expected)
+
+    def test_iter_chunks(self):
+        chunks = list(formats.CSV(CSV_FILE).iter_chunks(4))
+        assert_equal([len(chunk) for chunk in chunks], [4, 4, 2])
+
+
+class TestGzip(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def gzipped(self, fname):
+        path = os.path.join(self.tmpdir, os.path.basename(fname) + '.gz')
+        with open(fname, 'rb') as src:
+            with contextlib.closing(gzip.open(path, 'wb')) as dst:
+                dst.write(src.read())
+        return path
+
+    def test_detect(self):
+        for Format, fname in [(formats.CSV, CSV_FILE),
+                              (formats.TSV, TSV_FILE),
+                              (formats.JSON, JSON_FILE),
+                              (formats.NDJSON, NDJSON_FILE)]:
+            assert_equal(formats.detect(self.gzipped(fname)), Format)
+
+    def test_read(self):
+        for Format, fname in [(formats.CSV, CSV_FILE),
+                              (formats.JSON, JSON_FILE),
+                              (formats.NDJSON, NDJSON_FILE)]:
+            assert_equal(list(Format(self.gzipped(fname))),
+                         list(Format(fname)))
 
 class TestDelimitedFormat(unittest.TestCase):
 
@@ -92,5 +154,63 @@ class TestJSON(unittest.TestCase):
         text, label = first[0], first[1]
         assert_true(isinstance(text, unicode))
 
+    def test_iter_is_lazy(self):
+        rows = iter(formats.JSON(JSON_FILE))
+        assert_equal(next(rows), ('I love this car', 'pos'))
+
+    def test_iter_reads_in_small_buffers(self):
+        with open(JSON_FILE) as fp:
+            items = list(formats._iter_json_array(fp, bufsize=7))
+        with open(JSON_FILE) as fp:
+            assert_equal(items, json.load(fp))
+
+    def test_iter_rejects_invalid_arrays(self):
+        for text in ['[1 2 3]', '[,,1,]', '[1,]', '[1,2]trailing', '[1',
+                     '{"text": "a"}']:
+            with assert_raises(ValueError):
+                list(formats._iter_json_array(io.StringIO(text), bufsize=3))
+
+    def test_iter_large_item(self):
+        text = u'x' * 10000
+        fp = io.StringIO(u'[{"text": "%s", "label": "pos"}, 12345]' % text)
+        items = list(formats._iter_json_array(fp, bufsize=7))
+        assert_equal(items, [{'text': text, 'label': 'pos'}, 12345])
+
+    def test_iter_raises_at_malformed_item(self):
+        fp = io.StringIO(u'[{"text": tru}, ' + u'{"text": "a"}, ' * 1000 + u'{}]')
+        with assert_raises(ValueError):
+            list(formats._iter_json_array(fp, bufsize=16))
+        assert_true(fp.tell() < 100)
+
+class TestNDJSON(unittest.TestCase):
+
+    def test_detect(self):
+        with open(NDJSON_FILE, 'r') as fp:
+            stream = fp.read()
+            assert_true(formats.NDJSON.detect(stream))
+        with open(CSV_FILE, 'r') as fp:
+            stream = fp.read()
+            assert_false(formats.NDJSON.detect(stream))
+
+    def test_to_iterable(self):
+        data = formats.NDJSON(NDJSON_FILE).to_iterable()
+        assert_equal(len(data), 10)
+        text, label = data[1]
+        assert_equal(text, u'美丽优于丑陋')
+        assert_equal(label, 'pos')
+
+    def test_single_record(self):
+        tmpdir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmpdir, 'one.ndjson')
+            with open(path, 'w') as fp:
+                fp.write('{"text": "I love this car.", "label": "pos"}\n')
+            assert_equal(formats.detect(path), formats.NDJSON)
+            assert_false(formats.JSON.detect('{"text": "a", "label": "pos"}'))
+            assert_equal(list(formats.NDJSON(path)),
+                        [('I love this car.', 'pos')])
+        finally:
+            shutil.rmtree(tmpdir)
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,11 +1,16 @@
 from __future__ import unicode_literals
+import os
+import shutil
+import tempfile
 import unittest
 from nose.tools import *  # PEP8 asserts
 from nose.plugins.attrib import attr
 
 from textblob.packages import nltk
+from textblob.nltk.tag import sequential
 from textblob.base import BaseNPExtractor
-from textblob.np_extractors import ConllExtractor
+from textblob.np_extractors import ConllExtractor, FastNPExtractor
+from textblob.en.np_extractors import ChunkParser
 from textblob.utils import filter_insignificant
 
 
@@ -44,6 +49,139 @@ constructs intended to enable clear programs on both a small and large scale.
         assert_true("DT" not in tags)
 
 
+TAGGED_SENTS = [
+    [("The", "AT"), ("design", "NN"), ("philosophy", "NN"), ("of", "IN"),
+     ("Python", "NP"), ("emphasizes", "VBZ"), ("code", "NN"),
+     ("readability", "NN"), (".", ".")],
+    [("Programmers", "NNS"), ("express", "VB"), ("concepts", "NNS"),
+     ("in", "IN"), ("fewer", "AP"), ("lines", "NNS"), (".", ".")],
+]
+
+CHUNKED_SENTS = [
+    [("DT", "B-NP"), ("NN", "I-NP"), ("NN", "I-NP"), ("IN", "O"),
+     ("NNP", "B-NP"), ("VBZ", "O"), ("NN", "B-NP"), ("NN", "I-NP"), (".", "O")],
+]
+
+
+class TestSavedModels(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "model.txt")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_save_and_load_fast_np_extractor(self):
+        extractor = FastNPExtractor()
+        unigram = nltk.UnigramTagger(TAGGED_SENTS,
+                                     backoff=extractor._regexp_tagger())
+        extractor.tagger = nltk.BigramTagger(TAGGED_SENTS, backoff=unigram)
+        extractor._trained = True
+        extractor.save(self.path)
+        loaded = FastNPExtractor(path=self.path)
+        loaded.warmup()
+        assert_equal(loaded.tagger._context_to_tag,
+                     extractor.tagger._context_to_tag)
+        assert_equal(loaded.tagger.backoff._context_to_tag,
+                     extractor.tagger.backoff._context_to_tag)
+        text = "The design philosophy of Python emphasizes code readability."
+        assert_equal(loaded.extract(text), extractor.extract(text))
+
+    def test_save_and_load_sentence_initial_context(self):
+        # "Can" is a noun except at the start of a sentence
+        sents = [
+            [("Can", "MD"), ("you", "PPSS"), ("see", "VB"), ("?", ".")],
+            [("The", "AT"), ("can", "NN"), ("is", "BEZ"), ("red", "JJ")],
+            [("A", "AT"), ("Can", "NN"), ("fell", "VBD"), (".", ".")],
+            [("Her", "PP$"), ("Can", "NN"), ("rolled", "VBD"), (".", ".")],
+        ]
+        extractor = FastNPExtractor()
+        unigram = nltk.UnigramTagger(sents, backoff=extractor._regexp_tagger())
+        extractor.tagger = nltk.BigramTagger(sents, backoff=unigram)
+        extractor._trained = True
+        assert_true(((), "Can") in extractor.tagger._context_to_tag)
+        extractor.save(self.path)
+        loaded = FastNPExtractor(path=self.path)
+        loaded.warmup()
+        assert_equal(loaded.tagger._context_to_tag,
+                     extractor.tagger._context_to_tag)
+        tokens = ["Can", "it", "fly", "?"]
+        assert_equal(loaded.tagger.tag(tokens), extractor.tagger.tag(tokens))
+        assert_equal(loaded.tagger.tag(tokens)[0], ("Can", "MD"))
+
+    def test_save_and_load_chunk_parser(self):
+        parser = ChunkParser()
+        unigram = nltk.UnigramTagger(CHUNKED_SENTS)
+        parser.tagger = nltk.BigramTagger(CHUNKED_SENTS, backoff=unigram)
+        parser._trained = True
+        parser.save(self.path)
+        loaded = ChunkParser(path=self.path)
+        sentence = [("The", "DT"), ("code", "NN"), ("of", "IN"),
+                    ("Python", "NNP"), ("?", ".")]
+        assert_equal(loaded.parse(sentence), parser.parse(sentence))
+
+
+REGEXPS = [(r'^[A-Z].*$', 'NP'), (r'.*s$', 'NNS'), (r'.*', 'NN')]
+
+
+class UnmemoizedRegexpTagger(nltk.RegexpTagger):
+    '''A regexp tagger whose decisions can't be memoized.'''
+
+    def choice_key(self, tokens, index, history):
+        return None
+
+
+class SentenceStartRegexpTagger(nltk.RegexpTagger):
+    '''A regexp tagger whose choice depends on the position of a token.'''
+
+    def choose_tag(self, tokens, index, history):
+        if index == 0:
+            return 'AT'
+        return super(SentenceStartRegexpTagger, self).choose_tag(
+            tokens, index, history)
+
+
+class TestTaggerTraining(unittest.TestCase):
+
+    def train(self, regexp_tagger, n_jobs=1):
+        unigram = nltk.UnigramTagger(TAGGED_SENTS * 3, backoff=regexp_tagger,
+                                     n_jobs=n_jobs)
+        return nltk.BigramTagger(TAGGED_SENTS * 3, backoff=unigram,
+                                 n_jobs=n_jobs)
+
+    def test_memoized_backoff_decisions(self):
+        tagger = self.train(nltk.RegexpTagger(REGEXPS))
+        unmemoized = self.train(UnmemoizedRegexpTagger(REGEXPS))
+        assert_true(tagger.backoff._context_to_tag)
+        assert_equal(tagger._context_to_tag, unmemoized._context_to_tag)
+        assert_equal(tagger.backoff._context_to_tag,
+                     unmemoized.backoff._context_to_tag)
+
+    def test_overridden_choose_tag_is_not_memoized(self):
+        regexp_tagger = SentenceStartRegexpTagger(REGEXPS)
+        tokens = ["Programmers", "express", "concepts"]
+        assert_equal(regexp_tagger._tag_one_key(tokens, 0, []), None)
+        # The backoff tags "code" correctly, except at the start of the
+        # second sentence
+        sents = [[("the", "AT"), ("code", "NN")],
+                 [("code", "NN"), ("runs", "NNS")]]
+        tagger = nltk.UnigramTagger(sents, backoff=regexp_tagger)
+        assert_equal(tagger._context_to_tag, {"code": "NN"})
+
+    def test_train_in_parallel(self):
+        tagger = self.train(nltk.RegexpTagger(REGEXPS))
+        shard_size = sequential._SHARD_SIZE
+        sequential._SHARD_SIZE = 1  # Merge several shards
+        try:
+            parallel = self.train(nltk.RegexpTagger(REGEXPS), n_jobs=2)
+        finally:
+            sequential._SHARD_SIZE = shard_size
+        assert_equal(parallel._context_to_tag, tagger._context_to_tag)
+        assert_equal(parallel.backoff._context_to_tag,
+                     tagger.backoff._context_to_tag)
+
+
 class BadExtractor(BaseNPExtractor):
     '''An extractor without an extract method. How useless.'''
     pass
@@ -4,6 +4,7 @@ from nose.tools import *  # PEP8 asserts
 
 from textblob.parsers import PatternParser
 from textblob.en import parse as pattern_parse
+from textblob._text import find_tokens, find_token_offsets
 
 
 class TestPatternParser(unittest.TestCase):
@@ -16,5 +17,30 @@ class TestPatternParser(unittest.TestCase):
         assert_equal(self.parser.parse(self.text), pattern_parse(self.text))
 
 
+class TestFindTokens(unittest.TestCase):
+
+    def setUp(self):
+        self.text = u"I don't know... Is it \"good\"?\n\nMr. Smith said so :)"
+
+    def test_find_tokens(self):
+        assert_equal(find_tokens(self.text), [
+            u"I do n ' t know ...",
+            u'Is it " good " ?',
+            u"Mr. Smith said so :)"])
+
+    def test_find_token_offsets(self):
+        sentences = find_token_offsets(self.text)
+        assert_equal([u" ".join(w for w, i, j in s) for s in sentences],
+            find_tokens(self.text))
+        assert_equal(sentences[0][:3], [(u"I", 0, 1), (u"do", 2, 4), (u"n", 4, 5)])
+        for s in sentences:
+            for w, i, j in s:
+                assert_equal(self.text[i:j], w)
+
+    def test_find_token_offsets_of_joined_emoticons(self):
+        assert_equal(find_token_offsets(u"Great : ) (!)"),
+            [[(u"Great", 0, 5), (u":)", 6, 9), (u"(!)", 10, 13)]])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+'''Tests for the FreqDist in the vendorized NLTK.'''
+import pickle
+from unittest import TestCase
+from nose.tools import *  # PEP8 asserts
+
+from textblob.packages import nltk
+
+FreqDist = nltk.probability.FreqDist
+ConditionalFreqDist = nltk.probability.ConditionalFreqDist
+
+
+class TestFreqDist(TestCase):
+
+    def setUp(self):
+        self.fd = FreqDist('abracadabra')
+
+    def test_most_common(self):
+        assert_equal(self.fd.most_common(2), [('a', 5), ('b', 2)])
+        assert_equal(self.fd.most_common(), self.fd.items())
+        assert_equal(self.fd.most_common(0), [])
+
+    def test_most_common_ties_are_sorted(self):
+        assert_equal(self.fd.most_common(4),
+                    [('a', 5), ('b', 2), ('r', 2), ('c', 1)])
+
+    def test_counts_are_maintained(self):
+        self.fd.inc('c', 2)
+        self.fd['z'] = 1
+        assert_equal(self.fd.N(), 14)
+        assert_equal(self.fd.B(), 6)
+        assert_equal(self.fd.Nr(1), 2)
+        assert_equal(self.fd.Nr(2), 2)
+        assert_equal(self.fd.Nr(3), 1)
+        assert_equal(self.fd.hapaxes(), ['d', 'z'])
+        assert_equal(self.fd.max(), 'a')
+        self.fd.inc('r', 4)
+        assert_equal(self.fd.max(), 'r')
+
+    def test_remove_samples(self):
+        del self.fd['a']
+        assert_equal(self.fd.pop('b'), 2)
+        assert_equal(self.fd.pop('q', 0), 0)
+        assert_equal(self.fd.N(), 4)
+        assert_equal(self.fd.Nr(2), 1)
+        assert_equal(self.fd.max(), 'r')
+        assert_equal(list(self.fd.keys()), ['r', 'c', 'd'])
+
+    def test_unordered(self):
+        fd = FreqDist('abracadabra', ordered=False)
+        assert_equal(sorted(fd.items()), sorted(self.fd.items()))
+        assert_equal(fd.most_common(1), [('a', 5)])
+        assert_false(fd.copy().ordered)
+
+    def test_copy(self):
+        fd = self.fd.copy()
+        fd.inc('z')
+        assert_equal(fd.N(), self.fd.N() + 1)
+        assert_equal(fd.Nr(1), self.fd.Nr(1) + 1)
+        assert_true('z' not in self.fd)
+
+    def test_pickle(self):
+        fd = pickle.loads(pickle.dumps(self.fd, 2))
+        assert_equal(fd, self.fd)
+        assert_equal(fd.N(), 11)
+        assert_equal(fd.Nr(2), 2)
+
+
+class TestConditionalFreqDist(TestCase):
+
+    def test_add(self):
+        cfd = ConditionalFreqDist([(1, 'a'), (2, 'b'), (1, 'a')])
+        other = ConditionalFreqDist([(1, 'a'), (3, 'c')])
+        merged = cfd + other
+        assert_equal(merged[1]['a'], 3)
+        assert_equal(merged.conditions(), [1, 2, 3])
+        assert_equal(merged.N(), 5)
+        assert_equal(cfd[1]['a'], 2)
+
+    def test_iadd_counts(self):
+        cfd = ConditionalFreqDist([(1, 'a')])
+        cfd += {1: {'a': 2, 'b': 1}, 2: {'c': 1}}
+        assert_equal(cfd[1].N(), 4)
+        assert_equal(cfd[1].max(), 'a')
+        assert_equal(cfd[2]['c'], 1)
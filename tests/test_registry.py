@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+from nose.tools import *  # PEP8 asserts
+
+from textblob import registry
+from textblob.registry import ModelRegistry
+
+
+class TestModelRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        path = os.path.join(self.tmpdir, "model.pickle")
+        with open(path, "wb") as fp:
+            pickle.dump({"model": "data"}, fp)
+        self.registry = ModelRegistry({"model": "file:" + path,
+                                       "missing": "file:" + os.path.join(self.tmpdir, "missing.pickle")})
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_default_models(self):
+        assert_true("punkt" in registry.default_registry.models)
+        assert_true("pos_tagger" in registry.default_registry.models)
+
+    def test_get(self):
+        model = self.registry.get("model")
+        assert_equal(model, {"model": "data"})
+        assert_true(self.registry.get("model") is model)
+        assert_equal((self.registry.hits, self.registry.misses), (1, 1))
+
+    def test_preload(self):
+        assert_false(self.registry.is_loaded("model"))
+        self.registry.preload(["model"])
+        assert_true(self.registry.is_loaded("model"))
+        assert_true(self.registry.load_times["model"] >= 0)
+
+    def test_get_missing_model(self):
+        assert_raises(LookupError, self.registry.get, "missing")
+        assert_raises(KeyError, self.registry.get, "unknown")
+
+    def test_clear(self):
+        self.registry.get("model")
+        self.registry.clear()
+        assert_false(self.registry.is_loaded("model"))
+        assert_equal((self.registry.hits, self.registry.misses), (0, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -20,6 +20,14 @@ class TestPatternSentiment(unittest.TestCase):
         assert_true(self.analyzer.analyze(p1)[0] > 0)
         assert_true(self.analyzer.analyze(n1)[0] < 0)
 
+    def test_analyze_with_assessments(self):
+        texts = ["I am not very happy :( but it is really not bad!",
+                 "This is very very good!!! XD", "What a day (!)"]
+        for text in texts:
+            score = self.analyzer.analyze(text, assessments=True)
+            assert_true(len(score.assessments) > 0)
+            assert_equal(self.analyzer.analyze(text), tuple(score))
+
 
 class TestNaiveBayesAnalyzer(unittest.TestCase):
 
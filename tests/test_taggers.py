@@ -32,6 +32,29 @@ class TestPatternTagger(unittest.TestCase):
             ('Complex', 'NNP'), ('is', 'VBZ'), ('better', 'RBR'),
             ('than', 'IN'), ('complicated', 'VBN'), ('.', '.')])
 
+    def test_morphology_rules(self):
+        from textblob._text import Morphology
+        morphology = Morphology(lexicon={"walk": "VB"},
+            path="ly hassuf 2 RB x\nNN s fhassuf 1 NNS x\nNNS s fdeletesuf 1 VBZ x")
+        assert_equal(morphology.apply(["quickly", "NN"]), ["quickly", "RB"])
+        assert_equal(morphology.apply(["cats", "NN"]), ["cats", "NNS"])
+        # Rules are applied in order, each to the tag set by the previous rules
+        assert_equal(morphology.apply(["walks", "NN"]), ["walks", "VBZ"])
+        assert_equal(morphology.apply(["walks", "JJ"]), ["walks", "JJ"])
+        morphology.insert(0, "JJ", "-ful")
+        assert_equal(morphology.apply(["joyful", "NN"]), ["joyful", "JJ"])
+
+    def test_context_rules(self):
+        from textblob._text import Context
+        context = Context(path="NN VB PREVTAG TO")
+        tokens = [["to", "TO"], ["walk", "NN"], ["walk", "NN"]]
+        assert_equal(context.apply(tokens),
+            [["to", "TO"], ["walk", "VB"], ["walk", "NN"]])
+        # Rules added later are applied, and the last matching rule wins
+        context.insert(1, "*", "NNS", "curwd", "walk")
+        assert_equal(context.apply(tokens),
+            [["to", "TO"], ["walk", "NNS"], ["walk", "NNS"]])
+
 
 @attr("slow")
 @attr("no_pypy")
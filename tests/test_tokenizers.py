@@ -30,6 +30,28 @@ class TestWordTokenizer(unittest.TestCase):
         assert_equal(next(gen), "Python")
         assert_equal(next(gen), "is")
 
+    def test_span_tokenize(self):
+        spans = list(self.tokenizer.span_tokenize(self.text))
+        assert_equal([self.text[start:end] for start, end in spans],
+                     self.tokenizer.tokenize(self.text))
+        assert_equal(spans[0], (0, 6))
+        assert_equal(spans[-1], (43, 44))
+
+    def test_span_tokenize_with_quotes(self):
+        text = 'They said "it\'s fine".'
+        assert_equal(self.tokenizer.tokenize(text),
+            ['They', 'said', '``', 'it', "'s", 'fine', "''", '.'])
+        assert_equal(list(self.tokenizer.span_tokenize(text)),
+            [(0, 4), (5, 9), (10, 11), (11, 13), (13, 15), (16, 20),
+            (20, 21), (21, 22)])
+
+    def test_tokenize_contractions_and_punctuation(self):
+        text = "I cannot go -- gonna stay... Don't they'll? (\"Yes,\" 'tis; 1,000 $3.88.)"
+        assert_equal(self.tokenizer.tokenize(text),
+            ['I', 'can', 'not', 'go', '--', 'gon', 'na', 'stay', '...',
+            'Do', "n't", 'they', "'ll", '?', '(', '``', 'Yes', ',', "''",
+            "'t", 'is', ';', '1,000', '$', '3.88', '.', ')'])
+
 
 class TestSentenceTokenizer(unittest.TestCase):
 
@@ -51,6 +73,12 @@ class TestSentenceTokenizer(unittest.TestCase):
         assert_equal(tokens,
             ["OMG!", "I am soooo LOL!!!"])
 
+    def test_span_tokenize(self):
+        text = "Hello world. How do you do?! (My name's Steve.) Bye"
+        spans = list(self.tokenizer.span_tokenize(text))
+        assert_equal([text[start:end] for start, end in spans],
+            ["Hello world.", "How do you do?!", "(My name's Steve.)", "Bye"])
+
     def test_itokenize(self):
         gen = self.tokenizer.itokenize(self.text)
         assert_equal(next(gen), "Beautiful is better than ugly.")
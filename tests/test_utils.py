@@ -3,7 +3,7 @@
 from unittest import TestCase
 from nose.tools import *  # PEP8 asserts
 
-from textblob.utils import lowerstrip, strip_punc
+from textblob.utils import lowerstrip, strip_punc, LRUCache, WorkerPool
 
 class UtilsTests(TestCase):
     def setUp(self):
@@ -21,3 +21,60 @@ class UtilsTests(TestCase):
         assert_equal(lowerstrip(self.text),
                     'this. has. punctuation')
 
+
+class LRUCacheTest(TestCase):
+
+    def setUp(self):
+        self.cache = LRUCache(maxsize=2)
+
+    def test_get_and_set(self):
+        self.cache.set("a", 1)
+        assert_equal(self.cache.get("a"), 1)
+        assert_equal(self.cache.get("b"), None)
+        assert_equal(self.cache.get("b", 0), 0)
+        assert_equal((self.cache.hits, self.cache.misses), (1, 2))
+
+    def test_discards_least_recently_used(self):
+        self.cache.set("a", 1)
+        self.cache.set("b", 2)
+        self.cache.get("a")
+        self.cache.set("c", 3)
+        assert_equal(len(self.cache), 2)
+        assert_true("a" in self.cache)
+        assert_true("b" not in self.cache)
+        assert_true("c" in self.cache)
+
+    def test_clear(self):
+        self.cache.set("a", 1)
+        self.cache.get("a")
+        self.cache.clear()
+        assert_equal(len(self.cache), 0)
+        assert_equal((self.cache.hits, self.cache.misses), (0, 0))
+
+
+def _add_state(state, item):
+    return state + item
+
+
+class WorkerPoolTest(TestCase):
+
+    def test_imap(self):
+        with WorkerPool(2, 10) as pool:
+            assert_equal(list(pool.imap(_add_state, range(5))),
+                         [10, 11, 12, 13, 14])
+            assert_equal(sorted(pool.imap(_add_state, range(5), ordered=False)),
+                         [10, 11, 12, 13, 14])
+
+    def test_imap_reads_items_as_results_are_consumed(self):
+        read = []
+
+        def items():
+            for i in range(100):
+                read.append(i)
+                yield i
+
+        with WorkerPool(2, 0, window=3) as pool:
+            results = pool.imap(_add_state, items())
+            assert_equal(next(results), 0)
+            assert_equal(len(read), 4)
+            assert_equal(list(results), list(range(1, 100)))
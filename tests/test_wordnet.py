@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+import os
+import shutil
+import tempfile
+import unittest
+from nose.tools import *  # PEP8 asserts
+from nose.plugins.attrib import attr
+
+from textblob.packages import nltk
+from nltk.corpus.reader.wordnet import LemmaIndex, WordNetCorpusReader
+
+
+class TestLemmaIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_write_and_read(self):
+        path = os.path.join(self.tmpdir, "lemma_pos_offset.idx")
+        LemmaIndex.write(path, {
+            "dog": {"n": [2084071, 10114209], "v": [2005890]},
+            "caf\xe9": {"n": [2936714]},
+            "good": {"a": [1123148], "s": [1123148]},
+        })
+        index = LemmaIndex(path)
+        assert_equal(len(index), 3)
+        assert_equal(list(index), ["caf\xe9", "dog", "good"])
+        assert_equal(index["dog"], {"n": [2084071, 10114209], "v": [2005890]})
+        assert_equal(index["caf\xe9"], {"n": [2936714]})
+        assert_equal(index["good"], {"a": [1123148], "s": [1123148]})
+        assert_true("dog" in index)
+        assert_false("cat" in index)
+        assert_equal(index["cat"], {})
+
+
+class TestWordNetCorpusReader(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    @attr('slow')
+    def test_lemma_index_is_not_written_to_the_corpus(self):
+        root = nltk.data.find("corpora/wordnet")
+        corpus_files = sorted(os.listdir(root.path))
+        cache_dir = os.path.join(self.tmpdir, "cache")
+        reader = WordNetCorpusReader(root, lemma_index=cache_dir)
+        assert_true(isinstance(reader._lemma_pos_offset_map, LemmaIndex))
+        assert_equal(len(os.listdir(cache_dir)), 1)
+        assert_equal(sorted(os.listdir(root.path)), corpus_files)
+        # A second reader opens the same index
+        reader = WordNetCorpusReader(root, lemma_index=cache_dir)
+        assert_equal(len(os.listdir(cache_dir)), 1)
+        unindexed = WordNetCorpusReader(root, lemma_index=False)
+        for lemma in ("dog", "run", "good", "quickly", "not_a_lemma"):
+            assert_equal(reader.synsets(lemma), unindexed.synsets(lemma))
+
+
+if __name__ == '__main__':
+    unittest.main()
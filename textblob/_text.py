@@ -14,6 +14,7 @@ import re
 from xml.etree import cElementTree
 
 from .compat import text_type, basestring, imap, unicode, binary_type, PY2
+from .utils import LRUCache
 
 try:
     MODULE = os.path.dirname(os.path.abspath(__file__))
@@ -233,6 +234,13 @@ EMOTICONS = { # (facial expression, sentiment)-keys
     ("cry"  , -1.00): set((":'(", ":'''(", ";'("))
 }
 
+# {":-d": +1.0, ...}, the first emoticon type in EMOTICONS wins.
+EMOTICON_POLARITY = {}
+for (type, p), e in EMOTICONS.items():
+    for e in e:
+        EMOTICON_POLARITY.setdefault(e.lower(), p)
+del type, p, e
+
 RE_EMOTICONS = [r" ?".join([re.escape(each) for each in e]) for v in EMOTICONS.values() for e in v]
 RE_EMOTICONS = re.compile(r"(%s)($|\s)" % "|".join(RE_EMOTICONS))
 
@@ -252,47 +260,74 @@ replacements = {
 
 # Handle paragraph line breaks (\n\n marks end of sentence).
 EOS = "END-OF-SENTENCE"
+LINEBREAK = r"\n{2,}"
 
-def find_tokens(string, punctuation=PUNCTUATION, abbreviations=ABBREVIATIONS, replace=replacements, linebreak=r"\n{2,}"):
-    """ Returns a list of sentences. Each sentence is a space-separated string of tokens (words).
-        Handles common cases of abbreviations (e.g., etc., ...).
-        Punctuation marks are split from other words. Periods (or ?!) mark the end of a sentence.
-        Headings without an ending period are inferred by line breaks.
+# Handle quotes, which are split from words in Unicode strings.
+QUOTES = "“”‘’'\""
+
+# A single pass over the string finds paragraph line breaks (the default linebreak, where \r\n = \n),
+# quotes and runs of other non-whitespace characters.
+# This is the same as inserting " END-OF-SENTENCE " and " ' ", collapsing whitespace and splitting.
+RE_TOKEN = {
+    True: re.compile(r"(\n(?:\r?\n)+)|[%s]|[^\s%s]+" % (QUOTES, QUOTES)), # Unicode.
+   False: re.compile(r"(\n(?:\r?\n)+)|\S+")
+}
+
+def _find_tokens(string, punctuation=PUNCTUATION, abbreviations=ABBREVIATIONS, replace=replacements, linebreak=LINEBREAK):
+    """ Returns a list of sentences. Each sentence is a (tokens, offsets)-tuple,
+        where offsets is a list of (start, end)-tuples,
+        before emoticons and sarcasm marks (!) are joined (see find_tokens()).
     """
     # Handle periods separately.
     punctuation = tuple(punctuation.replace(".", ""))
+    lead = set(punctuation)
+    trail = lead | set(".")
     # Handle replacements (contractions).
-    for a, b in list(replace.items()):
-        string = re.sub(a, b, string)
-    # Handle Unicode quotes.
-    if isinstance(string, unicode):
-        string = unicode(string).replace("“", " “ ")\
-                                .replace("”", " ” ")\
-                                .replace("‘", " ‘ ")\
-                                .replace("’", " ’ ")\
-                                .replace("'", " ' ")\
-                                .replace('"', ' " ')
-    # Collapse whitespace.
-    string = re.sub("\r\n", "\n", string)
-    string = re.sub(linebreak, " %s " % EOS, string)
-    string = re.sub(r"\s+", " ", string)
-    tokens = []
-    for t in TOKEN.findall(string+" "):
-        if len(t) > 0:
+    # Replacements that insert a space before a match ("n't" => " n't") split the token at the match.
+    # Other replacements, a custom linebreak and byte strings (which become Unicode when replaced)
+    # are handled by substituting the string beforehand, so that the offsets refer to the new string.
+    paragraphs = True
+    quotes = True
+    breaks = set()
+    if isinstance(string, unicode) and linebreak == LINEBREAK and \
+      all(b == " " + a for a, b in replace.items()):
+        for a in replace:
+            if a[:1] not in QUOTES: # Quotes are split anyway.
+                breaks.update(m.start() for m in re.finditer(a, string))
+    else:
+        for a, b in list(replace.items()):
+            string = re.sub(a, b, string)
+        quotes = isinstance(string, unicode)
+        string = re.sub("\r\n", "\n", string)
+        string = re.sub(linebreak, " %s " % EOS, string)
+        paragraphs = False
+    breaks = sorted(breaks)
+    tokens, offsets = [], []
+    for x, y in zip([0] + breaks, breaks + [len(string)]):
+        for m in RE_TOKEN[quotes].finditer(string, x, y):
+            t = m.group()
+            i, j = m.span()
+            if t[0] == "\n":
+                if paragraphs:
+                    tokens.append(EOS)
+                    offsets.append((i, j))
+                continue
+            if t[0] not in lead and t[-1] not in trail or t in replace:
+                tokens.append(t)
+                offsets.append((i, j))
+                continue
             tail = []
-            while t.startswith(punctuation) and \
-              not t in replace:
+            while t and t[0] in lead and not t in replace:
                 # Split leading punctuation.
-                if t.startswith(punctuation):
-                    tokens.append(t[0]); t=t[1:]
-            while t.endswith(punctuation+(".",)) and \
-              not t in replace:
+                tokens.append(t[0]); offsets.append((i, i+1)); t=t[1:]; i+=1
+            while t and t[-1] in trail and not t in replace:
                 # Split trailing punctuation.
-                if t.endswith(punctuation):
-                    tail.append(t[-1]); t=t[:-1]
+                if t[-1] in lead:
+                    tail.append((t[-1], j-1, j)); t=t[:-1]; j-=1
                 # Split ellipsis (...) before splitting period.
                 if t.endswith("..."):
-                    tail.append("..."); t=t[:-3].rstrip(".")
+                    tail.append(("...", j-3, j)); t=t[:-3]; j-=3
+                    j-=len(t) - len(t.rstrip(".")); t=t.rstrip(".")
                 # Split period (if not an abbreviation).
                 if t.endswith("."):
                     if t in abbreviations or \
@@ -301,28 +336,68 @@ def find_tokens(string, punctuation=PUNCTUATION, abbreviations=ABBREVIATIONS, re
                       RE_ABBR3.match(t) is not None:
                         break
                     else:
-                        tail.append(t[-1]); t=t[:-1]
+                        tail.append((t[-1], j-1, j)); t=t[:-1]; j-=1
             if t != "":
-                tokens.append(t)
-            tokens.extend(reversed(tail))
-    sentences, i, j = [[]], 0, 0
+                tokens.append(t); offsets.append((i, j))
+            for t, i, j in reversed(tail):
+                tokens.append(t); offsets.append((i, j))
+    sentences, i, j = [], 0, 0
     while j < len(tokens):
         if tokens[j] in ("...", ".", "!", "?", EOS):
             # Handle citations, trailing parenthesis, repeated punctuation (!?).
             while j < len(tokens) \
                     and tokens[j] in ("'", "\"", u"”", u"’", "...", ".", "!", "?", ")", EOS):
-                if tokens[j] in ("'", "\"") and sentences[-1].count(tokens[j]) % 2 == 0:
-                    break  # Balanced quotes.
+                if tokens[j] in ("'", "\""):
+                    break  # Balanced quotes (the sentence is only added below, so none yet).
                 j += 1
-            sentences[-1].extend(t for t in tokens[i:j] if t != EOS)
-            sentences.append([])
+            s = (tokens[i:j], offsets[i:j])
+            if EOS in s[0]:
+                s = [k for k in range(i, j) if tokens[k] != EOS]
+                s = ([tokens[k] for k in s], [offsets[k] for k in s])
+            sentences.append(s)
             i = j
         j += 1
-    sentences[-1].extend(tokens[i:j])
-    sentences = (" ".join(s) for s in sentences if len(s) > 0)
-    sentences = (RE_SARCASM.sub("(!)", s) for s in sentences)
-    sentences = [RE_EMOTICONS.sub(
-        lambda m: m.group(1).replace(" ", "") + m.group(2), s) for s in sentences]
+    sentences.append((tokens[i:j], offsets[i:j]))
+    return [s for s in sentences if len(s[0]) > 0]
+
+def _join_emoticons(s):
+    """ Returns the given sentence string with the spaces removed from emoticons and (!).
+    """
+    s = RE_SARCASM.sub("(!)", s)
+    s = RE_EMOTICONS.sub(lambda m: m.group(1).replace(" ", "") + m.group(2), s)
+    return s
+
+def find_tokens(string, punctuation=PUNCTUATION, abbreviations=ABBREVIATIONS, replace=replacements, linebreak=LINEBREAK):
+    """ Returns a list of sentences. Each sentence is a space-separated string of tokens (words).
+        Handles common cases of abbreviations (e.g., etc., ...).
+        Punctuation marks are split from other words. Periods (or ?!) mark the end of a sentence.
+        Headings without an ending period are inferred by line breaks.
+    """
+    return [_join_emoticons(" ".join(s))
+        for s, offsets in _find_tokens(string, punctuation, abbreviations, replace, linebreak)]
+
+def find_token_offsets(string, punctuation=PUNCTUATION, abbreviations=ABBREVIATIONS, replace=replacements, linebreak=LINEBREAK):
+    """ Returns a list of sentences. Each sentence is a list of (token, start, end)-tuples,
+        where string[start:end] is the text of the token (e.g., "n't" in "don't").
+        The tokens are those of find_tokens(), without joining and splitting them again.
+        Emoticons and (!) written with spaces span the tokens they are joined from.
+        With replacements other than " n't"-like contractions, a custom linebreak or a byte string,
+        the offsets refer to the string after these substitutions (see find_tokens()).
+    """
+    sentences = []
+    for s, offsets in _find_tokens(string, punctuation, abbreviations, replace, linebreak):
+        w = _join_emoticons(" ".join(s)).split(" ")
+        if len(w) < len(s):
+            # Each joined token is a run of consecutive tokens.
+            a, k = [], 0
+            for t in w:
+                i, n = offsets[k][0], len(s[k]); k+=1
+                while n < len(t):
+                    n += len(s[k]); k+=1
+                a.append((t, i, offsets[k-1][1]))
+            sentences.append(a)
+        else:
+            sentences.append([(t, i, j) for t, (i, j) in zip(s, offsets)])
     return sentences
 
 #### LEXICON #######################################################################################
@@ -424,6 +499,7 @@ class Morphology(lazylist, Rules):
         cmd.update(("f" + k, v) for k, v in list(cmd.items()))
         Rules.__init__(self, lexicon, cmd)
         self._path = path
+        self._index = None
 
     @property
     def path(self):
@@ -432,27 +508,82 @@ class Morphology(lazylist, Rules):
     def load(self):
         # ["NN", "s", "fhassuf", "1", "NNS", "x"]
         list.extend(self, (x.split() for x in _read(self._path)))
+        self._index = None
 
-    def apply(self, token, previous=(None, None), next=(None, None)):
-        """ Applies lexical rules to the given token, which is a [word, tag] list.
+    def _compile(self):
+        """ Returns the rules parsed into (i, tag, cmd, x, pos)-tuples, where tag is None
+            if the rule applies to any word. The rules are indexed by command,
+            with hassuf/deletesuf and haspref/deletepref rules in a suffix and a prefix trie.
         """
-        w = token[0]
-        for r in self:
+        index = {
+                "char": [],
+             "addpref": [],
+              "addsuf": [],
+            "goodleft": {},
+           "goodright": {},
+              "suffix": {},
+              "prefix": {}
+        }
+        rule = None
+        for i, r in enumerate(list.__iter__(self)):
             if r[1] in self.cmd: # Rule = ly hassuf 2 RB x
-                f, x, pos, cmd = bool(0), r[0], r[-2], r[1].lower()
+                rule = (False, r[1].lower(), r[0], r[-2])
             if r[2] in self.cmd: # Rule = NN s fhassuf 1 NNS x
-                f, x, pos, cmd = bool(1), r[1], r[-2], r[2].lower().lstrip("f")
-            if f and token[1] != r[0]:
+                rule = (True, r[2].lower().lstrip("f"), r[1], r[-2])
+            if rule is None:
                 continue
-            if (cmd == "char"       and x in w) \
-            or (cmd == "haspref"    and w.startswith(x)) \
-            or (cmd == "hassuf"     and w.endswith(x)) \
-            or (cmd == "addpref"    and x + w in self.lexicon) \
-            or (cmd == "addsuf"     and w + x in self.lexicon) \
-            or (cmd == "deletepref" and w.startswith(x) and w[len(x):] in self.lexicon) \
-            or (cmd == "deletesuf"  and w.endswith(x) and w[:-len(x)] in self.lexicon) \
-            or (cmd == "goodleft"   and x == next[0]) \
-            or (cmd == "goodright"  and x == previous[0]):
+            # A rule with an unknown command repeats the command of the previous rule.
+            f, cmd, x, pos = rule
+            record = (i, f and r[0] or None, cmd, x, pos)
+            if cmd in ("hassuf", "deletesuf", "haspref", "deletepref"):
+                node = index[cmd.endswith("suf") and "suffix" or "prefix"]
+                for ch in cmd.endswith("suf") and reversed(x) or x:
+                    node = node.setdefault(ch, {})
+                node.setdefault(None, []).append(record)
+            elif cmd in ("goodleft", "goodright"):
+                index[cmd].setdefault(x, []).append(record)
+            elif cmd in index:
+                index[cmd].append(record)
+        return index
+
+    def _walk(self, trie, chars):
+        """ Yields the rules in the given trie for each prefix of the given characters.
+        """
+        node = trie
+        for ch in chars:
+            for record in node.get(None, ()):
+                yield record
+            node = node.get(ch)
+            if node is None:
+                return
+        for record in node.get(None, ()):
+            yield record
+
+    def apply(self, token, previous=(None, None), next=(None, None)):
+        """ Applies lexical rules to the given token, which is a [word, tag] list.
+        """
+        # The compiled rules are cached until the list of rules changes.
+        if self._index is None or self._index[0] != len(self):
+            self._index = (len(self), self._compile())
+        index = self._index[1]
+        w = token[0]
+        rules = []
+        for r in self._walk(index["suffix"], reversed(w)):
+            if r[2] == "hassuf" or r[2] == "deletesuf" and w[:-len(r[3])] in self.lexicon:
+                rules.append(r)
+        for r in self._walk(index["prefix"], w):
+            if r[2] == "haspref" or r[2] == "deletepref" and w[len(r[3]):] in self.lexicon:
+                rules.append(r)
+        rules.extend(r for r in index["char"] if r[3] in w)
+        rules.extend(r for r in index["addpref"] if r[3] + w in self.lexicon)
+        rules.extend(r for r in index["addsuf"] if w + r[3] in self.lexicon)
+        rules.extend(index["goodleft"].get(next[0], ()))
+        rules.extend(index["goodright"].get(previous[0], ()))
+        # Rules that match the word are applied in order,
+        # since a rule can depend on the tag assigned by a previous rule.
+        rules.sort()
+        for i, tag, cmd, x, pos in rules:
+            if tag is None or tag == token[1]:
                 token[1] = pos
         return token
 
@@ -471,6 +602,7 @@ class Morphology(lazylist, Rules):
         else:
             r = [affix, cmd.lstrip("f"), tag, "x"]
         lazylist.insert(self, i, r)
+        self._index = None
 
     def append(self, *args, **kwargs):
         self.insert(len(self)-1, *args, **kwargs)
@@ -483,6 +615,36 @@ class Morphology(lazylist, Rules):
 # Brill's algorithm generates contextual rules in the following format:
 # VBD VB PREVTAG TO => unknown word tagged VBD changes to VB if preceded by a word tagged TO.
 
+# Tests for each contextual rule command, given the list of tokens t,
+# the index i of the current token and the rule's x and y values.
+CONTEXT_COMMANDS = {
+           "prevtag": lambda t, i, x, y: x ==  t[i-1][1],
+           "nexttag": lambda t, i, x, y: x ==  t[i+1][1],
+          "prev2tag": lambda t, i, x, y: x ==  t[i-2][1],
+          "next2tag": lambda t, i, x, y: x ==  t[i+2][1],
+       "prev1or2tag": lambda t, i, x, y: x in (t[i-1][1], t[i-2][1]),
+       "next1or2tag": lambda t, i, x, y: x in (t[i+1][1], t[i+2][1]),
+    "prev1or2or3tag": lambda t, i, x, y: x in (t[i-1][1], t[i-2][1], t[i-3][1]),
+    "next1or2or3tag": lambda t, i, x, y: x in (t[i+1][1], t[i+2][1], t[i+3][1]),
+       "surroundtag": lambda t, i, x, y: x ==  t[i-1][1] and y == t[i+1][1],
+             "curwd": lambda t, i, x, y: x ==  t[i+0][0],
+            "prevwd": lambda t, i, x, y: x ==  t[i-1][0],
+            "nextwd": lambda t, i, x, y: x ==  t[i+1][0],
+        "prev1or2wd": lambda t, i, x, y: x in (t[i-1][0], t[i-2][0]),
+        "next1or2wd": lambda t, i, x, y: x in (t[i+1][0], t[i+2][0]),
+         "prevwdtag": lambda t, i, x, y: x ==  t[i-1][0] and y == t[i-1][1],
+         "nextwdtag": lambda t, i, x, y: x ==  t[i+1][0] and y == t[i+1][1],
+         "wdprevtag": lambda t, i, x, y: x ==  t[i-1][1] and y == t[i+0][0],
+         "wdnexttag": lambda t, i, x, y: x ==  t[i+0][0] and y == t[i+1][1],
+         "wdand2aft": lambda t, i, x, y: x ==  t[i+0][0] and y == t[i+2][0],
+      "wdand2tagbfr": lambda t, i, x, y: x ==  t[i-2][1] and y == t[i+0][0],
+      "wdand2tagaft": lambda t, i, x, y: x ==  t[i+0][0] and y == t[i+2][1],
+           "lbigram": lambda t, i, x, y: x ==  t[i-1][0] and y == t[i+0][0],
+           "rbigram": lambda t, i, x, y: x ==  t[i+0][0] and y == t[i+1][0],
+        "prevbigram": lambda t, i, x, y: x ==  t[i-2][1] and y == t[i-1][1],
+        "nextbigram": lambda t, i, x, y: x ==  t[i+1][1] and y == t[i+2][1],
+}
+
 class Context(lazylist, Rules):
 
     def __init__(self, lexicon={}, path=""):
@@ -518,6 +680,7 @@ class Context(lazylist, Rules):
         )
         Rules.__init__(self, lexicon, dict.fromkeys(cmd, True))
         self._path = path
+        self._index = None
 
     @property
     def path(self):
@@ -526,47 +689,46 @@ class Context(lazylist, Rules):
     def load(self):
         # ["VBD", "VB", "PREVTAG", "TO"]
         list.extend(self, (x.split() for x in _read(self._path)))
+        self._index = None
+
+    def _compile(self):
+        """ Returns a dict of tag => list of (test, x, y, tag2)-tuples, with the rules
+            for the tag (and the wildcard "*" rules) in reverse order.
+        """
+        rules = [(r[0], CONTEXT_COMMANDS.get(r[2].lower()), r[3], r[4] if len(r) > 4 else "", r[1])
+            for r in list.__iter__(self)]
+        index = dict((r[0], []) for r in rules)
+        index.setdefault("*", [])
+        for tag1, test, x, y, tag2 in rules:
+            if test is None:
+                continue # Unknown commands never match.
+            for k in (index if tag1 == "*" else (tag1,)):
+                index[k].append((test, x, y, tag2))
+        for k in index:
+            index[k].reverse()
+        return index
 
     def apply(self, tokens):
         """ Applies contextual rules to the given list of tokens,
             where each token is a [word, tag] list.
         """
+        # The compiled rules are cached until the list of rules changes.
+        if self._index is None or self._index[0] != len(self):
+            self._index = (len(self), self._compile())
+        index = self._index[1]
+        wildcard = index["*"]
         o = [("STAART", "STAART")] * 3 # Empty delimiters for look ahead/back.
         t = o + tokens + o
-        for i, token in enumerate(t):
-            for r in self:
-                if token[1] == "STAART":
-                    continue
-                if token[1] != r[0] and r[0] != "*":
-                    continue
-                cmd, x, y = r[2], r[3], r[4] if len(r) > 4 else ""
-                cmd = cmd.lower()
-                if (cmd == "prevtag"        and x ==  t[i-1][1]) \
-                or (cmd == "nexttag"        and x ==  t[i+1][1]) \
-                or (cmd == "prev2tag"       and x ==  t[i-2][1]) \
-                or (cmd == "next2tag"       and x ==  t[i+2][1]) \
-                or (cmd == "prev1or2tag"    and x in (t[i-1][1], t[i-2][1])) \
-                or (cmd == "next1or2tag"    and x in (t[i+1][1], t[i+2][1])) \
-                or (cmd == "prev1or2or3tag" and x in (t[i-1][1], t[i-2][1], t[i-3][1])) \
-                or (cmd == "next1or2or3tag" and x in (t[i+1][1], t[i+2][1], t[i+3][1])) \
-                or (cmd == "surroundtag"    and x ==  t[i-1][1] and y == t[i+1][1]) \
-                or (cmd == "curwd"          and x ==  t[i+0][0]) \
-                or (cmd == "prevwd"         and x ==  t[i-1][0]) \
-                or (cmd == "nextwd"         and x ==  t[i+1][0]) \
-                or (cmd == "prev1or2wd"     and x in (t[i-1][0], t[i-2][0])) \
-                or (cmd == "next1or2wd"     and x in (t[i+1][0], t[i+2][0])) \
-                or (cmd == "prevwdtag"      and x ==  t[i-1][0] and y == t[i-1][1]) \
-                or (cmd == "nextwdtag"      and x ==  t[i+1][0] and y == t[i+1][1]) \
-                or (cmd == "wdprevtag"      and x ==  t[i-1][1] and y == t[i+0][0]) \
-                or (cmd == "wdnexttag"      and x ==  t[i+0][0] and y == t[i+1][1]) \
-                or (cmd == "wdand2aft"      and x ==  t[i+0][0] and y == t[i+2][0]) \
-                or (cmd == "wdand2tagbfr"   and x ==  t[i-2][1] and y == t[i+0][0]) \
-                or (cmd == "wdand2tagaft"   and x ==  t[i+0][0] and y == t[i+2][1]) \
-                or (cmd == "lbigram"        and x ==  t[i-1][0] and y == t[i+0][0]) \
-                or (cmd == "rbigram"        and x ==  t[i+0][0] and y == t[i+1][0]) \
-                or (cmd == "prevbigram"     and x ==  t[i-2][1] and y == t[i-1][1]) \
-                or (cmd == "nextbigram"     and x ==  t[i+1][1] and y == t[i+2][1]):
-                    t[i] = [t[i][0], r[1]]
+        for i in range(len(o), len(t) - len(o)):
+            tag = t[i][1]
+            if tag == "STAART":
+                continue
+            # Rules never look at the current tag, only at the neighbors,
+            # so the last rule that matches decides the new tag.
+            for test, x, y, tag2 in index.get(tag, wildcard):
+                if test(t, i, x, y):
+                    t[i] = [t[i][0], tag2]
+                    break
         return t[len(o):-len(o)]
 
     def insert(self, i, tag1, tag2, cmd="prevtag", x=None, y=None):
@@ -578,6 +740,7 @@ class Context(lazylist, Rules):
         if " > " in tag1 and not x and not y:
             x, tag1 = tag1.split(" > "); cmd="nexttag"
         lazylist.insert(self, i, [tag1, tag2, cmd, x or "", y or ""])
+        self._index = None
 
     def append(self, *args, **kwargs):
         self.insert(len(self)-1, *args, **kwargs)
@@ -913,10 +1076,8 @@ class Sentiment(lazydict):
                     a.append(dict(w=[w], p=0.0, s=1.0, i=1.0, n=1, x=IRONY))
                 # EMOTICONS: {("grin", +1.0): set((":-D", ":D"))}
                 if w.isalpha() is False and len(w) <= 5 and w not in PUNCTUATION: # speedup
-                    for (type, p), e in EMOTICONS.items():
-                        if w in imap(lambda e: e.lower(), e):
-                            a.append(dict(w=[w], p=p, s=1.0, i=1.0, n=1, x=MOOD))
-                            break
+                    if w in EMOTICON_POLARITY:
+                        a.append(dict(w=[w], p=EMOTICON_POLARITY[w], s=1.0, i=1.0, n=1, x=MOOD))
         for i in range(len(a)):
             w = a[i]["w"]
             p = a[i]["p"]
@@ -927,6 +1088,71 @@ class Sentiment(lazydict):
             a[i] = (w, p * -0.5 if n < 0 else p, s, x)
         return a
 
+    def score(self, s, negation=True):
+        """ Returns a (polarity, subjectivity)-tuple for the given string or list of words,
+            equal to Sentiment(s) but without building the list of assessments.
+        """
+        if isinstance(s, basestring):
+            words = [w.lower() for w in " ".join(self.tokenizer(s)).split()]
+        else:
+            words = s
+        if dict.__len__(self) == 0:
+            self.load()
+        # The same rules as Sentiment.assessments(), where only the last assessment can change.
+        # The current assessment is kept in (p, s, i, n) and added to the total when the next one starts.
+        P, S, k = 0, 0, 0 # Sum of polarity and subjectivity, number of assessments.
+        p0 = s0 = i0 = n0 = None # Current assessment.
+        m = None # Preceding modifier (i.e., adverb or adjective).
+        n = None # Preceding negation (e.g., "not beautiful").
+        for w in words:
+            if w is None:
+                continue
+            if w in self and None in self[w]:
+                p, s, i = self[w][None]
+                if m is None:
+                    if p0 is not None:
+                        P, S, k = P + (p0 * -0.5 if n0 < 0 else p0), S + s0, k + 1
+                    p0, s0, i0, n0 = p, s, i, 1
+                if m is not None:
+                    p0 = max(-1.0, min(p * i0, +1.0))
+                    s0 = max(-1.0, min(s * i0, +1.0))
+                    i0 = i
+                if n is not None:
+                    i0 = 1.0 / i0
+                    n0 = -1
+                m = None
+                n = None
+                if any(map(self[w].__contains__, self.modifiers)):
+                    m = w
+                if negation and w in self.negations:
+                    n = w
+            else:
+                if negation and w in self.negations:
+                    n = w
+                elif n and len(w.strip("'")) > 1:
+                    n = None
+                if n is not None and m is not None and self.modifier(m):
+                    n0 = -1
+                    n = None
+                elif m and len(w) > 2:
+                    m = None
+                if w == "!" and p0 is not None:
+                    p0 = max(-1.0, min(p0 * 1.25, +1.0))
+                # Sarcasm (0.0 polarity) or emoticon.
+                if w == "(!)":
+                    e = 0.0
+                elif w.isalpha() is False and len(w) <= 5 and w not in PUNCTUATION:
+                    e = EMOTICON_POLARITY.get(w)
+                else:
+                    e = None
+                if e is not None:
+                    if p0 is not None:
+                        P, S, k = P + (p0 * -0.5 if n0 < 0 else p0), S + s0, k + 1
+                    p0, s0, i0, n0 = e, 1.0, 1.0, 1
+        if p0 is not None:
+            P, S, k = P + (p0 * -0.5 if n0 < 0 else p0), S + s0, k + 1
+        return P / float(k or 1), S / float(k or 1)
+
     def annotate(self, word, pos=None, polarity=0.0, subjectivity=0.0, intensity=1.0, label=None):
         """ Annotates the given word with polarity, subjectivity and intensity scores,
             and optionally a semantic label (e.g., MOOD for emoticons, IRONY for "(!)").
@@ -1163,6 +1389,17 @@ class Parser:
                     replace = kwargs.get(      "replace", replacements),
                   linebreak = r"\n{2,}")
 
+    def find_token_offsets(self, string, **kwargs):
+        """ Returns a list of sentences from the given string.
+            Each sentence is a list of (token, start, end)-tuples.
+        """
+        # "The cat purs." => [[("The", 0, 3), ("cat", 4, 7), ("purs", 8, 12), (".", 12, 13)]]
+        return find_token_offsets(text_type(string),
+                punctuation = kwargs.get(  "punctuation", PUNCTUATION),
+              abbreviations = kwargs.get("abbreviations", ABBREVIATIONS),
+                    replace = kwargs.get(      "replace", replacements),
+                  linebreak = r"\n{2,}")
+
     def find_tags(self, tokens, **kwargs):
         """ Annotates the given list of tokens with part-of-speech tags.
             Returns a list of tokens, where each token is now a [word, tag]-list.
@@ -1212,7 +1449,8 @@ class Parser:
         """
         # Tokenizer.
         if tokenize:
-            s = self.find_tokens(s, **kwargs)
+            # The token lists, without joining and splitting the sentences.
+            s = [[w for w, i, j in s] for s in self.find_token_offsets(s, **kwargs)]
         if isinstance(s, (list, tuple)):
             s = [isinstance(s, basestring) and s.split(" ") or s for s in s]
         if isinstance(s, basestring):
@@ -1310,8 +1548,13 @@ class Spelling(lazydict):
 
     ALPHA = "abcdefghijklmnopqrstuvwxyz"
 
-    def __init__(self, path=""):
+    def __init__(self, path="", cache=10000):
+        """ A dictionary of known words and their frequency.
+            Spelling.suggest() caches the suggestions for the given number of words.
+        """
         self._path = path
+        self._index = None
+        self._cache = LRUCache(cache)
 
     def load(self):
         for x in _read(self._path):
@@ -1366,6 +1609,59 @@ class Spelling(lazydict):
         """
         return set(w for w in words if w in self)
 
+    def _deletes(self, w):
+        """ Returns the given word and the words with one character deleted.
+        """
+        return [w] + [w[:i] + w[i+1:] for i in range(len(w))]
+
+    def _is_edit1(self, w1, w2):
+        """ Returns True if w2 is in Spelling._edit1(w1).
+        """
+        n1, n2 = len(w1), len(w2)
+        if n1 == n2 + 1: # delete
+            i = 0
+            while i < n2 and w1[i] == w2[i]:
+                i += 1
+            return w1[i+1:] == w2[i:]
+        if n1 == n2 - 1: # insert
+            i = 0
+            while i < n1 and w1[i] == w2[i]:
+                i += 1
+            return w2[i] in Spelling.ALPHA and w2[i+1:] == w1[i:]
+        if n1 == n2:
+            d = [i for i in range(n1) if w1[i] != w2[i]]
+            if len(d) == 0: # replace with the same character, or transpose the same characters
+                return any(c in Spelling.ALPHA for c in w1) \
+                    or any(w1[i] == w1[i+1] for i in range(n1 - 1))
+            if len(d) == 1: # replace
+                return w2[d[0]] in Spelling.ALPHA
+            if len(d) == 2: # transpose
+                i, j = d
+                return j == i + 1 and w1[i] == w2[j] and w1[j] == w2[i]
+        return False
+
+    def _known_edit1(self, words):
+        """ Returns the set of known words with edit distance 1 from any of the given words.
+            Each known word is indexed by its deletes (symmetric delete),
+            so that candidates are found without generating all edits.
+        """
+        if self._index is None or self._index[0] != dict.__len__(self):
+            index = {}
+            for k in dict.__iter__(self):
+                for x in self._deletes(k):
+                    index.setdefault(x, []).append(k)
+            self._index = (dict.__len__(self), index, max(imap(len, index)) if index else 0)
+        n, index, longest = self._index
+        known = set()
+        for w in words:
+            if len(w) > longest + 1:
+                continue # No known word is that long.
+            for x in self._deletes(w):
+                for k in index.get(x, ()):
+                    if k not in known and self._is_edit1(w, k):
+                        known.add(k)
+        return known
+
     def suggest(self, w):
         """ Return a list of (word, confidence) spelling corrections for the given word,
             based on the probability of known words with edit distance 1-2 from the given word.
@@ -1378,9 +1674,18 @@ class Spelling(lazydict):
             return [(w, 1.0)] # .?!
         if w.replace(".", "").isdigit():
             return [(w, 1.0)] # 1.5
+        candidates = self._cache.get(w)
+        if candidates is None:
+            candidates = self._suggest(w)
+            self._cache.set(w, candidates)
+        return list(candidates)
+
+    def _suggest(self, w):
+        # Known words with edit distance 2 are known words with edit distance 1
+        # from any word with edit distance 1 (_edit1() includes unknown words).
         candidates = self._known([w]) \
-                  or self._known(self._edit1(w)) \
-                  or self._known(self._edit2(w)) \
+                  or self._known_edit1([w]) \
+                  or self._known_edit1(self._edit1(w)) \
                   or [w]
         candidates = [(self.get(c, 0.0), c) for c in candidates]
         s = float(sum(p for p, word in candidates) or 1)
@@ -25,23 +25,26 @@ import sys
 import json
 import string as pystring
 from collections import defaultdict
+from itertools import repeat
 import logging
 
 from textblob.packages import nltk
 from textblob.decorators import cached_property, requires_nltk_corpus
-from textblob.utils import lowerstrip, PUNCTUATION_REGEX
+from textblob.utils import (lowerstrip, PUNCTUATION_REGEX, LRUCache, chunked,
+                            WorkerPool)
 from textblob.inflect import singularize as _singularize, pluralize as _pluralize
 from textblob.mixins import BlobComparableMixin, StringlikeMixin
 from textblob.compat import unicode, basestring
 from textblob.base import (BaseNPExtractor, BaseTagger, BaseTokenizer,
                        BaseSentimentAnalyzer, BaseParser)
 from textblob.np_extractors import FastNPExtractor
-from textblob.taggers import PatternTagger
+from textblob.taggers import PatternTagger, NLTKTagger
 from textblob.tokenizers import WordTokenizer, SentenceTokenizer
 from textblob.sentiments import PatternAnalyzer
 from textblob.parsers import PatternParser
 from textblob.translate import Translator
-from textblob.en import suggest
+from textblob.en import (suggest, tokenize as _pattern_tokenize,
+                         sentiment as _pattern_sentiment)
 
 # Wordnet interface
 # NOTE: textblob.wordnet is not imported so that the wordnet corpus can be lazy-loaded
@@ -53,10 +56,18 @@ class Word(unicode):
 
     '''A simple word representation. Includes methods for inflection,
     translation, and WordNet integration.
+
+    .. versionchanged:: 0.8.1
+        A Word doesn't store a second copy of its text, and its instance
+        ``__dict__`` is only created when a ``pos_tag`` is given or a cached
+        property is computed.
     '''
 
     translator = Translator()
 
+    #: The part-of-speech tag of this word, if any.
+    pos_tag = None
+
     def __new__(cls, string, pos_tag=None):
         '''Return a new instance of the class. It is necessary to override
         this method in order to handle the extra pos_tag argument in the
@@ -65,14 +76,21 @@ class Word(unicode):
         return super(Word, cls).__new__(cls, string)
 
     def __init__(self, string, pos_tag=None):
-        self.string = string
-        self.pos_tag = pos_tag
+        # Strings can't have non-empty __slots__, so pos_tag is only set on
+        # the instance when given
+        if pos_tag is not None:
+            self.pos_tag = pos_tag
+
+    @property
+    def string(self):
+        '''The word as a plain string.'''
+        return self[:]
 
     def __repr__(self):
-        return repr(self.string)
+        return repr(self[:])
 
     def __str__(self):
-        return self.string
+        return self[:]
 
     def singularize(self):
         '''Return the singular version of the word as a string.'''
@@ -137,8 +155,7 @@ class Word(unicode):
         '''
         if pos is None:
             pos = _wordnet.NOUN
-        lemmatizer = nltk.stem.WordNetLemmatizer()
-        return lemmatizer.lemmatize(self.string, pos)
+        return _lemmatize(self.string, pos)
 
     @cached_property
     def synsets(self):
@@ -185,23 +202,42 @@ class Word(unicode):
 
 class WordList(list):
 
-    '''A list-like collection of words.'''
+    '''A list-like collection of words.
+
+    :param collection: An iterable of strings.
+    :param plain: (optional) If ``True``, the words are stored as plain
+        strings instead of :class:`Word <Word>` objects. This uses less memory
+        when the words are only counted or compared, e.g. in bulk pipelines.
 
-    def __init__(self, collection):
+    .. versionchanged:: 0.8.1
+        The words are only stored once, in the list itself. Added the
+        ``plain`` parameter.
+    '''
+
+    #: Whether the words are stored as plain strings.
+    plain = False
+
+    def __init__(self, collection, plain=False):
         '''Initialize a WordList. Takes a collection of strings as
         its only argument.
         '''
-        self._collection = [Word(w) for w in collection]
-        super(WordList, self).__init__(self._collection)
+        if plain:
+            self.plain = True
+            super(WordList, self).__init__(
+                w if type(w) is unicode else unicode(w) for w in collection)
+        else:
+            # Words are immutable, so they are shared rather than copied
+            super(WordList, self).__init__(
+                w if type(w) is Word else Word(w) for w in collection)
 
     def __str__(self):
-        return str(self._collection)
+        return list.__repr__(self)
 
     def __repr__(self):
         '''Returns a string representation for debugging.'''
         class_name = self.__class__.__name__
         # String representation of words
-        strings = [unicode(w) for w in self._collection]
+        strings = [unicode(w) for w in self]
         if len(self) > 60:
             return '{cls}({beginning}...{end})'.format(cls=class_name,
                                                 beginning=strings[:3],
@@ -212,16 +248,33 @@ class WordList(list):
     def __getitem__(self, key):
         '''Returns a string at the given index.'''
         if isinstance(key, slice):
-            return self.__class__(self._collection[key])
+            return self._new(list.__getitem__(self, key))
         else:
-            return self._collection[key]
+            return list.__getitem__(self, key)
 
     def __getslice__(self, i, j):
         # This is included for Python 2.* compatibility
-        return self.__class__(self._collection[i:j])
-
-    def __iter__(self):
-        return iter(self._collection)
+        return self._new(list.__getslice__(self, i, j))
+
+    def _new(self, collection):
+        '''Return a new WordList of the same class and mode as this one.'''
+        if self.plain:
+            return self.__class__(collection, plain=True)
+        return self.__class__(collection)
+
+    def _words(self):
+        '''Iterate over the words of this list as Word objects.'''
+        if self.plain:
+            return (Word(w) for w in self)
+        return iter(self)
+
+    def _wrap(self, obj):
+        '''Convert a string to the type of the words in this list.'''
+        if not isinstance(obj, basestring):
+            return obj
+        if self.plain:
+            return unicode(obj)
+        return obj if type(obj) is Word else Word(obj)
 
     def count(self, strg, case_sensitive=False, *args, **kwargs):
         """Get the count of a word or phrase `s` within this WordList.
@@ -232,44 +285,124 @@ class WordList(list):
         if not case_sensitive:
             return [word.lower() for word in self].count(strg.lower(), *args,
                     **kwargs)
-        return self._collection.count(strg, *args, **kwargs)
+        return list.count(self, strg, *args, **kwargs)
 
     def append(self, obj):
         '''Append an object to end. If the object is a string, appends a
         ``Word`` object.
         '''
-        if isinstance(obj, basestring):
-            return self._collection.append(Word(obj))
-        else:
-            return self._collection.append(obj)
+        return list.append(self, self._wrap(obj))
 
     def extend(self, iterable):
         '''Extend WordList by appending alements from ``iterable``. If an element
         is a string, appends a ``Word`` object.
         '''
-        [self._collection.append(Word(e) if isinstance(e, basestring) else e)
-            for e in iterable]
+        list.extend(self, (self._wrap(e) for e in iterable))
         return self
 
     def upper(self):
         '''Return a new WordList with each word upper-cased.'''
-        return self.__class__([word.upper() for word in self])
+        return self._new([word.upper() for word in self])
 
     def lower(self):
         '''Return a new WordList with each word lower-cased.'''
-        return self.__class__([word.lower() for word in self])
+        return self._new([word.lower() for word in self])
 
     def singularize(self):
         '''Return the single version of each word in this WordList.'''
-        return self.__class__([word.singularize() for word in self])
+        return self._new([word.singularize() for word in self._words()])
 
     def pluralize(self):
         '''Return the plural version of each word in this WordList.'''
-        return self.__class__([word.pluralize() for word in self])
+        return self._new([word.pluralize() for word in self._words()])
+
+    def lemmatize(self, pos_tags=None):
+        '''Return the lemma of each word in this WordList.
+
+        :param pos_tags: (optional) A part-of-speech tag for each word, either
+            a Penn Treebank tag (e.g. from :attr:`TextBlob.tags
+            <BaseBlob.tags>`) or a WordNet part of speech. If ``None``, all
+            words are lemmatized as nouns.
+
+        .. versionchanged:: 0.8.1
+            Added the ``pos_tags`` parameter.
+        '''
+        return self._new(lemmatize_many(self, pos_tags))
 
-    def lemmatize(self):
-        '''Return the lemma of each word in this WordList.'''
-        return self.__class__([word.lemmatize() for word in self])
+
+# Lemmas of (word, WordNet part of speech) pairs, shared by all words
+_lemma_cache = LRUCache(100000)
+_lemmatizer = nltk.stem.WordNetLemmatizer()
+
+
+def _lemmatize(word, pos):
+    '''Return the lemma of ``word`` for the WordNet part of speech ``pos``,
+    using the shared cache.
+    '''
+    key = (word, pos)
+    lemma = _lemma_cache.get(key)
+    if lemma is None:
+        word = unicode(word)
+        lemma = unicode(_lemmatizer.lemmatize(word, pos))
+        _lemma_cache.set((word, pos), lemma)
+    return lemma
+
+
+def _wordnet_pos(tag):
+    '''Return the WordNet part of speech for a Penn Treebank or WordNet
+    tag. Defaults to noun.
+    '''
+    if tag in WORDNET_POS:
+        return tag
+    if tag:
+        return PENN_TO_WORDNET_POS.get(tag[0], _wordnet.NOUN)
+    return _wordnet.NOUN
+
+
+# WordNet parts of speech, and the first letter of the corresponding Penn
+# Treebank tags
+WORDNET_POS = ("n", "v", "a", "r", "s")
+PENN_TO_WORDNET_POS = {"N": "n", "V": "v", "J": "a", "R": "r"}
+
+
+@requires_nltk_corpus
+def lemmatize_many(words, pos_tags=None):
+    '''Return a list with the lemma of each of ``words``, as strings. Each
+    distinct word and part of speech is only lemmatized once, and lemmas are
+    kept in a bounded cache shared by all words.
+
+    Usage:
+    ::
+
+        >>> blob = TextBlob("The geese were flying south.")
+        >>> tags = blob.tags
+        >>> lemmatize_many([w for w, _ in tags], [t for _, t in tags])
+        ['The', 'goose', 'be', 'fly', 'south']
+
+    :param words: An iterable of strings.
+    :param pos_tags: (optional) An iterable with a part-of-speech tag for each
+        word, either a Penn Treebank tag or a WordNet part of speech. If
+        ``None``, all words are lemmatized as nouns.
+    :raises: ValueError if ``pos_tags`` doesn't have one tag for each word.
+
+    .. versionadded:: 0.8.1
+    '''
+    lemmas = {}
+    result = []
+    missing = object()
+    tags = repeat(None) if pos_tags is None else iter(pos_tags)
+    for word in words:
+        tag = next(tags, missing)
+        if tag is missing:
+            raise ValueError("There are fewer part-of-speech tags than words.")
+        key = (word, _wordnet_pos(tag))
+        lemma = lemmas.get(key)
+        if lemma is None:
+            lemma = lemmas[key] = _lemmatize(*key)
+        result.append(lemma)
+    if pos_tags is not None and next(tags, missing) is not missing:
+        raise ValueError("There are more part-of-speech tags than words.")
+    return result
 
 
 def _validated_param(obj, name, base_class, default, base_class_name=None):
@@ -325,9 +458,15 @@ class BaseBlob(StringlikeMixin, BlobComparableMixin):
     :param parser: A parser. If ``None``, defaults to
         :class:`PatternParser <textblob.en.parsers.PatternParser>`.
     :param classifier: A classifier.
+    :param plain_words: (optional) If ``True``, ``words``, ``tokens``,
+        ``noun_phrases``, ``ngrams()`` and ``tags`` contain plain strings
+        instead of :class:`Word <Word>` objects, which uses less memory.
 
     .. versionchanged:: 0.6.0
         ``clean_html`` parameter deprecated, as it was in NLTK.
+
+    .. versionchanged:: 0.8.1
+        Added the ``plain_words`` parameter.
     '''
 
     np_extractor = FastNPExtractor()
@@ -336,10 +475,12 @@ class BaseBlob(StringlikeMixin, BlobComparableMixin):
     translator = Translator()
     analyzer = PatternAnalyzer()
     parser = PatternParser()
+    plain_words = False
 
     def __init__(self, text, tokenizer=None,
                 pos_tagger=None, np_extractor=None, analyzer=None,
-                parser=None, classifier=None, clean_html=False):
+                parser=None, classifier=None, clean_html=False,
+                plain_words=False):
         if not isinstance(text, basestring):
             raise TypeError('The `text` argument passed to `__init__(text)` '
                             'must be a string, not {0}'.format(type(text)))
@@ -348,9 +489,25 @@ class BaseBlob(StringlikeMixin, BlobComparableMixin):
                                     "To remove HTML markup, use BeautifulSoup's "
                                     "get_text() function")
         self.raw = self.string = text
-        self.stripped = lowerstrip(self.raw, all=True)
         _initialize_models(self, tokenizer, pos_tagger, np_extractor, analyzer,
                            parser, classifier)
+        self.plain_words = plain_words
+
+    def _wordlist(self, collection):
+        '''Return a WordList of ``collection`` with this blob's
+        ``plain_words`` setting.
+        '''
+        return WordList(collection, plain=self.plain_words)
+
+    @cached_property
+    def stripped(self):
+        '''The text in lowercase, without punctuation and surrounding
+        whitespace.
+
+        .. versionchanged:: 0.8.1
+            Computed when it is first accessed.
+        '''
+        return lowerstrip(self.raw, all=True)
 
     @cached_property
     def words(self):
@@ -358,14 +515,16 @@ class BaseBlob(StringlikeMixin, BlobComparableMixin):
         If you want to include punctuation characters, access the ``tokens``
         property.
         '''
-        return WordList(WordTokenizer().itokenize(self.raw, include_punc=False))
+        return self._wordlist(WordTokenizer().itokenize(self.raw, include_punc=False))
 
     @cached_property
     def tokens(self):
         '''Return a list of tokens, using this blob's tokenizer object
         (defaults to :class:`WordTokenizer <textblob.tokenizers.WordTokenizer>`).
         '''
-        return WordList(self.tokenizer.tokenize(self.raw))
+        if type(self.tokenizer) is WordTokenizer:
+            return self._wordlist(self._word_tokens)
+        return self._wordlist(self.tokenizer.tokenize(self.raw))
 
     def tokenize(self, tokenizer=None):
         '''Return a list of tokens, using ``tokenizer``.
@@ -374,7 +533,7 @@ class BaseBlob(StringlikeMixin, BlobComparableMixin):
             this blob's default tokenizer.
         '''
         t = tokenizer if tokenizer is not None else self.tokenizer
-        return WordList(t.tokenize(self.raw))
+        return self._wordlist(t.tokenize(self.raw))
 
     def parse(self, parser=None):
         '''Parse the text.
@@ -393,6 +552,28 @@ class BaseBlob(StringlikeMixin, BlobComparableMixin):
             raise NameError("This blob has no classifier. Train one first!")
         return self.classifier.classify(self.raw)
 
+    # The properties below share the tokens and the pattern sentiment score
+    # of the blob, so that each is computed at most once.
+
+    @cached_property
+    def _word_tokens(self):
+        '''Word tokens of the text (``nltk.word_tokenize``), shared by the
+        default tokenizer, NLTKTagger and FastNPExtractor.
+        '''
+        return nltk.tokenize.word_tokenize(self.raw)
+
+    @cached_property
+    def _pattern_sentences(self):
+        '''Sentences of space-separated tokens (pattern's tokenizer), shared
+        by PatternTagger and the pattern sentiment analyzer.
+        '''
+        return _pattern_tokenize(self.raw)
+
+    @cached_property
+    def _pattern_score(self):
+        '''The pattern (polarity, subjectivity) tuple.'''
+        return _score(self._pattern_sentences)
+
     @cached_property
     def sentiment(self):
         '''Return a tuple of form (polarity, subjectivity ) where polarity
@@ -402,6 +583,8 @@ class BaseBlob(StringlikeMixin, BlobComparableMixin):
 
         :rtype: tuple
         '''
+        if type(self.analyzer) is PatternAnalyzer:
+            return self._pattern_score
         return self.analyzer.analyze(self.raw)
 
     @cached_property
@@ -410,7 +593,7 @@ class BaseBlob(StringlikeMixin, BlobComparableMixin):
 
         :rtype: float
         '''
-        return PatternAnalyzer().analyze(self.raw)[0]
+        return self._pattern_score[0]
 
     @cached_property
     def subjectivity(self):
@@ -419,14 +602,17 @@ class BaseBlob(StringlikeMixin, BlobComparableMixin):
 
         :rtype: float
         '''
-        return PatternAnalyzer().analyze(self.raw)[1]
+        return self._pattern_score[1]
 
     @cached_property
     def noun_phrases(self):
         '''Returns a list of noun phrases for this blob.'''
-        return WordList([phrase.strip().lower()
-                        for phrase in self.np_extractor.extract(self.raw)
-                        if len(phrase) > 1])
+        if type(self.np_extractor) is FastNPExtractor:
+            phrases = self.np_extractor.extract(self._word_tokens, tokenize=False)
+        else:
+            phrases = self.np_extractor.extract(self.raw)
+        return self._wordlist([phrase.strip().lower() for phrase in phrases
+                              if len(phrase) > 1])
 
     @cached_property
     def pos_tags(self):
@@ -440,12 +626,32 @@ class BaseBlob(StringlikeMixin, BlobComparableMixin):
 
         :rtype: list of tuples
         '''
+        if type(self.pos_tagger) is PatternTagger:
+            tagged = _pattern_tag(self.pos_tagger, self._pattern_sentences)
+        elif type(self.pos_tagger) is NLTKTagger:
+            tagged = self.pos_tagger.tag(self._word_tokens, tokenize=False)
+        else:
+            tagged = self.pos_tagger.tag(self.raw)
+        if self.plain_words:
+            return [(unicode(word), unicode(t)) for word, t in tagged
+                    if not PUNCTUATION_REGEX.match(unicode(t))]
         return [(Word(word, pos_tag=t), unicode(t))
-                for word, t in self.pos_tagger.tag(self.raw)
+                for word, t in tagged
                 if not PUNCTUATION_REGEX.match(unicode(t))]
 
     tags = pos_tags
 
+    @cached_property
+    def lemmas(self):
+        '''Return a list with the lemma of each word in :attr:`tags`, using
+        its part-of-speech tag.
+
+        .. versionadded:: 0.8.1
+        '''
+        tags = self.tags
+        return self._wordlist(lemmatize_many([word for word, _ in tags],
+                                             [tag for _, tag in tags]))
+
     @cached_property
     def word_counts(self):
         '''Dictionary of word frequencies in this text.
@@ -471,9 +677,9 @@ class BaseBlob(StringlikeMixin, BlobComparableMixin):
         '''
         if n <= 0:
             return []
-        grams = [WordList(self.words[i:i+n])
-                            for i in range(len(self.words) - n + 1)]
-        return grams
+        # Slices of the words share their Word objects
+        words = self.words
+        return [words[i:i+n] for i in range(len(words) - n + 1)]
 
     def translate(self, from_lang=None, to="en"):
         '''Translate the blob to another language.
@@ -577,7 +783,7 @@ class BaseBlob(StringlikeMixin, BlobComparableMixin):
         """Behaves like the built-in str.split() except returns a
         WordList.
         """
-        return WordList(self._strkey().split(sep, maxsplit))
+        return self._wordlist(self._strkey().split(sep, maxsplit))
 
 
 class TextBlob(BaseBlob):
@@ -613,7 +819,7 @@ class TextBlob(BaseBlob):
         words = []
         for sent in self.sentences:
             words.extend(WordTokenizer().tokenize(sent.raw, include_punc=False))
-        return WordList(words)
+        return self._wordlist(words)
 
     @property
     def raw_sentences(self):
@@ -643,37 +849,60 @@ class TextBlob(BaseBlob):
         '''
         return self.to_json()
 
+    def iter_sentences(self):
+        '''Return a generator of :class:`Sentence <Sentence>` objects. Unlike
+        :attr:`sentences`, the blob is split into sentences as the generator is
+        consumed, and the sentences are not kept in memory, so that a long text
+        can be processed one sentence at a time.
+
+        .. versionadded:: 0.8.1
+        '''
+        models = _Models(self)
+        for start, end in SentenceTokenizer().span_tokenize(self.raw):
+            yield Sentence._from_offsets(self.raw, start, end, models)
+
     def _create_sentence_objects(self):
-        '''Returns a list of Sentence objects given
-        a list of sentence strings. Attempts to handle sentences that
-        have more than one punctuation mark at the end of the sentence.
-        Examples: "An ellipses is no problem..." or "This is awesome!!!"
-        '''
-        sent_tokenizer = SentenceTokenizer()
-        sentence_objects = []
-        sentences = sent_tokenizer.itokenize(self.raw)
-        char_index = 0  # Keeps track of character index within the blob
-        for sent in sentences:
-            # Compute the start and end indices of the sentence
-            # within the blob
-            try:
-                start_index = self.raw.index(sent, char_index)
-                char_index += len(sent)
-                end_index = start_index + len(sent)
-            except ValueError:
-                logger.warn("Detected sentence with multiple punctuation marks "
-                            "at the end. This may make the start and end indices "
-                            "inaccurate.")
-                start_index = None
-                end_index = None
-                char_index = 0
-            # Sentences share the same models as their parent blob
-            s = Sentence(sent, start_index=start_index, end_index=end_index,
-                tokenizer=self.tokenizer, np_extractor=self.np_extractor,
-                pos_tagger=self.pos_tagger, analyzer=self.analyzer,
-                parser=self.parser, classifier=self.classifier)
-            sentence_objects.append(s)
-        return sentence_objects
+        '''Returns a list of Sentence objects. The start and end indices of
+        each sentence are the offsets found by the sentence tokenizer, so
+        sentences with more than one punctuation mark at the end (e.g.
+        "An ellipses is no problem..." or "This is awesome!!!") and repeated
+        sentences get the correct indices.
+        '''
+        return list(self.iter_sentences())
+
+
+# The models that a blob shares with its sentences
+MODEL_NAMES = ("tokenizer", "np_extractor", "pos_tagger", "analyzer", "parser",
+               "classifier")
+
+
+class _Models(object):
+
+    '''The models of a blob or Blobber, shared by the sentences created from
+    it. Sentences keep a reference to this object rather than to their blob,
+    so that a blob and its sentences don't reference each other.
+    '''
+
+    def __init__(self, obj):
+        for name in MODEL_NAMES:
+            setattr(self, name, getattr(obj, name))
+        self.plain_words = obj.plain_words
+
+
+class _SharedModel(object):
+
+    '''A model attribute of a Sentence, read from the models that it shares
+    with its blob unless it was set on the sentence itself.
+    '''
+
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, obj, cls):
+        models = getattr(obj, "_models", None)
+        if models is None:
+            return getattr(BaseBlob, self.name)
+        return getattr(models, self.name)
 
 
 class Sentence(BaseBlob):
@@ -686,12 +915,84 @@ class Sentence(BaseBlob):
     :param end_index: An int, the index where this sentence ends in
                         a TextBlob. If not given, defaults to the
                         length of the sentence - 1.
+
+    .. versionchanged:: 0.8.1
+        The sentences of a TextBlob are views of the blob's text: they store
+        their offsets and share the blob's models, and ``stripped`` is
+        computed when it is first accessed.
     '''
 
+    __slots__ = ("_text", "_i", "_j", "_models", "start_index", "end_index")
+
+    tokenizer = _SharedModel("tokenizer")
+    np_extractor = _SharedModel("np_extractor")
+    pos_tagger = _SharedModel("pos_tagger")
+    analyzer = _SharedModel("analyzer")
+    parser = _SharedModel("parser")
+    classifier = _SharedModel("classifier")
+    plain_words = _SharedModel("plain_words")
+
     def __init__(self, sentence, start_index=0, end_index=None, *args, **kwargs):
+        self._models = None
         super(Sentence, self).__init__(sentence, *args, **kwargs)
-        self.start = self.start_index = start_index
-        self.end = self.end_index = end_index or len(sentence) - 1
+        self.start_index = start_index
+        self.end_index = end_index or len(sentence) - 1
+
+    @classmethod
+    def _from_offsets(cls, text, start, end, models, offset=0):
+        '''Return the sentence ``text[start - offset:end - offset]``, which
+        begins at index ``start`` of its blob, without copying it. The
+        sentence shares ``models`` (a :class:`_Models`), which are not
+        validated again.
+        '''
+        sentence = cls.__new__(cls)
+        sentence._text = text
+        sentence._i, sentence._j = start - offset, end - offset
+        sentence._models = models
+        sentence.start_index, sentence.end_index = start, end
+        return sentence
+
+    @property
+    def raw(self):
+        '''The raw sentence.'''
+        if self._i is None:
+            return self._text
+        return self._text[self._i:self._j]
+
+    @raw.setter
+    def raw(self, value):
+        self._text = value
+        self._i = self._j = None
+
+    string = raw
+
+    @property
+    def start(self):
+        '''Alias of ``start_index``.'''
+        return self.start_index
+
+    @start.setter
+    def start(self, value):
+        self.start_index = value
+
+    @property
+    def end(self):
+        '''Alias of ``end_index``.'''
+        return self.end_index
+
+    @end.setter
+    def end(self, value):
+        self.end_index = value
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        for name in self.__slots__:
+            state[name] = getattr(self, name)
+        return state
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
 
     @property
     def dict(self):
@@ -734,8 +1035,15 @@ class Blobber(object):
     :param parser: A parser. If ``None``, defaults to
         :class:`PatternParser <textblob.en.parsers.PatternParser>`.
     :param classifier: A classifier.
+    :param workers: (optional) Number of worker processes used by
+        :meth:`pipe <Blobber.pipe>`. Defaults to 1 (no worker processes).
+    :param plain_words: (optional) If ``True``, the blobs store their words
+        as plain strings. See :class:`BaseBlob <BaseBlob>`.
 
     .. versionadded:: 0.4.0
+
+    .. versionchanged:: 0.8.1
+        Added the ``workers`` and ``plain_words`` parameters.
     '''
 
     np_extractor = FastNPExtractor()
@@ -745,9 +1053,12 @@ class Blobber(object):
     parser = PatternParser()
 
     def __init__(self, tokenizer=None, pos_tagger=None, np_extractor=None,
-                analyzer=None, parser=None, classifier=None):
+                analyzer=None, parser=None, classifier=None, workers=1,
+                plain_words=False):
         _initialize_models(self, tokenizer, pos_tagger, np_extractor, analyzer,
                             parser, classifier)
+        self.workers = workers
+        self.plain_words = plain_words
 
     def __call__(self, text):
         '''Return a new TextBlob object with this Blobber's ``np_extractor``,
@@ -758,7 +1069,148 @@ class Blobber(object):
         return TextBlob(text, tokenizer=self.tokenizer, pos_tagger=self.pos_tagger,
                         np_extractor=self.np_extractor, analyzer=self.analyzer,
                         parser=self.parser,
-                        classifier=self.classifier)
+                        classifier=self.classifier,
+                        plain_words=self.plain_words)
+
+    def pipe(self, texts, batch_size=1000,
+             fields=("tags", "noun_phrases", "sentiment"), n_jobs=None,
+             pool=None):
+        '''Process a stream of texts with this Blobber's models. Returns a
+        generator that yields one tuple per text, with one result for each of
+        ``fields`` in the same order. Use this instead of creating a
+        :class:`TextBlob <TextBlob>` for each text when processing large
+        corpora.
+
+        Results are plain Python objects: tags are ``(word, tag)`` tuples of
+        strings, noun phrases are strings. Each text is tokenized only once;
+        the tokens are shared by the default pattern tagger and sentiment
+        analyzer.
+
+        If ``n_jobs`` is greater than 1, batches are processed by a pool of
+        worker processes. Each worker loads the lexicons and trains the
+        models once when it starts. Batches are read from ``texts`` only as
+        fast as the workers process them, and results are still yielded in
+        the same order as ``texts``. To process several streams without
+        starting new workers each time, pass a pool created with
+        :meth:`worker_pool`.
+
+        Usage:
+        ::
+
+            >>> tb = Blobber()
+            >>> for tags, sentiment in tb.pipe(texts, fields=("tags", "sentiment")):
+            ...     print(tags, sentiment)
+
+        :param texts: An iterable of strings.
+        :param batch_size: Number of texts to read from ``texts`` at a time.
+        :param fields: The results to compute for each text. Any of
+            ``"tags"``, ``"noun_phrases"``, ``"sentiment"``, ``"polarity"``
+            and ``"subjectivity"``.
+        :param n_jobs: (optional) Number of worker processes. If ``None``,
+            defaults to this Blobber's ``workers``.
+        :param pool: (optional) A pool created with this Blobber's
+            :meth:`worker_pool`, which is used instead of starting new worker
+            processes and is left open.
+
+        .. versionadded:: 0.8.1
+        '''
+        fields = tuple(fields)
+        for field in fields:
+            if field not in PIPE_FIELDS:
+                raise ValueError("'{0}' is not a valid field. Choose from "
+                                 "{1}".format(field, ", ".join(PIPE_FIELDS)))
+        n_jobs = self.workers if n_jobs is None else n_jobs
+        batches = chunked(texts, batch_size)
+        if pool is None and n_jobs <= 1:
+            for batch in batches:
+                for text in batch:
+                    yield _analyze(self, text, fields)
+            return
+        own_pool = pool is None
+        if own_pool:
+            pool = self.worker_pool(n_jobs, fields)
+        try:
+            # Each task sent to a worker is a whole batch, so that pickling
+            # overhead is paid once per batch rather than once per text
+            tasks = ((batch, fields) for batch in batches)
+            for results in pool.imap(_analyze_batch, tasks):
+                for result in results:
+                    yield result
+        finally:
+            if own_pool:
+                pool.close()
+
+    def worker_pool(self, n_jobs=None,
+                    fields=("tags", "noun_phrases", "sentiment")):
+        '''Return a :class:`WorkerPool <textblob.utils.WorkerPool>` of
+        processes with this Blobber's models, which can be passed to
+        :meth:`pipe` so that several calls share the same workers. Use it
+        as a context manager to terminate the workers when done.
+
+        Usage:
+        ::
+
+            >>> tb = Blobber()
+            >>> with tb.worker_pool(4) as pool:
+            ...     for path in paths:
+            ...         with io.open(path, encoding="utf-8") as f:
+            ...             results = list(tb.pipe(f, pool=pool))
+
+        :param n_jobs: (optional) Number of worker processes. If ``None``,
+            defaults to this Blobber's ``workers``.
+        :param fields: The fields whose models each worker loads when it
+            starts. Other fields can still be computed.
+
+        .. versionadded:: 0.8.1
+        '''
+        n_jobs = self.workers if n_jobs is None else n_jobs
+        return WorkerPool(n_jobs, (self, tuple(fields)), _warm_up)
+
+    def stream(self, file_like, chunk_size=65536):
+        '''Return a generator of :class:`Sentence <Sentence>` objects for the
+        text read from ``file_like``. The text is read ``chunk_size``
+        characters at a time and split into sentences as it is read, so that
+        files of any size can be processed with bounded memory. The sentences
+        have this Blobber's models, and their ``start`` and ``end`` indices are
+        offsets from the beginning of the file.
+
+        Usage:
+        ::
+
+            >>> tb = Blobber()
+            >>> with io.open("transcript.txt", encoding="utf-8") as f:
+            ...     for sentence in tb.stream(f):
+            ...         print(sentence.start, sentence.polarity)
+
+        :param file_like: A file-like object with a ``read(size)`` method,
+            e.g. a file opened in text mode.
+        :param chunk_size: Number of characters to read at a time.
+
+        .. versionadded:: 0.8.1
+        '''
+        tokenizer = SentenceTokenizer()
+        models = _Models(self)
+        offset, size = 0, chunk_size
+        text = file_like.read(size)
+        while text:
+            more = file_like.read(size)
+            if not more:
+                for start, end in tokenizer.span_tokenize(text):
+                    yield _stream_sentence(text, start, end, offset, models)
+                return
+            spans = list(tokenizer.span_tokenize(text))
+            # The last two sentences may still change with the text that
+            # follows, so they are split again with the next chunk
+            for start, end in spans[:-2]:
+                yield _stream_sentence(text, start, end, offset, models)
+            if len(spans) > 2:
+                cut = spans[-2][0]
+                text, offset, size = text[cut:], offset + cut, chunk_size
+            else:
+                # Read larger chunks while a sentence doesn't end, so that
+                # the text read so far is split a bounded number of times
+                size *= 2
+            text += more
 
     def __repr__(self):
         classifier_name = self.classifier.__class__.__name__ + "()" if self.classifier else "None"
@@ -772,3 +1224,92 @@ class Blobber(object):
                             classifier_name)
 
     __str__ = __repr__
+
+
+# Fields that can be computed by Blobber.pipe
+PIPE_FIELDS = ("tags", "noun_phrases", "sentiment", "polarity", "subjectivity")
+
+
+def _stream_sentence(text, start, end, offset, models):
+    '''Return the sentence ``text[start:end]`` read by Blobber.stream, where
+    ``text`` begins at index ``offset`` of the stream. The sentence is copied
+    so that it doesn't keep the rest of the chunk in memory.
+    '''
+    return Sentence._from_offsets(text[start:end], offset + start, offset + end,
+                                  models, offset=offset + start)
+
+
+def _warm_up(state):
+    '''Initialize a Blobber.pipe worker process, whose state is the models
+    and the fields to warm up. Analyzing a short text loads the lexicons and
+    trains the models once, before the worker receives its first batch.
+    '''
+    models, fields = state
+    try:
+        _analyze(models, "Hello world.", fields)
+    except Exception:
+        # A failing initializer makes the pool restart workers forever.
+        # The error is raised in the parent when the first batch is analyzed.
+        pass
+
+
+def _analyze_batch(state, task):
+    '''Analyze a batch of texts in a Blobber.pipe worker process. The task
+    is the batch and the fields to compute.
+    '''
+    models = state[0]
+    texts, fields = task
+    return [_analyze(models, text, fields) for text in texts]
+
+
+def _score(sentences):
+    '''Return the pattern (polarity, subjectivity) tuple for a list of
+    sentences tokenized with the pattern tokenizer.
+    '''
+    return _pattern_sentiment.score([w.lower() for w in " ".join(sentences).split()])
+
+
+def _pattern_tag(tagger, sentences):
+    '''Tag a list of sentences tokenized with the pattern tokenizer.'''
+    return tagger.tag("\n".join(sentences), tokenize=False) if sentences else []
+
+
+def _analyze(models, text, fields):
+    '''Return a tuple with the requested ``fields`` for ``text``, computed
+    with the models of ``models`` (a Blobber or blob).
+
+    When the tagger or analyzer is the default pattern implementation, the
+    text is tokenized once with the pattern tokenizer and the tokens are
+    reused by both.
+    '''
+    pattern_tagger = type(models.pos_tagger) is PatternTagger
+    pattern_analyzer = type(models.analyzer) is PatternAnalyzer
+    # Like BaseBlob, polarity and subjectivity always use the pattern analyzer
+    needs_score = ("polarity" in fields or "subjectivity" in fields or
+                   (pattern_analyzer and "sentiment" in fields))
+    sentences = None
+    if needs_score or (pattern_tagger and "tags" in fields):
+        # ["The cat purs ."]
+        sentences = _pattern_tokenize(text)
+    score = _score(sentences) if needs_score else None
+    results = []
+    for field in fields:
+        if field == "tags":
+            if pattern_tagger:
+                tagged = _pattern_tag(models.pos_tagger, sentences)
+            else:
+                tagged = models.pos_tagger.tag(text)
+            results.append([(unicode(word), unicode(t)) for word, t in tagged
+                            if not PUNCTUATION_REGEX.match(unicode(t))])
+        elif field == "noun_phrases":
+            results.append([phrase.strip().lower()
+                            for phrase in models.np_extractor.extract(text)
+                            if len(phrase) > 1])
+        elif field == "sentiment":
+            results.append(score if pattern_analyzer
+                           else models.analyzer.analyze(text))
+        elif field == "polarity":
+            results.append(score[0])
+        elif field == "subjectivity":
+            results.append(score[1])
+    return tuple(results)
@@ -32,13 +32,37 @@ Example Usage:
 .. versionadded:: 0.6.0
 '''
 from __future__ import absolute_import
+from collections import defaultdict
+from functools import partial
+from itertools import chain
+import copy
+import json
+import mmap as _mmap
+import numbers
+import os
+import struct
+import tempfile
+try:
+    from collections.abc import Mapping
+except ImportError:  # Python 2
+    from collections import Mapping
+try:
+    from inspect import getfullargspec as _getargspec
+except ImportError:  # Python 2
+    from inspect import getargspec as _getargspec
+
 from textblob.packages import nltk
 from textblob.tokenizers import WordTokenizer
 from textblob.compat import basestring
 import textblob.formats as formats
-from textblob.utils import strip_punc
+from textblob.utils import strip_punc, chunked, WorkerPool
 from textblob.decorators import cached_property
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 ### Basic feature extractors ###
 
 
@@ -48,15 +72,30 @@ def _get_words_from_dataset(dataset):
     :param dataset: A list of tuples of the form ``(words, label)`` where
         ``words`` is either a string of a list of tokens.
     '''
-    tokenizer = WordTokenizer()
-    all_words = []
+    all_words = set()
     for words, classification in dataset:
-        # Words may either be a string or an iterable
-        if isinstance(words, basestring):
-            all_words.extend(tokenizer.itokenize(words, include_punc=False))
-        else:
-            all_words.extend(words)
-    return set(all_words)
+        all_words.update(_get_words(words))
+    return all_words
+
+
+def _get_words(words):
+    '''Return an iterable of the words of a document, which may either be
+    a string or an iterable.
+    '''
+    if isinstance(words, basestring):
+        return WordTokenizer().itokenize(words, include_punc=False)
+    return words
+
+
+def _get_document_tokens(document):
+    '''Return the set of punctuation-stripped tokens in a document, which
+    may be a string or an iterable of tokens.
+    '''
+    if isinstance(document, basestring):
+        tokenizer = WordTokenizer()
+        return set(strip_punc(w, all=False)
+                   for w in tokenizer.itokenize(document, include_punc=False))
+    return set(strip_punc(w, all=False) for w in document)
 
 
 def basic_extractor(document, train_set):
@@ -65,15 +104,14 @@ def basic_extractor(document, train_set):
 
     :param document: The text to extract features from. Can be a string or an iterable.
     :param train_set: Training data set, a list of tuples of the form
-        ``(words, label)``.
+        ``(words, label)``, or a precomputed set of the words in the
+        training data set.
     '''
-    tokenizer = WordTokenizer()
-    word_features = _get_words_from_dataset(train_set)
-    if isinstance(document, basestring):
-        tokens = set([strip_punc(w, all=False)
-                    for w in tokenizer.itokenize(document, include_punc=False)])
+    if isinstance(train_set, (set, frozenset)):
+        word_features = train_set
     else:
-        tokens = set(strip_punc(w, all=False) for w in document)
+        word_features = _get_words_from_dataset(train_set)
+    tokens = _get_document_tokens(document)
     features = dict([(u'contains({0})'.format(word), (word in tokens))
                                             for word in word_features])
     return features
@@ -83,15 +121,558 @@ def contains_extractor(document):
     '''A basic document feature extractor that returns a dict of words that
     the document contains.
     '''
-    tokenizer = WordTokenizer()
-    if isinstance(document, basestring):
-        tokens = set([strip_punc(w, all=False)
-                    for w in tokenizer.itokenize(document, include_punc=False)])
-    else:
-        tokens = set((strip_punc(w, all=False) for w in document))
+    tokens = _get_document_tokens(document)
     features = dict((u'contains({0})'.format(w), True) for w in tokens)
     return features
 
+##### COMPILED MODELS #####
+
+# The value that NLTK uses for log(0)
+_NINF = nltk.probability._NINF
+
+# A feature value that is never seen during training
+_UNSEEN = object()
+
+
+def _samples(probdist):
+    '''Return the samples of a probability distribution. Avoids sorting the
+    samples of frequency-based distributions, since feature values of
+    different types (e.g. ``None`` and ``True``) can't be compared on
+    Python 3.
+    '''
+    if hasattr(probdist, 'freqdist'):
+        return dict.keys(probdist.freqdist())
+    return probdist.samples()
+
+
+class CompiledNaiveBayes(object):
+
+    '''A trained ``nltk.classify.NaiveBayesClassifier`` compiled to a matrix
+    of log probabilities with one row per label and one column per
+    ``(feature name, feature value)`` pair. A featureset is encoded as the
+    list of its columns, so classifying a batch of featuresets is a single
+    vectorized sum instead of one dictionary lookup per label and feature.
+    Requires numpy.
+
+    Results are the same as the wrapped classifier's ``prob_classify``.
+
+    A compiled model can be saved to a file with :meth:`save` and loaded
+    with :meth:`load`, which maps the log probabilities into memory instead
+    of reading them.
+
+    :param classifier: A trained ``nltk.classify.NaiveBayesClassifier``.
+    :param defaults: (optional) A dict mapping feature names to the value
+        they take when a featureset omits them. The log probabilities of
+        the default values are added once to every label's prior, so
+        featuresets only need to include the features whose values differ
+        from their defaults. Without defaults, omitted features are ignored
+        like they are by NLTK.
+
+    .. versionadded:: 0.8.1
+    '''
+
+    def __init__(self, classifier, defaults=None):
+        if np is None:
+            raise ImportError("CompiledNaiveBayes requires numpy.")
+        self.labels = []
+        # Column indices. Each feature name also has a column for the values
+        # that were never seen during training.
+        self._columns, self._unseen = {}, {}
+        # The values of each feature name, in the order of their columns
+        self._fvals = {}
+        self._weights = np.empty((0, 0))
+        # The default values, and the log probability of each label and
+        # default value, with one column per feature name
+        self._defaults, self._default_columns = {}, {}
+        self._default_weights = np.empty((0, 0))
+        fnames = set(fname for label, fname in classifier._feature_probdist)
+        self._compile(classifier, classifier.labels(), fnames, defaults or {})
+
+    def _compile(self, classifier, labels, fnames, defaults):
+        '''Compute the log probabilities of ``labels`` for every feature and
+        of every label for the feature names ``fnames``, adding the rows and
+        columns of new labels, feature names and feature values. Used to
+        update the model when only these distributions of the classifier
+        changed.
+        '''
+        feature_probdist = classifier._feature_probdist
+        rows = dict((label, i) for i, label in enumerate(self.labels))
+        labels = set(labels)
+        for label in classifier.labels():
+            if label not in rows:
+                rows[label] = len(self.labels)
+                self.labels.append(label)
+                labels.add(label)
+        n_columns = self._weights.shape[1]
+        n_defaults = self._default_weights.shape[1]
+        probdists = {}
+        for fname in fnames:
+            probdists[fname] = [feature_probdist.get((label, fname))
+                                for label in self.labels]
+            fvals = self._fvals.setdefault(fname, [])
+            for probdist in probdists[fname]:
+                if probdist is None:
+                    continue
+                for fval in _samples(probdist):
+                    if (fname, fval) not in self._columns:
+                        self._columns[fname, fval] = n_columns
+                        fvals.append(fval)
+                        n_columns += 1
+            if fname not in self._unseen:
+                self._unseen[fname] = n_columns
+                n_columns += 1
+            if fname in defaults and fname not in self._default_columns:
+                self._defaults[fname] = defaults[fname]
+                self._default_columns[fname] = n_defaults
+                n_defaults += 1
+        weights = self._weights = _resize(self._weights,
+                                          (len(self.labels), n_columns))
+        default_weights = self._default_weights = _resize(
+            self._default_weights, (len(self.labels), n_defaults))
+        if labels:
+            changed = self._fvals
+        else:
+            changed = probdists
+        for fname in changed:
+            fvals = self._fvals[fname]
+            columns = [self._columns[fname, fval] for fval in fvals]
+            columns.append(self._unseen[fname])
+            default_col = self._default_columns.get(fname)
+            if default_col is not None:
+                # Store every value relative to the default value, whose
+                # log probability is added to the prior
+                default_index = columns.index(
+                    self.column(fname, self._defaults[fname]))
+            if fname in probdists:
+                label_probdists = enumerate(probdists[fname])
+            else:
+                label_probdists = [(rows[label],
+                                    feature_probdist.get((label, fname)))
+                                   for label in labels]
+            for row, probdist in label_probdists:
+                if probdist is None:
+                    logprobs = np.repeat(_NINF, len(columns))
+                else:
+                    logprobs = [probdist.logprob(fval) for fval in fvals]
+                    logprobs.append(probdist.logprob(_UNSEEN))
+                    logprobs = np.array(logprobs)
+                if default_col is not None:
+                    default = logprobs[default_index]
+                    default_weights[row, default_col] = default
+                    logprobs -= default
+                weights[row, columns] = logprobs
+        self._priors = np.array([classifier._label_probdist.logprob(label)
+                                 for label in self.labels])
+        if n_defaults:
+            self._priors += default_weights.sum(axis=1)
+
+    #: The first bytes of a saved model.
+    MAGIC = b'TBNAIVEBAYES1\n'
+
+    def save(self, path):
+        '''Save the model to ``path``. Labels, feature names and feature
+        values must be strings, numbers, booleans or ``None``.
+
+        The file holds a header, the labels and the feature names and values
+        (the vocabulary) as JSON, then the label priors and the log
+        probabilities of each feature value (one row of the log probability
+        of every label per column), as little-endian 64-bit floats. The file
+        is written next to ``path`` and then renamed, so that processes that
+        load the model never see a partial file.
+        '''
+        fvals = defaultdict(list)
+        for (fname, fval), col in self._columns.items():
+            fvals[fname].append((col, fval))
+        features, order = [], []
+        for fname, unseen in sorted(self._unseen.items(), key=lambda x: x[1]):
+            values = sorted(fvals[fname], key=lambda x: x[0])
+            features.append([fname, [fval for _, fval in values]])
+            order.extend(col for col, _ in values)
+            order.append(unseen)
+        values = list(self.labels) + list(self._unseen)
+        values.extend(fval for fname, fval in self._columns)
+        for value in values:
+            if not (value is None or isinstance(value, (basestring, numbers.Real))):
+                raise ValueError("Can't save the label or feature "
+                                 "{0!r}.".format(value))
+        header = json.dumps({'labels': self.labels, 'features': features})
+        header = header.encode('utf-8')
+        # Align the arrays to 8 bytes
+        offset = len(self.MAGIC) + 4 + len(header)
+        padding = b' ' * (-offset % 8)
+        weights = np.ascontiguousarray(self._weights[:, order].T, dtype='<f8')
+        priors = np.asarray(self._priors, dtype='<f8')
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.')
+        try:
+            with os.fdopen(fd, 'wb') as fp:
+                fp.write(self.MAGIC)
+                fp.write(struct.pack('<I', len(header) + len(padding)))
+                fp.write(header + padding)
+                fp.write(priors.tobytes())
+                fp.write(weights.tobytes())
+            os.chmod(tmp_path, 0o644)
+            os.rename(tmp_path, path)
+        except:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        '''Load a model saved with :meth:`save`.
+
+        :param path: The path of the saved model.
+        :param mmap: If ``True``, the log probabilities are mapped into
+            memory instead of read, so the model loads in the time it takes
+            to read the vocabulary, and forked processes share the pages.
+        '''
+        if np is None:
+            raise ImportError("CompiledNaiveBayes requires numpy.")
+        with open(path, 'rb') as fp:
+            if mmap:
+                data = _mmap.mmap(fp.fileno(), 0, access=_mmap.ACCESS_READ)
+            else:
+                data = fp.read()
+        if data[:len(cls.MAGIC)] != cls.MAGIC:
+            raise ValueError("{0} is not a saved naive Bayes model.".format(path))
+        offset = len(cls.MAGIC) + 4
+        header_len, = struct.unpack_from('<I', data, len(cls.MAGIC))
+        header = json.loads(data[offset:offset + header_len].decode('utf-8'))
+        offset += header_len
+        model = cls.__new__(cls)
+        model.labels = header['labels']
+        model._columns, model._unseen = {}, {}
+        n_columns = 0
+        for fname, fvals in header['features']:
+            for fval in fvals:
+                model._columns[fname, fval] = n_columns
+                n_columns += 1
+            model._unseen[fname] = n_columns
+            n_columns += 1
+        n_labels = len(model.labels)
+        model._priors = np.frombuffer(data, dtype='<f8', count=n_labels,
+                                      offset=offset)
+        model._weights = np.frombuffer(data, dtype='<f8',
+                                       count=n_columns * n_labels,
+                                       offset=offset + 8 * n_labels,
+                                       ).reshape(n_columns, n_labels).T
+        return model
+
+    def column(self, fname, fval):
+        '''Return the column index of a feature name and value, or ``None``
+        if the feature name was never seen during training.
+        '''
+        col = self._columns.get((fname, fval))
+        if col is None:
+            return self._unseen.get(fname)
+        return col
+
+    def encode(self, featureset):
+        '''Return the list of column indices for a featureset. Features that
+        were never seen during training are ignored.
+        '''
+        columns = []
+        for fname, fval in featureset.items():
+            col = self.column(fname, fval)
+            if col is not None:
+                columns.append(col)
+        return columns
+
+    def logprob_many(self, featuresets):
+        '''Return an array of shape ``(len(featuresets), len(labels))`` with
+        the unnormalized log probability of each label for each featureset.
+        '''
+        encoded = [self.encode(f) for f in featuresets]
+        logprobs = np.tile(self._priors, (len(encoded), 1))
+        cols = [col for columns in encoded for col in columns]
+        if cols:
+            rows = np.repeat(np.arange(len(encoded)),
+                             [len(columns) for columns in encoded])
+            np.add.at(logprobs, rows, self._weights[:, cols].T)
+        return logprobs
+
+    def prob_classify_many(self, featuresets):
+        '''Return a list of label probability distributions, one for each
+        featureset.
+
+        :rtype: list of nltk.probability.DictionaryProbDist
+        '''
+        return [nltk.probability.DictionaryProbDist(
+                    dict(zip(self.labels, (float(lp) for lp in row))),
+                    normalize=True, log=True)
+                for row in self.logprob_many(featuresets)]
+
+    def classify_many(self, featuresets):
+        '''Return a list of the most probable label for each featureset.'''
+        logprobs = self.logprob_many(featuresets)
+        return [self.labels[i] for i in logprobs.argmax(axis=1)]
+
+
+def _resize(array, shape):
+    '''Return a 2-dimensional array of the given shape that starts with the
+    values of ``array`` and is filled with zeros.
+    '''
+    if array.shape == shape:
+        return array
+    resized = np.zeros(shape)
+    resized[:array.shape[0], :array.shape[1]] = array
+    return resized
+
+
+##### INCREMENTAL TRAINING #####
+
+class _NaiveBayesCounts(object):
+
+    '''The label and feature frequency tables of a naive Bayes model. New
+    featuresets are folded into the tables one at a time, so the model can
+    be updated without counting the whole training set again. A feature that
+    a featureset omits counts as the value ``default``.
+
+    :param default: The value of omitted features. NLTK uses ``None``.
+    :param fnames: (optional) The set of feature names of the model. If
+        ``None``, the names are collected from the featuresets.
+    '''
+
+    def __init__(self, default=None, fnames=None):
+        self.default = default
+        self._collect_fnames = fnames is None
+        self.fnames = set() if fnames is None else fnames
+        self.label_freqdist = nltk.probability.FreqDist()
+        # Maps (label, fname) to the frequencies of the values that were
+        # given in featuresets
+        self.feature_freqdist = {}
+        self.feature_values = defaultdict(set)
+        # The number of featuresets that give a value for each feature
+        self.fname_counts = defaultdict(int)
+        # Incremented by every change to the tables
+        self.version = 0
+        # The version of the last change to each label and feature name
+        self.label_versions, self.fname_versions = {}, {}
+
+    def add(self, featureset, label):
+        '''Count a featureset with the given label.'''
+        self.version += 1
+        version = self.version
+        self.label_freqdist.inc(label)
+        self.label_versions[label] = version
+        for fname, fval in featureset.items():
+            freqdist = self.feature_freqdist.get((label, fname))
+            if freqdist is None:
+                freqdist = nltk.probability.FreqDist()
+                self.feature_freqdist[label, fname] = freqdist
+            freqdist.inc(fval)
+            self.feature_values[fname].add(fval)
+            self.fname_counts[fname] += 1
+            self.fname_versions[fname] = version
+        if self._collect_fnames:
+            self.fnames.update(featureset)
+
+    def add_fnames(self, fnames):
+        '''Add feature names to the model.'''
+        self.version += 1
+        for fname in fnames:
+            self.fnames.add(fname)
+            self.fname_versions[fname] = self.version
+
+    def changed_since(self, version, n):
+        '''Return the set of labels and the set of feature names that changed
+        since ``version``, when ``n`` featuresets had been counted. The
+        distribution of a feature's values given a label can only have
+        changed if the label or the feature name did.
+        '''
+        labels = set(label for label, changed in self.label_versions.items()
+                     if changed > version)
+        fnames = set(fname for fname, changed in self.fname_versions.items()
+                     if changed > version)
+        if self.label_freqdist.N() > n:
+            # The features that every featureset gave now take the default
+            # value too, which changes their number of bins
+            fname_counts = self.fname_counts
+            fnames.update(fname for fname in self.fnames
+                          if fname_counts.get(fname, 0) == n)
+        return labels, fnames
+
+    def freqdist(self, label, fname):
+        '''Return the frequencies of the values of ``fname`` in the
+        featuresets with the given label, counting omitted values as the
+        default.
+        '''
+        given = self.feature_freqdist.get((label, fname))
+        if given is None:
+            freqdist = nltk.probability.FreqDist()
+        else:
+            freqdist = given.copy()
+        freqdist.inc(self.default, self.label_freqdist[label] - freqdist.N())
+        return freqdist
+
+    def bins(self, fname):
+        '''Return the number of values that ``fname`` takes, including
+        ``None``, which NLTK reserves for unseen values.
+        '''
+        values = set([None])
+        values.update(self.feature_values.get(fname, ()))
+        if self.fname_counts.get(fname, 0) < self.label_freqdist.N():
+            values.add(self.default)
+        return len(values)
+
+
+class _FeatureProbDists(Mapping):
+
+    '''The ``feature_probdist`` of an NLTK naive Bayes classifier, which maps
+    ``(label, fname)`` pairs to distributions over feature values, computed
+    from a :class:`_NaiveBayesCounts` when they are first looked up.
+
+    :param counts: The frequency tables.
+    :param labels: The labels of the classifier.
+    :param probdist: A function that takes a label and a feature name and
+        returns the distribution of the feature's values.
+    '''
+
+    def __init__(self, counts, labels, probdist):
+        self._counts = counts
+        self._version = counts.version
+        self._labels = list(labels)
+        self._probdist = probdist
+        self._cache = {}
+
+    def __getitem__(self, key):
+        try:
+            return self._cache[key]
+        except KeyError:
+            if key not in self:
+                raise
+        if self._counts.version != self._version:
+            raise RuntimeError("The classifier has been updated since this "
+                               "model was trained.")
+        probdist = self._cache[key] = self._probdist(*key)
+        return probdist
+
+    def __contains__(self, key):
+        try:
+            label, fname = key
+        except (TypeError, ValueError):
+            return False
+        return label in self._labels and fname in self._counts.fnames
+
+    def __iter__(self):
+        for fname in self._counts.fnames:
+            for label in self._labels:
+                yield label, fname
+
+    def __len__(self):
+        return len(self._labels) * len(self._counts.fnames)
+
+
+def _feature_probdist(counts, estimator, label, fname):
+    '''Return the distribution of the values of ``fname`` given ``label``,
+    like :meth:`nltk.classify.NaiveBayesClassifier.train` computes it.
+    '''
+    return estimator(counts.freqdist(label, fname), bins=counts.bins(fname))
+
+
+def _positive_feature_probdist(counts, positive_prob_prior, label, fname):
+    '''Return the distribution of the values of ``fname`` given ``label``,
+    like :meth:`nltk.classify.PositiveNaiveBayesClassifier.train` computes
+    it from the positive (label ``True``) and unlabeled (label ``None``)
+    counts.
+    '''
+    estimator = nltk.probability.ELEProbDist
+    bins = counts.bins(fname)
+    positive = estimator(counts.freqdist(True, fname), bins=bins)
+    if label:
+        return positive
+    unlabeled = estimator(counts.freqdist(None, fname), bins=bins)
+    negative_prob_prior = 1.0 - positive_prob_prior
+    negative_probs = {}
+    for fval in counts.feature_values[fname] | set([None]):
+        prob = (unlabeled.prob(fval) -
+                positive_prob_prior * positive.prob(fval)) / negative_prob_prior
+        # Like NLTK, set negative probabilities to zero and normalize
+        negative_probs[fval] = max(prob, 0.0)
+    return nltk.probability.DictionaryProbDist(negative_probs, normalize=True)
+
+
+def _takes_train_set(feature_extractor):
+    '''Return True if a feature extractor takes the training set as its
+    second argument, in which case a document's features may change when
+    the training set does.
+    '''
+    try:
+        spec = _getargspec(feature_extractor)
+    except TypeError:
+        return True
+    n_args = len(spec.args)
+    if getattr(feature_extractor, '__self__', None) is not None:
+        n_args -= 1
+    return n_args > 1 or spec.varargs is not None
+
+
+##### EVALUATION #####
+
+class Evaluation(object):
+
+    '''The results of evaluating a classifier on a test set.
+
+    :param counts: A dict mapping ``(label, predicted label)`` pairs to the
+        number of test items with that label that were classified as the
+        predicted label.
+
+    :ivar confusion: An ``nltk.metrics.ConfusionMatrix`` of the labels
+        (rows) and predicted labels (columns).
+    :ivar accuracy: The fraction of test items classified correctly.
+    :ivar precision: A dict mapping each label to the fraction of the items
+        predicted to have the label that have it, or ``None`` if no item
+        was.
+    :ivar recall: A dict mapping each label to the fraction of the items
+        with the label that were predicted to have it, or ``None`` if no
+        item has the label.
+    :ivar f_measure: A dict mapping each label to the harmonic mean of its
+        precision and recall, or ``None`` if either is ``None``.
+
+    .. versionadded:: 0.8.1
+    '''
+
+    def __init__(self, counts):
+        self.confusion = nltk.metrics.ConfusionMatrix.from_counts(counts)
+        self.total = sum(counts.values())
+        correct = sum(n for (label, predicted), n in counts.items()
+                      if label == predicted)
+        self.accuracy = float(correct) / self.total if self.total else 0
+        actual, predictions = defaultdict(int), defaultdict(int)
+        for (label, predicted), n in counts.items():
+            actual[label] += n
+            predictions[predicted] += n
+        self.precision, self.recall, self.f_measure = {}, {}, {}
+        for label in set(actual) | set(predictions):
+            hits = counts.get((label, label), 0)
+            p = float(hits) / predictions[label] if predictions[label] else None
+            r = float(hits) / actual[label] if actual[label] else None
+            if p is None or r is None:
+                f = None
+            elif p == 0 or r == 0:
+                f = 0.0
+            else:
+                f = 2 * p * r / (p + r)
+            self.precision[label] = p
+            self.recall[label] = r
+            self.f_measure[label] = f
+
+    def __repr__(self):
+        return "<Evaluation: accuracy {0:.4f} on {1} instances>".format(
+            self.accuracy, self.total)
+
+
+def _count_predictions(classifier, rows):
+    '''Classify a batch of ``(text, label)`` rows. Return a dict mapping
+    ``(label, predicted label)`` pairs to counts.
+    '''
+    counts = defaultdict(int)
+    predictions = classifier.classify_many([text for text, label in rows])
+    for (text, label), predicted in zip(rows, predictions):
+        counts[label, predicted] += 1
+    return dict(counts)
+
+
 ##### CLASSIFIERS #####
 
 class BaseClassifier(object):
@@ -115,29 +696,81 @@ class BaseClassifier(object):
     def __init__(self, train_set, feature_extractor=basic_extractor, format=None):
         self.feature_extractor = feature_extractor
         if isinstance(train_set, basestring):  # train_set is a filename
-            self.train_set = self._read_data(train_set, format)
+            # The file is read when the training set is first needed
+            self._train_sources = [self._get_format(train_set, format)]
         else:  # train_set is a list of tuples
             self.train_set = train_set
         self.train_features = None
 
+    @cached_property
+    def train_set(self):
+        '''The training set, a list of tuples of the form
+        ``(text, classification)``.
+
+        .. versionchanged:: 0.8.1
+            A training file is read when the training set is first needed.
+        '''
+        train_set = []
+        for source in self._train_sources:
+            train_set.extend(source)
+        return train_set
+
+    def _iter_train_set(self):
+        '''Return an iterator over the rows of the training set. A training
+        file that hasn't been read into ``train_set`` is read one row at a
+        time.
+        '''
+        if 'train_set' in self.__dict__:
+            return iter(self.train_set)
+        return chain.from_iterable(self._train_sources)
+
     def _read_data(self, dataset, format=None):
         '''Reads a data file and returns and iterable that can be used
         as testing or training data.
         '''
+        return self._get_format(dataset, format).to_iterable()
+
+    def _iter_data(self, dataset, format=None):
+        '''Return an iterator over the ``(text, label)`` rows of a dataset,
+        which is either a filename or an iterable. Files are read one row
+        at a time.
+        '''
+        if isinstance(dataset, basestring):  # dataset is a filename
+            return iter(self._get_format(dataset, format))
+        return iter(dataset)
+
+    def _get_format(self, dataset, format=None):
+        '''Return the format object that reads the file ``dataset``.'''
         # Attempt to detect file format if "format" isn't specified
         if not format:
             format_class = formats.detect(dataset)
+            if format_class is None:
+                raise ValueError("Could not detect the format of "
+                                 "'{0}'.".format(dataset))
         else:
             if format not in formats.AVAILABLE.keys():
                 raise ValueError("'{0}' format not supported.".format(format))
             format_class = formats.AVAILABLE[format]
-        return format_class(dataset).to_iterable()
+        return format_class(dataset)
 
     @cached_property
     def classifier(self):
         '''The classifier object.'''
         raise NotImplementedError('Must implement the "classifier" property.')
 
+    @cached_property
+    def _word_set(self):
+        '''The set of words in the training data. Computed once and passed
+        to ``basic_extractor`` so that the training set isn't re-tokenized
+        for every document.
+        '''
+        return _get_words_from_dataset(self._iter_train_set())
+
+    @cached_property
+    def _extractor_takes_train_set(self):
+        '''Whether the feature extractor takes the training set.'''
+        return _takes_train_set(self.feature_extractor)
+
     def classify(self, text):
         '''Classifies a string of text.'''
         raise NotImplementedError('Must implement a "classify" method.')
@@ -156,6 +789,11 @@ class BaseClassifier(object):
         :rtype: dictionary of features
         '''
         try:
+            if self.feature_extractor is basic_extractor:
+                return self.feature_extractor(text, self._word_set)
+            if not self._extractor_takes_train_set:
+                # Don't read a training file that isn't needed
+                return self.feature_extractor(text)
             return self.feature_extractor(text, self.train_set)
         except (TypeError, AttributeError):
             return self.feature_extractor(text)
@@ -177,16 +815,30 @@ class NLTKClassifier(BaseClassifier):
 
     nltk_class = None  # This must be a class within nltk.classify
 
-    def __init__(self, train_set,
-                 feature_extractor=basic_extractor, format=None):
-        super(NLTKClassifier, self).__init__(train_set, feature_extractor, format)
-        self.train_features = [(self.extract_features(d), c) for d, c in self.train_set]
+    _train_features = None
 
     def __repr__(self):
         class_name = self.__class__.__name__
         return "<{cls} trained on {n} instances>".format(cls=class_name,
                                                         n=len(self.train_set))
 
+    @property
+    def train_features(self):
+        '''The featuresets of the training set, a list of tuples of the form
+        ``(features, label)``.
+
+        .. versionchanged:: 0.8.1
+            Extracted when first needed instead of on initialization.
+        '''
+        if self._train_features is None:
+            self._train_features = [(self.extract_features(d), c)
+                                    for d, c in self.train_set]
+        return self._train_features
+
+    @train_features.setter
+    def train_features(self, value):
+        self._train_features = value
+
     @cached_property
     def classifier(self):
         '''The classifier.'''
@@ -227,6 +879,14 @@ class NLTKClassifier(BaseClassifier):
         text_features = self.extract_features(text)
         return self.classifier.classify(text_features)
 
+    def classify_many(self, texts):
+        '''Return a list of labels, one for each text in ``texts``.
+
+        .. versionadded:: 0.8.1
+        '''
+        featuresets = [self.extract_features(text) for text in texts]
+        return self.classifier.batch_classify(featuresets)
+
     def accuracy(self, test_set, format=None):
         '''Compute the accuracy on a test set.
 
@@ -235,13 +895,66 @@ class NLTKClassifier(BaseClassifier):
         :param format: If ``test_set`` is a filename, the file format, e.g.
             ``"csv"`` or ``"json"``. If ``None``, will attempt to detect the
             file format.
+
+        .. versionchanged:: 0.8.1
+            The test set is read and classified in batches.
+        '''
+        return self.evaluate(test_set, format=format).accuracy
+
+    def evaluate(self, test_set, format=None,
+                 batch_size=formats.DEFAULT_CHUNKSIZE, n_jobs=1):
+        '''Evaluate the classifier on a test set. Return an
+        :class:`Evaluation` with the accuracy, the precision, recall and
+        F-measure of each label, and the confusion matrix.
+
+        The test set is read and classified ``batch_size`` items at a time
+        and only the counts of the results are kept, so test files of any
+        size can be evaluated with bounded memory. If ``n_jobs`` is greater
+        than 1, batches are classified by a pool of worker processes, each
+        of which receives a copy of the trained classifier without its
+        training data.
+
+        :param test_set: A list of tuples of the form ``(text, label)``, or a
+            filename.
+        :param format: If ``test_set`` is a filename, the file format, e.g.
+            ``"csv"`` or ``"json"``. If ``None``, will attempt to detect the
+            file format.
+        :param batch_size: Number of test items classified at a time.
+        :param n_jobs: Number of worker processes.
+
+        .. versionadded:: 0.8.1
+        '''
+        batches = chunked(self._iter_data(test_set, format), batch_size)
+        counts = defaultdict(int)
+        if n_jobs <= 1:
+            results = (_count_predictions(self, batch) for batch in batches)
+            pool = None
+        else:
+            pool = WorkerPool(n_jobs, self._prepare_for_workers())
+            results = pool.imap(_count_predictions, batches, ordered=False)
+        try:
+            for batch_counts in results:
+                for pair, n in batch_counts.items():
+                    counts[pair] += n
+        finally:
+            if pool is not None:
+                pool.close()
+        return Evaluation(counts)
+
+    def _prepare_for_workers(self):
+        '''Train the classifier, if needed, and return the copy of it that
+        is sent to the worker processes of :meth:`evaluate`. The copy only
+        keeps the training set if the feature extractor takes it.
         '''
-        if isinstance(test_set, basestring):  # test_set is a filename
-            test_data = self._read_data(test_set)
-        else:  # test_set is a list of tuples
-            test_data = test_set
-        test_features = [(self.extract_features(d), c) for d, c in test_data]
-        return nltk.classify.accuracy(self.classifier, test_features)
+        worker = copy.copy(self)
+        worker.classifier = self.classifier
+        worker.train_features = None
+        if self.feature_extractor is basic_extractor:
+            worker._word_set = self._word_set
+            worker.train_set = []
+        elif not _takes_train_set(self.feature_extractor):
+            worker.train_set = []
+        return worker
 
     def update(self, new_data, *args, **kwargs):
         '''Update the classifier with new training data and re-trains the
@@ -250,6 +963,7 @@ class NLTKClassifier(BaseClassifier):
         :param new_data: New data as a list of tuples of the form
             ``(text, label)``.
         '''
+        self._word_set.update(_get_words_from_dataset(new_data))
         self.train_set += new_data
         self.train_features = [(self.extract_features(d), c)
                                 for d, c in self.train_set]
@@ -276,11 +990,220 @@ class NaiveBayesClassifier(NLTKClassifier):
         ``"csv"`` or ``"json"``. If ``None``, will attempt to detect the
         file format.
 
+    The classifier keeps the label and feature frequencies of the training
+    set, so ``update`` only has to count the new data.
+
     .. versionadded:: 0.6.0
     '''
 
     nltk_class = nltk.classify.NaiveBayesClassifier
 
+    def train(self, *args, **kwargs):
+        '''Train the classifier and return it. Takes the same arguments as
+        :meth:`nltk.classify.NaiveBayesClassifier.train`, e.g. ``estimator``.
+        This method is implicitly called when calling ``classify`` or
+        ``accuracy`` methods.
+
+        .. versionchanged:: 0.8.1
+            The classifier is built from the label and feature frequencies
+            of the training set, and its feature probability distributions
+            are computed when they are first needed. If the feature extractor
+            takes the training set, the classifier is trained by NLTK.
+
+        :rtype: A classifier
+        '''
+        self._check_not_loaded()
+        estimator = self._counting_estimator(args, kwargs)
+        if estimator is None:
+            return super(NaiveBayesClassifier, self).train(*args, **kwargs)
+        self._estimator = estimator
+        self.classifier = self._train_from_counts()
+        return self.classifier
+
+    def update(self, new_data, *args, **kwargs):
+        '''Update the classifier with new training data and re-train the
+        classifier.
+
+        The new data is folded into the label and feature frequencies of the
+        training set, so an update takes time proportional to the size of
+        the new data; probability distributions are recomputed when they are
+        next needed, and the compiled model only recomputes those of the
+        labels and features of the new data.
+
+        .. versionchanged:: 0.8.1
+            Update incrementally. ``new_data`` may be a filename. The NLTK
+            classifier that ``classifier`` returned before the update shares
+            the frequency tables, so it raises a ``RuntimeError`` when it
+            needs a distribution that it hasn't computed yet.
+
+        :param new_data: New data as a list of tuples of the form
+            ``(text, label)``, or a filename.
+        '''
+        self._check_not_loaded()
+        if isinstance(new_data, basestring):  # new_data is a filename
+            new_data = self._read_data(new_data)
+        estimator = self._counting_estimator(args, kwargs)
+        if estimator is None:
+            self.__dict__.pop('_counts', None)
+            return super(NaiveBayesClassifier, self).update(new_data,
+                                                            *args, **kwargs)
+        new_data = list(new_data)
+        counts = self._counts
+        if self.feature_extractor is basic_extractor:
+            new_words = _get_words_from_dataset(new_data) - self._word_set
+            self._word_set.update(new_words)
+            counts.add_fnames(u'contains({0})'.format(word)
+                              for word in new_words)
+        for text, label in new_data:
+            counts.add(self._counted_features(text), label)
+        if 'train_set' in self.__dict__:
+            self.train_set += new_data
+        else:  # The training file hasn't been read
+            self._train_sources.append(new_data)
+        self.train_features = None  # Extracted again if needed
+        self._estimator = estimator
+        self.classifier = self._train_from_counts()
+        return True
+
+    def save(self, path):
+        '''Save the trained model to ``path``, training it first if needed.
+        Only the compiled model is saved: the label priors, the log
+        probabilities of the feature values and the vocabulary, not the
+        training set. Requires numpy.
+
+        See :meth:`CompiledNaiveBayes.save` for the file format.
+
+        .. versionadded:: 0.8.1
+        '''
+        model = self._compiled_model()
+        if model is None:
+            raise ImportError("Saving a NaiveBayesClassifier requires numpy.")
+        model.save(path)
+
+    @classmethod
+    def load(cls, path, feature_extractor=basic_extractor, mmap=True):
+        '''Load a classifier saved with :meth:`save`. The loaded classifier
+        can classify and be evaluated, but it has no training set, so it
+        can't be trained, updated or list its informative features.
+        Requires numpy.
+
+        :param path: The path of the saved model.
+        :param feature_extractor: The feature extractor the model was
+            trained with.
+        :param mmap: If ``True``, the model's log probabilities are mapped
+            into memory instead of read, so that loading is fast and forked
+            processes share them.
+
+        .. versionadded:: 0.8.1
+        '''
+        classifier = cls._from_compiled(CompiledNaiveBayes.load(path, mmap=mmap),
+                                        feature_extractor)
+        classifier._loaded_from = path
+        return classifier
+
+    @classmethod
+    def _from_compiled(cls, model, feature_extractor, train_set=()):
+        '''Return a classifier that classifies with a compiled model and
+        can't be trained.
+        '''
+        classifier = cls.__new__(cls)
+        BaseClassifier.__init__(classifier, list(train_set), feature_extractor)
+        classifier._compiled = model
+        classifier._compiled_only = True
+        return classifier
+
+    # The path of the model, if the classifier was created with load()
+    _loaded_from = None
+    # True if the classifier only has a compiled model, e.g. if it was
+    # created with load()
+    _compiled_only = False
+
+    def _check_not_loaded(self):
+        '''Raise a ValueError if the classifier was created with load().'''
+        if self._compiled_only:
+            raise ValueError("A NaiveBayesClassifier loaded from a saved "
+                             "model can't be trained.")
+
+    def __repr__(self):
+        if self._loaded_from is not None:
+            return "<{cls} loaded from {path}>".format(
+                cls=self.__class__.__name__, path=self._loaded_from)
+        if 'train_set' not in self.__dict__ and '_counts' in self.__dict__:
+            # Don't read the training file to count its rows
+            return "<{cls} trained on {n} instances>".format(
+                cls=self.__class__.__name__,
+                n=self._counts.label_freqdist.N())
+        return super(NaiveBayesClassifier, self).__repr__()
+
+    def labels(self):
+        '''Return an iterable of possible labels.'''
+        if self._compiled_only:
+            return list(self._compiled.labels)
+        return super(NaiveBayesClassifier, self).labels()
+
+    _estimator = nltk.probability.ELEProbDist
+
+    def _counting_estimator(self, args, kwargs):
+        '''Return the estimator for training from frequency tables with the
+        given arguments to ``train``, or ``None`` if the classifier must be
+        trained by NLTK.
+        '''
+        if len(args) > 1 or set(kwargs) - set(['estimator']):
+            return None
+        if (self.feature_extractor is not basic_extractor and
+                _takes_train_set(self.feature_extractor)):
+            return None
+        if args:
+            return args[0]
+        return kwargs.get('estimator', nltk.probability.ELEProbDist)
+
+    @cached_property
+    def _counts(self):
+        '''The label and feature frequencies of the training set. A training
+        file is counted as it is read, without reading it into
+        ``train_set``.
+        '''
+        if self.feature_extractor is not basic_extractor:
+            counts = _NaiveBayesCounts()
+            for text, label in self._iter_train_set():
+                counts.add(self._counted_features(text), label)
+            return counts
+        # Only count the words that a document contains; the others are
+        # False. Documents are counted by all of their words, so the
+        # counts stay right when a word is added to the training words.
+        counts = _NaiveBayesCounts(default=False, fnames=set())
+        collect_words = '_word_set' not in self.__dict__
+        words = set()
+        for text, label in self._iter_train_set():
+            if collect_words:
+                words.update(_get_words(text))
+            counts.add(self._counted_features(text), label)
+        if collect_words:
+            self._word_set = words
+        counts.add_fnames(u'contains({0})'.format(word)
+                          for word in self._word_set)
+        return counts
+
+    def _counted_features(self, text):
+        '''Return the featureset of ``text`` that is added to the frequency
+        tables.
+        '''
+        if self.feature_extractor is basic_extractor:
+            return dict((u'contains({0})'.format(word), True)
+                        for word in _get_document_tokens(text))
+        return self.extract_features(text)
+
+    def _train_from_counts(self):
+        '''Return a new NLTK classifier whose distributions are computed from
+        the frequency tables.
+        '''
+        counts, estimator = self._counts, self._estimator
+        label_probdist = estimator(counts.label_freqdist.copy())
+        feature_probdist = _FeatureProbDists(
+            counts, label_probdist.samples(),
+            partial(_feature_probdist, counts, estimator))
+        return self.nltk_class(label_probdist, feature_probdist)
+
     def prob_classify(self, text):
         '''Return the label probability distribution for classifying a string
         of text.
@@ -297,8 +1220,124 @@ class NaiveBayesClassifier(NLTKClassifier):
 
         :rtype: nltk.probability.DictionaryProbDist
         '''
-        text_features = self.extract_features(text)
-        return self.classifier.prob_classify(text_features)
+        compiled = self._compiled_model()
+        if compiled is None:
+            text_features = self.extract_features(text)
+            return self.classifier.prob_classify(text_features)
+        return compiled.prob_classify_many([self._sparse_features(text)])[0]
+
+    def prob_classify_many(self, texts):
+        '''Return a list of label probability distributions, one for each
+        text in ``texts``. If numpy is installed, the whole batch is
+        classified with a single vectorized computation.
+
+        :param texts: An iterable of strings or lists of words.
+        :rtype: list of nltk.probability.DictionaryProbDist
+
+        .. versionadded:: 0.8.1
+        '''
+        compiled = self._compiled_model()
+        if compiled is None:
+            return [self.prob_classify(text) for text in texts]
+        return compiled.prob_classify_many([self._sparse_features(text)
+                                            for text in texts])
+
+    def classify(self, text):
+        '''Classifies the text.
+
+        :param text: A string of text.
+        '''
+        return self.prob_classify(text).max()
+
+    def classify_many(self, texts):
+        '''Return a list of labels, one for each text in ``texts``.
+
+        .. versionadded:: 0.8.1
+        '''
+        compiled = self._compiled_model()
+        if compiled is None:
+            return [self.classify(text) for text in texts]
+        return compiled.classify_many([self._sparse_features(text)
+                                       for text in texts])
+
+    def _compiled_model(self):
+        '''Return the trained classifier compiled to a
+        :class:`CompiledNaiveBayes`, or ``None`` if numpy is not installed.
+        The compiled model is updated whenever the classifier is retrained.
+        If the classifier was trained from the same frequency tables, only
+        the distributions that changed are compiled again.
+        '''
+        if self._compiled_only:
+            return self._compiled
+        if np is None:
+            return None
+        classifier = self.classifier
+        if self.__dict__.get('_compiled_for') is not classifier:
+            defaults = None
+            if self.feature_extractor is basic_extractor:
+                # basic_extractor includes every training word in every
+                # featureset, so documents can be encoded by the words they
+                # contain alone
+                defaults = dict((u'contains({0})'.format(word), False)
+                                for word in self._word_set)
+            changes = self._changes_since_compiled(classifier)
+            if changes is None:
+                self._compiled = CompiledNaiveBayes(classifier, defaults)
+            else:
+                labels, fnames = changes
+                self._compiled._compile(classifier, labels, fnames,
+                                        defaults or {})
+            self._compiled_for = classifier
+            self._compiled_from = None
+            if isinstance(classifier._feature_probdist, _FeatureProbDists):
+                counts = classifier._feature_probdist._counts
+                self._compiled_from = (counts, self._estimator, counts.version,
+                                       counts.label_freqdist.N())
+        return self._compiled
+
+    def _changes_since_compiled(self, classifier):
+        '''Return the labels and the feature names whose distributions
+        changed since the model was last compiled, or ``None`` if the model
+        must be compiled from scratch.
+        '''
+        compiled_from = self.__dict__.get('_compiled_from')
+        probdists = classifier._feature_probdist
+        if (compiled_from is None or
+                not isinstance(probdists, _FeatureProbDists)):
+            return None
+        counts, estimator, version, n = compiled_from
+        if probdists._counts is not counts or self._estimator is not estimator:
+            return None
+        return counts.changed_since(version, n)
+
+    def _prepare_for_workers(self):
+        '''Return the copy of the classifier that is sent to the worker
+        processes of :meth:`evaluate`. If numpy is installed, the copy only
+        has the compiled model, the feature extractor and, if the extractor
+        takes it, the training set.
+        '''
+        model = self._compiled_model()
+        if model is None:
+            return super(NaiveBayesClassifier, self)._prepare_for_workers()
+        train_set = []
+        if (self.feature_extractor is not basic_extractor and
+                _takes_train_set(self.feature_extractor)):
+            train_set = self.train_set
+        return self._from_compiled(model, self.feature_extractor, train_set)
+
+    def _sparse_features(self, text):
+        '''Return the features of ``text`` that differ from the defaults of
+        the compiled model. For ``basic_extractor``, these are the training
+        words that the text contains.
+        '''
+        if self.feature_extractor is basic_extractor:
+            tokens = _get_document_tokens(text)
+            if not self._compiled_only:
+                tokens = [word for word in tokens if word in self._word_set]
+            # A loaded model ignores the words it doesn't know
+            return dict((u'contains({0})'.format(word), True)
+                        for word in tokens)
+        return self.extract_features(text)
 
     def informative_features(self, *args, **kwargs):
         '''Return the most informative features as a list of tuples of the
@@ -422,11 +1461,14 @@ class PositiveNaiveBayesClassifier(NLTKClassifier):
         ``accuracy`` methods and is included only to allow passing in arguments
         to the ``train`` method of the wrapped NLTK class.
 
+        .. versionchanged:: 0.8.1
+            The classifier is built from the feature frequencies of the
+            labeled and unlabeled sets, and its feature probability
+            distributions are computed when they are first needed.
+
         :rtype: A classifier
         '''
-        self.classifier = self.nltk_class.train(self.positive_features,
-                                                self.unlabeled_features,
-                                                self.positive_prob_prior)
+        self.classifier = self._train_from_counts()
         return self.classifier
 
     def update(self, new_positive_data=None,
@@ -435,20 +1477,66 @@ class PositiveNaiveBayesClassifier(NLTKClassifier):
         '''Update the classifier with new data and re-trains the
         classifier.
 
+        .. versionchanged:: 0.8.1
+            The new data is folded into the feature frequencies of the
+            labeled and unlabeled sets instead of re-training the classifier
+            from scratch, unless arguments for the wrapped NLTK class are
+            given.
+
         :param new_positive_data: List of new, labeled strings.
         :param new_unlabeled_data: List of new, unlabeled strings.
         '''
         self.positive_prob_prior = positive_prob_prior
+        incremental = not (args or kwargs)
+        if incremental:
+            counts = self._counts
         if new_positive_data:
             self.positive_set += new_positive_data
-            self.positive_features += [self.extract_features(d)
-                                            for d in new_positive_data]
+            new_features = [self.extract_features(d)
+                            for d in new_positive_data]
+            self.positive_features += new_features
+            if incremental:
+                for featureset in new_features:
+                    counts.add(featureset, True)
         if new_unlabeled_data:
             self.unlabeled_set += new_unlabeled_data
-            self.unlabeled_features += [self.extract_features(d)
-                                            for d in new_unlabeled_data]
-        self.classifier = self.nltk_class.train(self.positive_features,
-                                                self.unlabeled_features,
-                                                self.positive_prob_prior,
-                                                *args, **kwargs)
+            new_features = [self.extract_features(d)
+                            for d in new_unlabeled_data]
+            self.unlabeled_features += new_features
+            if incremental:
+                for featureset in new_features:
+                    counts.add(featureset, None)
+        if incremental:
+            self.classifier = self._train_from_counts()
+        else:
+            self.__dict__.pop('_counts', None)
+            self.classifier = self.nltk_class.train(self.positive_features,
+                                                    self.unlabeled_features,
+                                                    self.positive_prob_prior,
+                                                    *args, **kwargs)
         return True
+
+    @cached_property
+    def _counts(self):
+        '''The feature frequencies of the positive set (label ``True``) and
+        the unlabeled set (label ``None``).
+        '''
+        counts = _NaiveBayesCounts()
+        for featureset in self.positive_features:
+            counts.add(featureset, True)
+        for featureset in self.unlabeled_features:
+            counts.add(featureset, None)
+        return counts
+
+    def _train_from_counts(self):
+        '''Return a new NLTK classifier whose distributions are computed from
+        the frequency tables, like
+        :meth:`nltk.classify.PositiveNaiveBayesClassifier.train` does.
+        '''
+        counts, prior = self._counts, self.positive_prob_prior
+        label_probdist = nltk.probability.DictionaryProbDist(
+            {True: prior, False: 1.0 - prior})
+        feature_probdist = _FeatureProbDists(
+            counts, [True, False],
+            partial(_positive_feature_probdist, counts, prior))
+        return self.nltk_class(label_probdist, feature_probdist)
@@ -7,6 +7,8 @@ complete license information.
 '''
 import re
 
+from textblob.utils import LRUCache
+
 VERB, NOUN, ADJECTIVE, ADVERB = "VB", "NN", "JJ", "RB"
 
 #### PLURALIZE #####################################################################################
@@ -239,7 +241,18 @@ def pluralize(word, pos=NOUN, custom={}, classical=True):
         Handles nouns and adjectives, using classical inflection by default
         (e.g. where "matrix" pluralizes to "matrices" instead of "matrixes").
         The custom dictionary is for user-defined replacements.
+        Without a custom dictionary, results are kept in a bounded cache.
     """
+    if custom:
+        return _pluralize(word, pos, custom, classical)
+    key = (word, pos, classical)
+    plural = _pluralize_cache.get(key, _MISSING)
+    if plural is _MISSING:
+        plural = _pluralize(word, pos, custom, classical)
+        _pluralize_cache.set(key, plural)
+    return plural
+
+def _pluralize(word, pos=NOUN, custom={}, classical=True):
 
     if word in custom:
         return custom[word]
@@ -268,25 +281,24 @@ def pluralize(word, pos=NOUN, custom={}, classical=True):
             return word.replace(words[-1], pluralize(words[-1], pos, custom, classical))
 
     # Only a very few number of adjectives inflect.
-    n = list(range(len(plural_rules)))
     if pos.startswith(ADJECTIVE):
-        n = [0, 1]
+        rules, index = _plural_index[ADJECTIVE]
+    else:
+        rules, index = _plural_index[NOUN]
+    # Only try the rules whose suffix matches the last character of the word.
+    if _indexable.match(word) is not None:
+        rules = index.get(word[-1:], index[""])
 
     # Apply pluralization rules.
-    for i in n:
-        ruleset = plural_rules[i]
-        for rule in ruleset:
-            suffix, inflection, category, classic = rule
-            # A general rule, or a classic rule in classical mode.
-            if category == None:
-                if not classic or (classic and classical):
-                    if suffix.search(word) is not None:
-                        return suffix.sub(inflection, word)
-            # A rule relating to a specific category of words.
-            if category != None:
-                if word in plural_categories[category] and (not classic or (classic and classical)):
-                    if suffix.search(word) is not None:
-                        return suffix.sub(inflection, word)
+    for literal, suffix, inflection, category, classic in rules:
+        # A general rule, or a classic rule in classical mode.
+        if classic and not classical or not word.endswith(literal):
+            continue
+        # A rule relating to a specific category of words.
+        if category is not None and word not in _plural_category_sets[category]:
+            continue
+        if suffix.search(word) is not None:
+            return suffix.sub(inflection, word)
 
 #### SINGULARIZE ###################################################################################
 # Adapted from Bermi Ferrer's Inflector for Python:
@@ -425,8 +437,22 @@ singular_irregular = {
 }
 
 def singularize(word, pos=NOUN, custom={}):
+    """ Returns the singular of a given word.
+        The custom dictionary is for user-defined replacements.
+        Without a custom dictionary, results are kept in a bounded cache.
+    """
+    if custom:
+        return _singularize(word, pos, custom)
+    key = (word, pos)
+    singular = _singularize_cache.get(key, _MISSING)
+    if singular is _MISSING:
+        singular = _singularize(word, pos, custom)
+        _singularize_cache.set(key, singular)
+    return singular
+
+def _singularize(word, pos=NOUN, custom={}):
 
-    if word in list(custom.keys()):
+    if word in custom:
         return custom[word]
 
     # Recursion of compound words (e.g. mothers-in-law).
@@ -439,21 +465,24 @@ def singularize(word, pos=NOUN, custom={}):
         return singularize(word[:-1]) + "'s"
 
     lower = word.lower()
-    for w in singular_uninflected:
-        if w.endswith(lower):
-            return word
-    for w in singular_uncountable:
-        if w.endswith(lower):
-            return word
-    for w in singular_ie:
-        if lower.endswith(w+"s"):
-            return w
-    for w in list(singular_irregular.keys()):
-        if lower.endswith(w):
-            return re.sub('(?i)'+w+'$', singular_irregular[w], word)
-
-    for rule in singular_rules:
-        suffix, inflection = rule
+    # The word is the end of an uninflected or uncountable word.
+    if lower in _singular_invariant:
+        return word
+    i = _first_suffix(lower, _singular_ie_index)
+    if i is not None:
+        return singular_ie[i]
+    i = _first_suffix(lower, _singular_irregular_index)
+    if i is not None:
+        suffix, inflection = _singular_irregular_rules[i]
+        return suffix.sub(inflection, word)
+
+    rules, index = _singular_index
+    # Only try the rules whose suffix matches the last character of the word.
+    if _indexable.match(word) is not None:
+        rules = index.get(lower[-1:], index[""])
+    for literal, suffix, inflection in rules:
+        if not lower.endswith(literal):
+            continue
         match = suffix.search(word)
         if match:
             groups = match.groups()
@@ -463,3 +492,96 @@ def singularize(word, pos=NOUN, custom={}):
             return suffix.sub(inflection, word)
 
     return word
+
+#### RULE INDEX ####################################################################################
+# The rules are indexed by the literal suffix that a word must end with to match them,
+# so that a word is only tested against the rules for its last character.
+# Words that aren't ASCII or that contain a line break are tested against all the rules:
+# case-insensitive patterns can match other characters, and $ matches before a final "\n".
+
+_indexable = re.compile(r"[\x00-\x09\x0b-\x7f]*\Z")
+
+_MISSING = object()
+
+_pluralize_cache = LRUCache(10000)
+_singularize_cache = LRUCache(10000)
+
+def _literal_suffix(pattern):
+    """ Returns the letters at the end of the given rule pattern,
+        which every matching word must end with ("" if there are none).
+    """
+    depth = 0
+    for ch in pattern:
+        if ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif ch == "|" and depth == 0:
+            # Alternatives such as "^a$|^an$" have no common suffix.
+            return ""
+    m = re.search(r"([A-Za-z]*)\$$", pattern)
+    return m and m.group(1) or ""
+
+def _suffix_index(rules):
+    """ Returns a (rules, index) tuple for a list of rules that start with their literal suffix.
+        The rules are returned without their suffix, to be tried on any word.
+        The index is a dict of last character => the rules that a word ending with it can match.
+        The "" key holds the rules without a suffix, for the other words.
+    """
+    index = {"": [rule for rule in rules if not rule[0]]}
+    for ch in set(rule[0][-1:] for rule in rules):
+        if ch:
+            index[ch] = [rule for rule in rules if rule[0][-1:] in ("", ch)]
+    return [("",) + rule[1:] for rule in rules], index
+
+def _first_suffix(word, index):
+    """ Returns the smallest position of a suffix of the word
+        in the given index (see _position_index), or None.
+    """
+    lengths, positions = index
+    found = None
+    for n in lengths:
+        i = positions.get(word[-n:])
+        if i is not None and (found is None or i < found):
+            found = i
+    return found
+
+def _position_index(suffixes):
+    """ Returns the lengths and a dict of suffix => position, for the given suffixes.
+        The first position is kept for duplicate suffixes.
+    """
+    positions = {}
+    for i, w in enumerate(suffixes):
+        positions.setdefault(w, i)
+    return sorted(set(len(w) for w in positions if w)), positions
+
+def index_rules():
+    """ Indexes the pluralization and singularization rules and clears the caches.
+        This needs to be called after the rules or word lists in this module are changed.
+    """
+    global _plural_index, _plural_category_sets, _singular_index, _singular_invariant
+    global _singular_ie_index, _singular_irregular_rules, _singular_irregular_index
+    rules = []
+    for ruleset in plural_rules:
+        for suffix, inflection, category, classic in ruleset:
+            rules.append((_literal_suffix(suffix.pattern), suffix, inflection, category, classic))
+    adjective_rules = rules[:len(plural_rules[0]) + len(plural_rules[1])]
+    _plural_index = {
+        NOUN: _suffix_index(rules),
+        ADJECTIVE: _suffix_index(adjective_rules),
+    }
+    _plural_category_sets = dict((k, frozenset(v)) for k, v in plural_categories.items())
+    _singular_index = _suffix_index([
+        (_literal_suffix(suffix.pattern).lower(), suffix, inflection)
+            for suffix, inflection in singular_rules])
+    _singular_invariant = set(
+        w[i:] for w in singular_uninflected + singular_uncountable for i in range(len(w) + 1))
+    _singular_ie_index = _position_index([w + "s" for w in singular_ie])
+    irregular = list(singular_irregular.keys())
+    _singular_irregular_rules = [
+        (re.compile("(?i)" + w + "$"), singular_irregular[w]) for w in irregular]
+    _singular_irregular_index = _position_index(irregular)
+    _pluralize_cache.clear()
+    _singularize_cache.clear()
+
+index_rules()
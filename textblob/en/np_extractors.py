@@ -1,33 +1,91 @@
 # -*- coding: utf-8 -*-
 '''Various noun phrase extractors.'''
 from __future__ import unicode_literals, absolute_import
+import io
+import os
+
 from textblob.packages import nltk
+from textblob import registry
 from textblob.taggers import PatternTagger
 from textblob.decorators import requires_nltk_corpus
 from textblob.utils import tree2str, filter_insignificant
 from textblob.base import BaseNPExtractor
 
+MODULE = os.path.dirname(os.path.abspath(__file__))
+
 
 class ChunkParser(nltk.ChunkParserI):
 
-    def __init__(self):
+    '''Chunk parser trained on the ConLL-2000 corpus.
+
+    :param path: (optional) Path to a model saved with :meth:`save`. If
+        ``None``, the model that ships with TextBlob is used if it exists,
+        otherwise the parser is trained on the corpus.
+
+    .. versionchanged:: 0.8.1
+        Added the ``path`` parameter.
+    '''
+
+    #: Default location of the saved model.
+    MODEL_PATH = os.path.join(MODULE, "en-chunk-conll2000.txt")
+
+    def __init__(self, path=None):
+        self.path = path
         self._trained = False
 
     @requires_nltk_corpus
-    def train(self):
-        '''Train the Chunker on the ConLL-2000 corpus.'''
+    def train(self, n_jobs=1):
+        '''Train the Chunker on the ConLL-2000 corpus.
+
+        :param n_jobs: Number of worker processes that count the corpus.
+
+        .. versionchanged:: 0.8.1
+            Added the ``n_jobs`` parameter.
+        '''
         train_data = [[(t, c) for _, t, c in nltk.chunk.tree2conlltags(sent)]
                       for sent in
                       nltk.corpus.conll2000.chunked_sents('train.txt',
                                                     chunk_types=['NP'])]
-        unigram_tagger = nltk.UnigramTagger(train_data)
-        self.tagger = nltk.BigramTagger(train_data, backoff=unigram_tagger)
+        unigram_tagger = nltk.UnigramTagger(train_data, n_jobs=n_jobs)
+        self.tagger = nltk.BigramTagger(train_data, backoff=unigram_tagger,
+                                        n_jobs=n_jobs)
+        self._trained = True
+
+    def save(self, path):
+        '''Save the trained model to ``path``, training it first if needed.
+
+        .. versionadded:: 0.8.1
+        '''
+        self.warmup()
+        _save_tables(self.tagger, path)
+
+    def load(self, path):
+        '''Load a model saved with :meth:`save`.
+
+        .. versionadded:: 0.8.1
+        '''
+        unigram, bigram = _load_tables(path)
+        unigram_tagger = _ngram_tagger(nltk.UnigramTagger, unigram)
+        self.tagger = _ngram_tagger(nltk.BigramTagger, bigram, unigram_tagger)
         self._trained = True
 
+    def warmup(self):
+        '''Load or train the model now instead of on the first call to
+        :meth:`parse`.
+
+        .. versionadded:: 0.8.1
+        '''
+        if not self._trained:
+            path = self.path or self.MODEL_PATH
+            if self.path or os.path.exists(path):
+                self.load(path)
+            else:
+                self.train()
+
     def parse(self, sentence):
         '''Return the parse tree for the sentence.'''
         if not self._trained:
-            self.train()
+            self.warmup()
         pos_tags = [pos for (word, pos) in sentence]
         tagged_pos_tags = self.tagger.tag(pos_tags)
         chunktags = [chunktag for (pos, chunktag) in tagged_pos_tags]
@@ -59,9 +117,19 @@ class ConllExtractor(BaseNPExtractor):
     def __init__(self, parser=None):
         self.parser = ChunkParser() if not parser else parser
 
+    def warmup(self):
+        '''Load the chunk parser and the part-of-speech tagger now instead
+        of on the first call to :meth:`extract`.
+
+        .. versionadded:: 0.8.1
+        '''
+        if hasattr(self.parser, "warmup"):
+            self.parser.warmup()
+        self.extract("Warm up the noun phrase extractor.")
+
     def extract(self, text):
         '''Return a list of noun phrases (strings) for body of text.'''
-        sentences = nltk.tokenize.sent_tokenize(text)
+        sentences = registry.get("punkt").tokenize(text)
         noun_phrases = []
         for sentence in sentences:
             parsed = self._parse_sentence(sentence)
@@ -99,13 +167,33 @@ class FastNPExtractor(BaseNPExtractor):
         ('JJ', 'NN'): 'NNI',
         }
 
-    def __init__(self):
+    #: Default location of the saved model.
+    MODEL_PATH = os.path.join(MODULE, "en-np-brown.txt")
+
+    def __init__(self, path=None):
+        self.path = path
         self._trained = False
 
     @requires_nltk_corpus
-    def train(self):
+    def train(self, n_jobs=1):
+        '''Train the tagger on the news category of the Brown corpus.
+
+        :param n_jobs: Number of worker processes that count the corpus.
+
+        .. versionchanged:: 0.8.1
+            Added the ``n_jobs`` parameter.
+        '''
         train_data = nltk.corpus.brown.tagged_sents(categories='news')
-        regexp_tagger = nltk.RegexpTagger([
+        regexp_tagger = self._regexp_tagger()
+        unigram_tagger = nltk.UnigramTagger(train_data, backoff=regexp_tagger,
+                                            n_jobs=n_jobs)
+        self.tagger = nltk.BigramTagger(train_data, backoff=unigram_tagger,
+                                        n_jobs=n_jobs)
+        self._trained = True
+        return None
+
+    def _regexp_tagger(self):
+        return nltk.RegexpTagger([
             (r'^-?[0-9]+(.[0-9]+)?$', 'CD'),
             (r'(-|:|;)$', ':'),
             (r'\'*$', 'MD'),
@@ -119,10 +207,40 @@ class FastNPExtractor(BaseNPExtractor):
             (r'.*ed$', 'VBD'),
             (r'.*', 'NN'),
             ])
-        unigram_tagger = nltk.UnigramTagger(train_data, backoff=regexp_tagger)
-        self.tagger = nltk.BigramTagger(train_data, backoff=unigram_tagger)
+
+    def save(self, path):
+        '''Save the trained tagger tables to ``path``, training the tagger
+        first if needed.
+
+        .. versionadded:: 0.8.1
+        '''
+        self.warmup()
+        _save_tables(self.tagger, path)
+
+    def load(self, path):
+        '''Load tagger tables saved with :meth:`save`.
+
+        .. versionadded:: 0.8.1
+        '''
+        unigram, bigram = _load_tables(path)
+        unigram_tagger = _ngram_tagger(nltk.UnigramTagger, unigram,
+                                       self._regexp_tagger())
+        self.tagger = _ngram_tagger(nltk.BigramTagger, bigram, unigram_tagger)
         self._trained = True
-        return None
+
+    def warmup(self):
+        '''Load or train the tagger now instead of on the first call to
+        :meth:`extract`. Call this before forking worker processes so that
+        they share the tagger tables.
+
+        .. versionadded:: 0.8.1
+        '''
+        if not self._trained:
+            path = self.path or self.MODEL_PATH
+            if self.path or os.path.exists(path):
+                self.load(path)
+            else:
+                self.train()
 
 
     def _tokenize_sentence(self, sentence):
@@ -130,11 +248,20 @@ class FastNPExtractor(BaseNPExtractor):
         tokens = nltk.word_tokenize(sentence)
         return tokens
 
-    def extract(self, sentence):
-        '''Return a list of noun phrases (strings) for body of text.'''
+    def extract(self, sentence, tokenize=True):
+        '''Return a list of noun phrases (strings) for body of text.
+
+        :param sentence: A string, or a list of word tokens if ``tokenize``
+            is ``False``.
+        :param tokenize: Whether to tokenize ``sentence`` with
+            ``nltk.word_tokenize``.
+
+        .. versionchanged:: 0.8.1
+            Added the ``tokenize`` parameter.
+        '''
         if not self._trained:
-            self.train()
-        tokens = self._tokenize_sentence(sentence)
+            self.warmup()
+        tokens = self._tokenize_sentence(sentence) if tokenize else sentence
         tagged = self.tagger.tag(tokens)
         tags = _normalize_tags(tagged)
         merge = True
@@ -160,6 +287,45 @@ class FastNPExtractor(BaseNPExtractor):
 
 ### Utility methods ###
 
+def _save_tables(tagger, path):
+    '''Save the tables of a bigram tagger and its unigram backoff tagger.
+
+    Each line holds one table entry, as tab-separated fields:
+    ``1 word tag`` for the unigram table and ``2 [previous-tag] word tag``
+    for the bigram table. The previous tag is left out for the first word
+    of a sentence.
+    '''
+    unigram = tagger.backoff
+    with io.open(path, "w", encoding="utf-8") as fp:
+        for word, tag in sorted(unigram._context_to_tag.items()):
+            fp.write("1\t{0}\t{1}\n".format(word, tag))
+        for (history, word), tag in sorted(tagger._context_to_tag.items(),
+                                           key=lambda item: repr(item[0])):
+            fields = ("2",) + history + (word, tag)
+            fp.write("\t".join(fields) + "\n")
+
+
+def _ngram_tagger(cls, table, backoff=None):
+    '''Return an n-gram tagger of class ``cls`` with the given table.'''
+    # NgramTagger refuses an empty model, which is a valid (if useless) table
+    tagger = cls(model=table or {None: None}, backoff=backoff)
+    tagger._context_to_tag = table
+    return tagger
+
+
+def _load_tables(path):
+    '''Return the unigram and bigram tables saved by :func:`_save_tables`.'''
+    unigram, bigram = {}, {}
+    with io.open(path, "r", encoding="utf-8") as fp:
+        for line in fp:
+            fields = line.rstrip("\n").split("\t")
+            if fields[0] == "1":
+                unigram[fields[1]] = fields[2]
+            else:
+                bigram[(tuple(fields[1:-2]), fields[-2])] = fields[-1]
+    return unigram, bigram
+
+
 def _normalize_tags(chunk):
     '''Normalize the corpus tags.
     ("NN", "NN-PL", "NNS") -> "NN"
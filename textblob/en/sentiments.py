@@ -9,6 +9,7 @@ from textblob.en import sentiment as pattern_sentiment
 from textblob.tokenizers import WordTokenizer
 from textblob.decorators import requires_nltk_corpus
 from textblob.base import BaseSentimentAnalyzer, DISCRETE, CONTINUOUS
+from textblob.classifiers import CompiledNaiveBayes
 
 
 class PatternAnalyzer(BaseSentimentAnalyzer):
@@ -21,11 +22,20 @@ class PatternAnalyzer(BaseSentimentAnalyzer):
 
     kind = CONTINUOUS
 
-    def analyze(self, text):
+    def analyze(self, text, assessments=False):
         """Return the sentiment as a tuple of the form:
         ``(polarity, subjectivity)``
+
+        :param assessments: If ``True``, return pattern's ``Score`` tuple,
+            which also has an ``assessments`` attribute listing the scored
+            words. Otherwise only the two floats are computed, which is faster.
+
+        .. versionchanged:: 0.8.1
+            Added the ``assessments`` parameter.
         """
-        return pattern_sentiment(text)
+        if assessments:
+            return pattern_sentiment(text)
+        return pattern_sentiment.score(text)
 
 
 class NaiveBayesAnalyzer(BaseSentimentAnalyzer):
@@ -41,6 +51,7 @@ class NaiveBayesAnalyzer(BaseSentimentAnalyzer):
     def __init__(self):
         super(NaiveBayesAnalyzer, self).__init__()
         self._classifier = None
+        self._compiled = None
 
     @requires_nltk_corpus
     def train(self):
@@ -54,6 +65,10 @@ class NaiveBayesAnalyzer(BaseSentimentAnalyzer):
             nltk.corpus.movie_reviews.words(fileids=[f])), 'pos') for f in pos_ids]
         train_data = neg_feats + pos_feats
         self._classifier = nltk.classify.NaiveBayesClassifier.train(train_data)
+        try:
+            self._compiled = CompiledNaiveBayes(self._classifier)
+        except ImportError:  # numpy is not installed
+            self._compiled = None
 
     def _extract_feats(self, words):
         return dict([(word, True) for word in words])
@@ -68,6 +83,9 @@ class NaiveBayesAnalyzer(BaseSentimentAnalyzer):
         tokens = tokenizer.tokenize(text, include_punc=False)
         filtered = [t.lower() for t in tokens if len(t) >= 3]
         feats = self._extract_feats(filtered)
-        prob_dist = self._classifier.prob_classify(feats)
+        if self._compiled is not None:
+            prob_dist = self._compiled.prob_classify_many([feats])[0]
+        else:
+            prob_dist = self._classifier.prob_classify(feats)
         # classification, p_pos, p_neg
         return prob_dist.max(), prob_dist.prob('pos'), prob_dist.prob("neg")
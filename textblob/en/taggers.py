@@ -9,6 +9,7 @@ import pickle
 
 import textblob
 from textblob.packages import nltk
+from textblob import registry
 from textblob.en import tag as pattern_tag
 from textblob.decorators import requires_nltk_corpus
 from textblob.exceptions import DeprecationError
@@ -38,7 +39,7 @@ class NLTKTagger(BaseTagger):
         '''Tag a string `sentence`.'''
         if tokenize:
             sentence = nltk.tokenize.word_tokenize(sentence)
-        tagged = nltk.tag.pos_tag(sentence)
+        tagged = registry.get("pos_tagger").tag(sentence)
         return tagged
 
 
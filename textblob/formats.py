@@ -1,21 +1,157 @@
 # -*- coding: utf-8 -*-
-"""File formats for training and testing data."""
+"""File formats for training and testing data.
+
+Formats read their files lazily: iterating over a format yields one
+``(text, label)`` row at a time, and ``iter_chunks`` yields lists of rows,
+so a file doesn't have to fit in memory. Files may be gzipped.
+"""
 
 from __future__ import absolute_import
-from textblob.compat import PY2, csv
+import codecs
+import contextlib
+import gzip
+import io
 import json
+import re
+
+from textblob.compat import PY2, csv
+from textblob.decorators import cached_property
+from textblob.utils import chunked
 
 DEFAULT_ENCODING = 'utf-8'
+DEFAULT_CHUNKSIZE = 1000
+GZIP_MAGIC = b'\x1f\x8b'
+
+# Number of characters read at a time when streaming a JSON array
+_BUFSIZE = 64 * 1024
+_WHITESPACE = re.compile(r'\s*')
+# Text without any JSON structural characters up to the end of the buffer
+_TOKEN_TAIL = re.compile(r'[^\s,:\[\]{}"]*\Z')
+_ERROR_POSITION = re.compile(r'\(char (\d+)')
+
+
+def _is_gzip(fname):
+    '''Return True if ``fname`` is a gzipped file.'''
+    with open(fname, 'rb') as fp:
+        return fp.read(len(GZIP_MAGIC)) == GZIP_MAGIC
+
+
+def _open(fname, text=True):
+    '''Open a data file for reading, decompressing it if it is gzipped.
+    Return a file of unicode text, or on Python 2 a file of bytes if ``text``
+    is False (the CSV reader decodes the bytes itself). Use the result in a
+    ``with`` statement.
+    '''
+    if _is_gzip(fname):
+        fp = gzip.open(fname, 'rb')
+        if PY2:
+            if text:
+                return codecs.getreader(DEFAULT_ENCODING)(fp)
+            # GzipFile isn't a context manager on Python 2.6
+            return contextlib.closing(fp)
+        return io.TextIOWrapper(fp, encoding=DEFAULT_ENCODING, newline='')
+    if PY2 and not text:
+        return open(fname, 'rb')
+    return io.open(fname, 'r', encoding=DEFAULT_ENCODING, newline='')
+
+
+def _iter_json_array(fp, bufsize=_BUFSIZE):
+    '''Generate the items of the JSON array in the file ``fp``, decoding one
+    item at a time instead of loading the whole array.
+    '''
+    decode = json.JSONDecoder().raw_decode
+    buf, pos, eof = '', 0, False
+    # What comes next: the opening bracket, the first item or the closing
+    # bracket, an item, a comma or the closing bracket, or nothing
+    state = 'open'
+    while True:
+        pos = _WHITESPACE.match(buf, pos).end()
+        if pos == len(buf):
+            if eof:
+                if state == 'done':
+                    return
+                raise ValueError("Unexpected end of JSON array.")
+            buf, pos = fp.read(bufsize), 0
+            eof = not buf
+            continue
+        char = buf[pos]
+        if state == 'open':
+            if char != '[':
+                raise ValueError("Expected a JSON array.")
+            pos += 1
+            state = 'first'
+        elif state == 'done':
+            raise ValueError("Unexpected data after the JSON array.")
+        elif char == ']' and state in ('first', 'comma'):
+            pos += 1
+            state = 'done'
+        elif state == 'comma':
+            if char != ',':
+                raise ValueError("Expected ',' or ']' in JSON array.")
+            pos += 1
+            state = 'item'
+        else:
+            # A number or literal at the end of the buffer may be cut off
+            if eof or not _TOKEN_TAIL.match(buf, pos):
+                try:
+                    item, pos = decode(buf, idx=pos)
+                except ValueError as error:
+                    if eof or not _is_truncated(error, buf):
+                        raise
+                else:
+                    yield item
+                    state = 'comma'
+                    continue
+            # Read more of the item, doubling the buffer so that a large
+            # item isn't decoded over and over
+            buf, pos = buf[pos:], 0
+            more = fp.read(max(bufsize, len(buf)))
+            eof = not more
+            buf += more
+
+
+def _is_truncated(error, buf):
+    '''Return True if the JSON decoding ``error`` may be caused by the end of
+    ``buf`` cutting off the item, rather than by invalid JSON.
+    '''
+    if str(error).startswith('Unterminated string'):
+        return True
+    pos = getattr(error, 'pos', None)
+    if pos is None:  # Python 2 only has the position in the message
+        match = _ERROR_POSITION.search(str(error))
+        if match is None:
+            return True
+        pos = int(match.group(1))
+    # The error is in the last token of the buffer
+    return _TOKEN_TAIL.match(buf, pos) is not None
+
 
 class BaseFormat(object):
 
     """Interface for format classes.
 
+    Descendant classes implement ``__iter__``, which yields the rows of the
+    file, or ``to_iterable``.
+
     :param f: A filename.
     """
 
     def __init__(self, fname):
-        pass
+        self.fname = fname
+
+    def __iter__(self):
+        '''Generate the ``(text, label)`` rows of the file.
+
+        .. versionadded:: 0.8.1
+        '''
+        return iter(self.to_iterable())
+
+    def iter_chunks(self, chunksize=DEFAULT_CHUNKSIZE):
+        '''Generate lists of at most ``chunksize`` rows.
+
+        .. versionadded:: 0.8.1
+        '''
+        return chunked(self, chunksize)
 
     def to_iterable(self):
         '''Return an iterable object from the data.'''
@@ -34,15 +170,22 @@ class DelimitedFormat(BaseFormat):
 
     delimiter = ","
 
-    def __init__(self, fname):
-        super(DelimitedFormat, self).__init__(fname)
-        with open(fname, 'r') as fp:
+    def __iter__(self):
+        '''Generate the rows of the file. Blank lines are skipped.'''
+        with _open(self.fname, text=not PY2) as fp:
             if PY2:
                 reader = csv.reader(fp, delimiter=self.delimiter,
                                     encoding=DEFAULT_ENCODING)
             else:
                 reader = csv.reader(fp, delimiter=self.delimiter)
-            self.data = [row for row in reader]
+            for row in reader:
+                if row:
+                    yield row
+
+    @cached_property
+    def data(self):
+        '''A list of the rows of the file.'''
+        return list(self)
 
     def to_iterable(self):
         '''Return an iterable object from the data.'''
@@ -105,40 +248,100 @@ class JSON(BaseFormat):
             {"text": "Today is a good day.", "label": "pos"},
             {"text": "I hate this car.", "label": "neg"}
         ]
+
+    Iterating over the format decodes one object at a time.
     """
 
-    def __init__(self, fname):
-        super(JSON, self).__init__(fname)
-        with open(fname, "r") as fp:
-            self.dict = json.load(fp)
+    def __iter__(self):
+        '''Generate the ``(text, label)`` rows of the file.'''
+        with _open(self.fname) as fp:
+            for d in _iter_json_array(fp):
+                yield d['text'], d['label']
+
+    @cached_property
+    def dict(self):
+        '''The decoded JSON array.'''
+        with _open(self.fname) as fp:
+            return json.load(fp)
 
     def to_iterable(self):
         '''Return an iterable object from the JSON data.'''
-        return [(d['text'], d['label']) for d in self.dict]
+        return list(self)
 
     @staticmethod
     def detect(stream):
-        '''Return True if stream is valid JSON.'''
+        '''Return True if stream is a JSON array, or begins a JSON array of
+        objects (``stream`` may be the beginning of a larger file).
+        '''
         try:
-            json.loads(stream)
-            return True
+            return isinstance(json.loads(stream), list)
         except ValueError:
+            pass
+        try:
+            items = _iter_json_array(io.StringIO(stream))
+            return isinstance(next(items), dict)
+        except (ValueError, StopIteration):
             return False
 
+class NDJSON(BaseFormat):
+
+    """Line-delimited JSON format. Assumes that each line is an object with
+    ``text`` and ``label`` properties.
+    ::
+
+        {"text": "Today is a good day.", "label": "pos"}
+        {"text": "I hate this car.", "label": "neg"}
+
+    .. versionadded:: 0.8.1
+    """
+
+    def __iter__(self):
+        '''Generate the ``(text, label)`` rows of the file. Blank lines are
+        skipped.
+        '''
+        with _open(self.fname) as fp:
+            for line in fp:
+                if line.strip():
+                    d = json.loads(line)
+                    yield d['text'], d['label']
+
+    def to_iterable(self):
+        '''Return a list of the ``(text, label)`` rows of the file.'''
+        return list(self)
+
+    @staticmethod
+    def detect(stream):
+        '''Return True if the first line of stream is a JSON object.'''
+        for line in stream.splitlines():
+            if line.strip():
+                try:
+                    return isinstance(json.loads(line), dict)
+                except ValueError:
+                    return False
+        return False
+
 AVAILABLE = {
     'csv': CSV,
     'json': JSON,
+    'ndjson': NDJSON,
     'tsv': TSV
 }
 
+# Formats are detected in this order
+_DETECT_ORDER = (JSON, NDJSON, CSV, TSV)
+
 def detect(filename, max_read=1024):
     '''Attempt to detect a file's format, trying each of the supported
     formats. Return the format class that was detected. If no format is
     detected, return ``None``.
+
+    .. versionchanged:: 0.8.1
+        The beginning of the file is read once, and gzipped files are
+        decompressed.
     '''
-    with open(filename, 'r') as fp:
-        for Format in AVAILABLE.values():
-            if Format.detect(fp.read(max_read)):
-                return Format
-            fp.seek(0)
+    with _open(filename) as fp:
+        stream = fp.read(max_read)
+    for Format in _DETECT_ORDER:
+        if Format.detect(stream):
+            return Format
     return None
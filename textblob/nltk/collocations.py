@@ -70,7 +70,7 @@ class AbstractCollocationFinder(object):
         """Generic filter removes ngrams from the frequency distribution
         if the function returns True when passed an ngram tuple.
         """
-        for ngram, freq in self.ngram_fd.items():
+        for ngram, freq in list(dict.items(self.ngram_fd)):
             if fn(ngram, freq):
                 try:
                     del self.ngram_fd[ngram]
@@ -9,16 +9,28 @@
 # For license information, see LICENSE.TXT
 from __future__ import print_function, unicode_literals
 
+import hashlib
 import math
+import mmap
+import os
 import re
+import struct
+import sys
+import tempfile
+import threading
+from bisect import bisect_right
 from itertools import islice, chain
 from operator import itemgetter, attrgetter
 from collections import defaultdict
 
 from nltk.corpus.reader import CorpusReader
+from nltk.data import FileSystemPathPointer
 from nltk.util import binary_search_file as _binary_search_file
 from nltk.probability import FreqDist
-from nltk.compat import xrange, python_2_unicode_compatible, total_ordering
+from nltk.compat import (xrange, python_2_unicode_compatible, total_ordering,
+                         text_type)
+
+from textblob.utils import LRUCache
 
 ######################################################################
 ## Table of Contents
@@ -28,6 +40,7 @@ from nltk.compat import xrange, python_2_unicode_compatible, total_ordering
 ##   - WordNetError
 ##   - Lemma
 ##   - Synset
+## - Lemma Index
 ## - WordNet Corpus Reader
 ## - WordNet Information Content Corpus Reader
 ## - Similarity Metrics
@@ -881,6 +894,162 @@ class Synset(_WordNetObject):
         return sorted([get_synset(pos, offset) for pos, offset in pointer_tuples])
 
 
+######################################################################
+## Lemma Index
+######################################################################
+
+class LemmaIndex(object):
+    """
+    A read-only map from lemma -> pos -> synset offsets, stored in a
+    compact file that is opened with mmap.  The file holds the sorted
+    lemmas and, for each lemma, its number of synsets for each part of
+    speech followed by their offsets, so opening it doesn't parse the
+    ``index.*`` files, and forked processes share its pages.
+
+    Missing lemmas map to an empty dict, like the ``defaultdict`` that
+    the reader uses when the index can't be built.
+
+    The file format is: a header, the offsets of the lemmas in the lemma
+    data (one more than the number of lemmas), the positions of the
+    entries of the lemmas (also one more), the UTF-8 lemma data, and the
+    entries.  All numbers are little-endian unsigned 32-bit integers.
+    """
+
+    MAGIC = b'WNLEMMAIDX1\n'
+
+    #: The parts of speech of an entry, in order.
+    POS_ORDER = (NOUN, VERB, ADJ, ADV)
+
+    #: One lemma in this many is kept in memory, to narrow down the
+    #: binary search in the file.
+    FENCE_STEP = 64
+
+    def __init__(self, path):
+        with open(path, 'rb') as fp:
+            self._mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        magic = self._mmap[:len(self.MAGIC)]
+        if magic != self.MAGIC:
+            raise WordNetError('%s is not a lemma index' % path)
+        self._len, = struct.unpack_from('<I', self._mmap, len(self.MAGIC))
+        self._starts = len(self.MAGIC) + 4
+        self._entry_starts = self._starts + 4 * (self._len + 1)
+        self._lemma_data = self._entry_starts + 4 * (self._len + 1)
+        self._entries = self._lemma_data + self._uint(self._starts, self._len)
+        self._fences = [self._key(i) for i in xrange(0, self._len, self.FENCE_STEP)]
+
+    @classmethod
+    def write(cls, path, lemma_pos_offsets):
+        """
+        Write a lemma index for a map from lemma -> pos -> offsets to
+        ``path``.  The file is written next to ``path`` and then renamed,
+        so that processes that open the index never see a partial file.
+        """
+        keys = sorted((lemma.encode('utf8'), lemma) for lemma in lemma_pos_offsets)
+        starts, entry_starts, entries = [0], [0], []
+        for key, lemma in keys:
+            starts.append(starts[-1] + len(key))
+            by_pos = lemma_pos_offsets[lemma]
+            entry = [by_pos.get(pos, ()) for pos in cls.POS_ORDER]
+            entries.extend(len(offsets) for offsets in entry)
+            for offsets in entry:
+                entries.extend(offsets)
+            entry_starts.append(len(entries))
+        numbers = starts + entry_starts
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.')
+        try:
+            with os.fdopen(fd, 'wb') as fp:
+                fp.write(cls.MAGIC)
+                fp.write(struct.pack('<I', len(keys)))
+                fp.write(struct.pack('<%dI' % len(numbers), *numbers))
+                fp.write(b''.join(key for key, _ in keys))
+                fp.write(struct.pack('<%dI' % len(entries), *entries))
+            os.chmod(tmp_path, 0o644)
+            os.rename(tmp_path, path)
+        except:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _uint(self, start, i):
+        return struct.unpack_from('<I', self._mmap, start + 4 * i)[0]
+
+    def _key(self, i):
+        start, end = struct.unpack_from('<2I', self._mmap, self._starts + 4 * i)
+        return self._mmap[self._lemma_data + start:self._lemma_data + end]
+
+    def _find(self, lemma):
+        """Return the position of ``lemma``, or -1 if it isn't indexed."""
+        key = lemma.encode('utf8') if isinstance(lemma, text_type) else lemma
+        fence = bisect_right(self._fences, key) - 1
+        if fence < 0:
+            return -1
+        lo = fence * self.FENCE_STEP
+        hi = min(lo + self.FENCE_STEP, self._len)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._len and self._key(lo) == key:
+            return lo
+        return -1
+
+    def __contains__(self, lemma):
+        return self._find(lemma) >= 0
+
+    def __getitem__(self, lemma):
+        i = self._find(lemma)
+        if i < 0:
+            return {}
+        start, end = struct.unpack_from('<2I', self._mmap, self._entry_starts + 4 * i)
+        entry = struct.unpack_from('<%dI' % (end - start), self._mmap,
+                                   self._entries + 4 * start)
+        by_pos, j = {}, len(self.POS_ORDER)
+        for pos, count in zip(self.POS_ORDER, entry):
+            if count:
+                by_pos[pos] = list(entry[j:j + count])
+                j += count
+        if ADJ in by_pos:
+            by_pos[ADJ_SAT] = by_pos[ADJ]
+        return by_pos
+
+    def __iter__(self):
+        for i in xrange(self._len):
+            yield self._key(i).decode('utf8')
+
+    def __len__(self):
+        return self._len
+
+
+def _user_cache_dir():
+    """
+    Return the directory where the current user's lemma indexes are
+    kept: ``textblob`` in ``$XDG_CACHE_HOME`` (``~/.cache`` if unset),
+    or in ``%LOCALAPPDATA%`` on Windows.
+    """
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    else:
+        base = (os.environ.get('XDG_CACHE_HOME') or
+                os.path.join(os.path.expanduser('~'), '.cache'))
+    return os.path.join(base, 'textblob')
+
+
+def _is_up_to_date(path, modified):
+    """Return whether ``path`` exists and is newer than ``modified``."""
+    return os.path.exists(path) and os.path.getmtime(path) >= modified
+
+
+def _makedirs(directory):
+    """Create ``directory`` and its parents, unless it exists."""
+    try:
+        os.makedirs(directory)
+    except OSError:
+        # Another process may have created it
+        if not os.path.isdir(directory):
+            raise
+
 ######################################################################
 ## WordNet Corpus Reader
 ######################################################################
@@ -912,10 +1081,29 @@ class WordNetCorpusReader(CorpusReader):
               'data.adj', 'data.adv', 'data.noun', 'data.verb',
               'adj.exc', 'adv.exc', 'noun.exc', 'verb.exc', )
 
-    def __init__(self, root):
+    #: The name of the lemma index file in the corpus directory.  In
+    #: other directories, the name is prefixed with a hash of the
+    #: corpus directory.
+    LEMMA_INDEX_FILE = 'lemma_pos_offset.idx'
+
+    #: The number of synsets of each part of speech kept in memory.
+    SYNSET_CACHE_SIZE = 20000
+
+    def __init__(self, root, lemma_index=True):
         """
         Construct a new wordnet corpus reader, with the given root
         directory.
+
+        If ``lemma_index`` is true and the corpus is a directory, the
+        lemma offsets are read from a ``LemmaIndex`` file.  An up to
+        date index in the corpus directory is used if there is one.
+        Otherwise, the index is kept in the user's cache directory (see
+        ``_user_cache_dir()``), or in the directory ``lemma_index`` if
+        it is a path, and it is built from the ``index.*`` files the
+        first time and whenever they change.  Pass the corpus directory
+        to build an index that all of the corpus' users share.  If
+        ``lemma_index`` is false, or if the index can't be written, the
+        ``index.*`` files are loaded into memory.
         """
         super(WordNetCorpusReader, self).__init__(root, self._FILES,
                                                   encoding=self._ENCODING)
@@ -925,11 +1113,15 @@ class WordNetCorpusReader(CorpusReader):
 
         Map from lemma -> pos -> synset_index -> offset"""
 
-        self._synset_offset_cache = defaultdict(dict)
-        """A cache so we don't have to reconstuct synsets
+        self._synset_offset_cache = defaultdict(
+            lambda: LRUCache(self.SYNSET_CACHE_SIZE))
+        """A bounded cache so we don't have to reconstuct synsets
 
         Map from pos -> offset -> synset"""
 
+        self._data_mmap = {}
+        self._data_lock = threading.Lock()
+
         self._max_depth = defaultdict(dict)
         """A lookup for the maximum depth of each part of speech.  Useful for
         the lch similarity metric.
@@ -948,13 +1140,50 @@ class WordNetCorpusReader(CorpusReader):
             self._lexnames.append(lexname)
 
         # Load the indices for lemmas and synset offsets
-        self._load_lemma_pos_offset_map()
+        if lemma_index is True:
+            lemma_index = _user_cache_dir()
+        if not (lemma_index and self._open_lemma_index(lemma_index)):
+            self._load_lemma_pos_offset_map()
 
         # load the exception file data into memory
         self._load_exception_map()
 
 
+    def _open_lemma_index(self, directory):
+        """
+        Use the lemma index file of the corpus directory if it's up to
+        date with the ``index.*`` files, or else the one in
+        ``directory``, building it if it's missing or older than them.
+        Return whether an index could be used.
+        """
+        if not isinstance(self._root, FileSystemPathPointer):
+            return False
+        root = os.path.abspath(self._root.path)
+        corpus_index = os.path.join(root, self.LEMMA_INDEX_FILE)
+        sources = [os.path.join(root, 'index.%s' % suffix)
+                   for suffix in self._FILEMAP.values()]
+        try:
+            if os.path.abspath(directory) == root:
+                path = corpus_index
+            else:
+                key = root.encode('utf8') if isinstance(root, text_type) else root
+                path = os.path.join(directory, '%s-%s' % (
+                    hashlib.sha1(key).hexdigest()[:16], self.LEMMA_INDEX_FILE))
+            modified = max(os.path.getmtime(source) for source in sources)
+            if _is_up_to_date(corpus_index, modified):
+                path = corpus_index
+            elif not _is_up_to_date(path, modified):
+                self._load_lemma_pos_offset_map()
+                _makedirs(directory)
+                LemmaIndex.write(path, self._lemma_pos_offset_map)
+            self._lemma_pos_offset_map = LemmaIndex(path)
+        except (IOError, OSError, ValueError, WordNetError):
+            # Keep the index files if they were loaded to build the index
+            return len(self._lemma_pos_offset_map) > 0
+        return True
+
     def _load_lemma_pos_offset_map(self):
+        self._lemma_pos_offset_map = defaultdict(dict)
         for suffix in self._FILEMAP.values():
 
             # parse each line of the file (ignoring comment lines)
@@ -1117,17 +1346,43 @@ class WordNetCorpusReader(CorpusReader):
             self._data_file_map[pos] = self.open(fileid)
         return self._data_file_map[pos]
 
+    def _data_line(self, pos, offset):
+        """
+        Return the line at ``offset`` of the data file for the given
+        part of speech.  Files in a directory are read with mmap, so that
+        threads don't share a file position.
+        """
+        if pos == ADJ_SAT:
+            pos = ADJ
+        data = self._data_mmap.get(pos)
+        if data is None and isinstance(self._root, FileSystemPathPointer):
+            with self._data_lock:
+                data = self._data_mmap.get(pos)
+                if data is None:
+                    path = os.path.join(self._root.path,
+                                        'data.%s' % self._FILEMAP[pos])
+                    with open(path, 'rb') as fp:
+                        data = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+                    self._data_mmap[pos] = data
+        if data is not None:
+            end = data.find(b'\n', offset)
+            end = len(data) if end < 0 else end + 1
+            return data[offset:end].decode(self._ENCODING)
+        with self._data_lock:
+            data_file = self._data_file(pos)
+            data_file.seek(offset)
+            return data_file.readline()
+
     def _synset_from_pos_and_offset(self, pos, offset):
         # Check to see if the synset is in the cache
-        if offset in self._synset_offset_cache[pos]:
-            return self._synset_offset_cache[pos][offset]
+        synset = self._synset_offset_cache[pos].get(offset)
+        if synset is not None:
+            return synset
 
-        data_file = self._data_file(pos)
-        data_file.seek(offset)
-        data_file_line = data_file.readline()
+        data_file_line = self._data_line(pos, offset)
         synset = self._synset_from_pos_and_line(pos, data_file_line)
         assert synset.offset == offset
-        self._synset_offset_cache[pos][offset] = synset
+        self._synset_offset_cache[pos].set(offset, synset)
         return synset
 
     def _synset_from_pos_and_line(self, pos, data_file_line):
@@ -1322,13 +1577,12 @@ class WordNetCorpusReader(CorpusReader):
                 line = data_file.readline()
                 while line:
                     if not line[0].isspace():
-                        if offset in cache[pos_tag]:
-                            # See if the synset is cached
-                            synset = cache[pos_tag][offset]
-                        else:
+                        # See if the synset is cached
+                        synset = cache[pos_tag].get(offset)
+                        if synset is None:
                             # Otherwise, parse the line
                             synset = from_pos_and_line(pos_tag, line)
-                            cache[pos_tag][offset] = synset
+                            cache[pos_tag].set(offset, synset)
 
                         # adjective satellites are in the same file as
                         # adjectives so only yield the synset if it's actually
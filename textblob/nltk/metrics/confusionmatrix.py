@@ -44,25 +44,45 @@ class ConfusionMatrix(object):
         """
         if len(reference) != len(test):
             raise ValueError('Lists must have the same length.')
+        self._init(FreqDist(zip(reference, test)), sort_by_count)
 
+    @classmethod
+    def from_counts(cls, counts, sort_by_count=False):
+        """
+        Construct a new confusion matrix from a dictionary that maps
+        ``(reference, test)`` value pairs to the number of times that
+        the reference value corresponds to the test value.  Counts can
+        be accumulated one batch at a time, so the reference and test
+        values don't have to be kept in lists.
+
+        :type counts: dict
+        :param counts: A dictionary mapping ``(reference, test)`` pairs
+            to counts.
+        """
+        matrix = cls.__new__(cls)
+        matrix._init(counts, sort_by_count)
+        return matrix
+
+    def _init(self, counts, sort_by_count):
         # Get a list of all values.
+        value_counts = FreqDist()
+        for (r, t), count in counts.items():
+            value_counts.inc(r, count)
+            value_counts.inc(t, count)
         if sort_by_count:
-            ref_fdist = FreqDist(reference)
-            test_fdist = FreqDist(test)
-            def key(v): return -(ref_fdist[v]+test_fdist[v])
-            values = sorted(set(reference+test), key=key)
+            def key(v): return -value_counts[v]
+            values = sorted(value_counts, key=key)
         else:
-            values = sorted(set(reference+test))
+            values = sorted(value_counts)
 
         # Construct a value->index dictionary
         indices = dict((val,i) for (i,val) in enumerate(values))
 
         # Make a confusion matrix table.
         confusion = [[0 for val in values] for val in values]
-        max_conf = 0 # Maximum confusion
-        for w,g in zip(reference, test):
-            confusion[indices[w]][indices[g]] += 1
-            max_conf = max(max_conf, confusion[indices[w]][indices[g]])
+        for (w, g), count in counts.items():
+            confusion[indices[w]][indices[g]] += count
+        max_conf = max([0] + [max(row) for row in confusion])
 
         #: A list of all values in ``reference`` or ``test``.
         self._values = values
@@ -73,7 +93,7 @@ class ConfusionMatrix(object):
         #: The greatest count in ``self._confusion`` (used for printing).
         self._max_conf = max_conf
         #: The total number of values in the confusion matrix.
-        self._total = len(reference)
+        self._total = sum(counts.values())
         #: The number of correct (on-diagonal) values in the matrix.
         self._correct = sum(confusion[i][i] for i in range(len(values)))
 
@@ -39,6 +39,7 @@ implementation of the ``ConditionalProbDistI`` interface is
 """
 from __future__ import print_function, unicode_literals
 
+import heapq
 import math
 import random
 import warnings
@@ -91,8 +92,12 @@ class FreqDist(dict):
     """
 
     _N = 0
+    _Nr_cache = None
+    _max_cache = None
+    _item_cache = None
+    ordered = True
 
-    def __init__(self, samples=None):
+    def __init__(self, samples=None, ordered=True):
         """
         Construct a new frequency distribution.  If ``samples`` is
         given, then the frequency distribution will be initialized
@@ -107,9 +112,18 @@ class FreqDist(dict):
         :param samples: The samples to initialize the frequency
             distribution with.
         :type samples: Sequence
+        :param ordered: If false, ``keys()``, ``values()``, ``items()``
+            and iteration return the samples in arbitrary order instead
+            of sorting them by frequency.  Use ``most_common()`` to get
+            the most frequent samples of an unordered FreqDist.
+        :type ordered: bool
         """
         dict.__init__(self)
-        self._reset_caches()
+        self.ordered = ordered
+        self._N = 0
+        self._Nr_cache = {}
+        self._max_cache = None
+        self._item_cache = None
         if samples:
             self.update(samples)
 
@@ -126,7 +140,7 @@ class FreqDist(dict):
                supported sample type.
         """
         if count == 0: return
-        self[sample] = self.get(sample,0) + count
+        self[sample] = dict.get(self, sample, 0) + count
 
     def __setitem__(self, sample, value):
         """
@@ -139,12 +153,48 @@ class FreqDist(dict):
         :rtype: None
         :raise TypeError: If ``sample`` is not a supported sample type.
         """
-
-        self._N += (value - self.get(sample, 0))
+        old = dict.get(self, sample, 0)
         dict.__setitem__(self, sample, value)
+        self._N += value - old
+        self._item_cache = None
 
-        # Invalidate the caches
-        self._reset_caches()
+        # Keep the table of count frequencies and the max up to date,
+        # rather than rescanning the distribution when they're needed.
+        Nr = self._Nr_cache
+        if Nr is not None:
+            if old:
+                _decrement(Nr, old)
+            if value:
+                Nr[value] = Nr.get(value, 0) + 1
+        best = self._max_cache
+        if best is not None:
+            if sample == best:
+                if value < old:
+                    self._max_cache = None
+            else:
+                best_count = dict.__getitem__(self, best)
+                try:
+                    if value > best_count or (value == best_count and sample > best):
+                        self._max_cache = sample
+                except TypeError:
+                    # Unorderable samples; let max() raise the error
+                    self._max_cache = None
+
+    def __delitem__(self, sample):
+        self._forget(sample, dict.__getitem__(self, sample))
+        dict.__delitem__(self, sample)
+
+    def _forget(self, sample, count):
+        """
+        Update the total and the caches for a sample that is being
+        removed.
+        """
+        self._N -= count
+        self._item_cache = None
+        if self._Nr_cache is not None and count:
+            _decrement(self._Nr_cache, count)
+        if sample == self._max_cache:
+            self._max_cache = None
 
     def N(self):
         """
@@ -184,7 +234,10 @@ class FreqDist(dict):
 
         :rtype: list
         """
-        return [item for item in self if self[item] == 1]
+        hapaxes = [sample for sample, count in dict.items(self) if count == 1]
+        if self.ordered:
+            hapaxes.sort()
+        return hapaxes
 
     def Nr(self, r, bins=None):
         """
@@ -205,9 +258,8 @@ class FreqDist(dict):
         if r == 0:
             return (bins-self.B() if bins is not None else 0)
 
-        # We have to search the entire distribution to find Nr.  Since
-        # this is an expensive operation, and is likely to be used
-        # repeatedly, cache the results.
+        # The Nr table is kept up to date as samples are counted once
+        # it has been built.
         if self._Nr_cache is None:
             self._cache_Nr_values()
 
@@ -223,12 +275,10 @@ class FreqDist(dict):
 
     def _cache_Nr_values(self):
         Nr = defaultdict(int)
-        for sample in self:
-            c = self.get(sample, 0)
-            if c == 0 and c not in Nr:
-                continue
-            Nr[c] += 1
-        self._Nr_cache = Nr
+        for c in dict.values(self):
+            if c:
+                Nr[c] += 1
+        self._Nr_cache = dict(Nr)
 
     def _cumulative_frequencies(self, samples=None):
         """
@@ -283,9 +333,29 @@ class FreqDist(dict):
         if self._max_cache is None:
             if len(self) == 0:
                 raise ValueError('A FreqDist must have at least one sample before max is defined.')
-            self._max_cache = max((a,b) for (b,a) in self.items())[1]
+            self._max_cache = max((a,b) for (b,a) in dict.items(self))[1]
         return self._max_cache
 
+    def most_common(self, n=None):
+        """
+        Return the ``n`` most common samples and their counts, in
+        decreasing order of frequency (samples with the same count are
+        sorted).  If ``n`` is None, return all of the samples.
+
+        Selecting the top ``n`` samples uses a heap, so it takes time
+        linear in the number of samples rather than sorting the whole
+        distribution.
+
+        :param n: The number of samples to return.
+        :type n: int
+        :rtype: list(tuple)
+        """
+        if n is None:
+            return sorted(dict.items(self), key=_by_count)
+        if self._item_cache is not None:
+            return self._item_cache[:n]
+        return heapq.nsmallest(n, dict.items(self), key=_by_count)
+
     def plot(self, *args, **kwargs):
         """
         Plot samples from the frequency distribution
@@ -364,13 +434,16 @@ class FreqDist(dict):
 
     def _sort_keys_by_value(self):
         if not self._item_cache:
-            self._item_cache = sorted(dict.items(self), key=lambda x:(-x[1], x[0]))
+            self._item_cache = sorted(dict.items(self), key=_by_count)
 
     def keys(self):
         """
         Return the samples sorted in decreasing order of frequency.
         Returns a list in Python 2.x, and an iterator in Python 3.x.
+        If the FreqDist isn't ``ordered``, the samples aren't sorted.
         """
+        if not self.ordered:
+            return dict.keys(self)
         self._sort_keys_by_value()
         return map(itemgetter(0), self._item_cache)
 
@@ -378,16 +451,22 @@ class FreqDist(dict):
         """
         Return the samples sorted in decreasing order of frequency.
         Returns a list in Python 2.x, and an iterator in Python 3.x.
+        If the FreqDist isn't ``ordered``, the values aren't sorted.
         """
+        if not self.ordered:
+            return dict.values(self)
         self._sort_keys_by_value()
         return map(itemgetter(1), self._item_cache)
 
     def items(self):
         """
         Return the items sorted in decreasing order of frequency.
+        If the FreqDist isn't ``ordered``, the items aren't sorted.
 
         :rtype: list(tuple)
         """
+        if not self.ordered:
+            return list(dict.items(self))
         self._sort_keys_by_value()
         return self._item_cache[:]
 
@@ -421,6 +500,8 @@ class FreqDist(dict):
 
         :rtype: iter of any
         """
+        if not self.ordered:
+            return iter(dict.items(self))
         self._sort_keys_by_value()
         return iter(self._item_cache)
 
@@ -430,7 +511,14 @@ class FreqDist(dict):
 
         :rtype: FreqDist
         """
-        return self.__class__(self)
+        clone = self.__class__(ordered=self.ordered)
+        dict.update(clone, self)
+        clone._N = self._N
+        clone._Nr_cache = (self._Nr_cache.copy()
+                           if self._Nr_cache is not None else None)
+        clone._max_cache = self._max_cache
+        clone._item_cache = self._item_cache
+        return clone
 
     def update(self, samples):
         """
@@ -440,30 +528,61 @@ class FreqDist(dict):
         :param samples: The samples to add.
         :type samples: list
         """
-        try:
+        if not isinstance(samples, dict):
+            try:
+                compat.iteritems(samples)
+            except:
+                # Tally the samples first, so that each distinct sample
+                # is only added to the distribution once
+                counts = defaultdict(int)
+                for sample in samples:
+                    counts[sample] += 1
+                samples = counts
+        if isinstance(samples, dict):
+            if not self:
+                self._update_empty(samples)
+                return
+            # Counting doesn't depend on order, so don't sort a FreqDist
+            sample_iter = dict.items(samples)
+        else:
             sample_iter = compat.iteritems(samples)
-        except:
-            sample_iter = ((x, 1) for x in samples)
         for sample, count in sample_iter:
             self.inc(sample, count=count)
 
-    def pop(self, other):
-        self._N -= 1
-        self._reset_caches()
-        return dict.pop(self, other)
+    def _update_empty(self, counts):
+        """
+        Add the counts of the dictionary ``counts`` to this empty
+        distribution.  The Nr table is rebuilt when it's next needed.
+        """
+        dict.update(self, counts)
+        if 0 in dict.values(self):
+            # inc() doesn't record samples with a count of zero
+            for sample in [s for s, c in dict.items(self) if c == 0]:
+                dict.__delitem__(self, sample)
+        self._N = sum(dict.values(self))
+        self._Nr_cache = None
+        self._max_cache = None
+        self._item_cache = None
+
+    def pop(self, sample, *default):
+        if sample not in self:
+            return dict.pop(self, sample, *default)
+        count = dict.pop(self, sample)
+        self._forget(sample, count)
+        return count
 
     def popitem(self):
-        self._N -= 1
-        self._reset_caches()
-        return dict.popitem(self)
+        sample, count = dict.popitem(self)
+        self._forget(sample, count)
+        return sample, count
 
     def clear(self):
+        dict.clear(self)
         self._N = 0
         self._reset_caches()
-        dict.clear(self)
 
     def _reset_caches(self):
-        self._Nr_cache = None
+        self._Nr_cache = {}
         self._max_cache = None
         self._item_cache = None
 
@@ -496,7 +615,7 @@ class FreqDist(dict):
 
         :rtype: string
         """
-        items = ['%r: %r' % (s, self[s]) for s in self.keys()[:10]]
+        items = ['%r: %r' % item for item in self.most_common(10)]
         if len(self) > 10:
             items.append('...')
         return '<FreqDist: %s>' % ', '.join(items)
@@ -504,6 +623,31 @@ class FreqDist(dict):
     def __getitem__(self, sample):
         return self.get(sample, 0)
 
+    def __reduce__(self):
+        return (_restore_freqdist, (self.__class__, dict(self), self.ordered))
+
+
+def _restore_freqdist(cls, counts, ordered):
+    """Unpickle a FreqDist.  Its Nr table is rebuilt when it's needed."""
+    fdist = cls.__new__(cls)
+    dict.update(fdist, counts)
+    fdist.ordered = ordered
+    fdist._N = sum(counts.values())
+    return fdist
+
+
+def _by_count(item):
+    """Sort key for (sample, count) pairs, most frequent first."""
+    return (-item[1], item[0])
+
+
+def _decrement(Nr, count):
+    """Remove one sample with ``count`` from the count frequencies ``Nr``."""
+    if Nr[count] == 1:
+        del Nr[count]
+    else:
+        Nr[count] -= 1
+
 ##//////////////////////////////////////////////////////
 ##  Probability Distributions
 ##//////////////////////////////////////////////////////
@@ -1960,6 +2104,29 @@ class ConditionalFreqDist(defaultdict):
                 print("%4d" % f, end=' ')
             print()
 
+    def __iadd__(self, other):
+        """
+        Add the counts of ``other`` to this ``ConditionalFreqDist``.
+        Distributions counted over separate parts of a corpus can be
+        merged this way.
+
+        :param other: A ``ConditionalFreqDist``, or a dictionary that
+            maps conditions to dictionaries of sample counts.
+        """
+        for cond, counts in compat.iteritems(other):
+            self[cond].update(counts)
+        return self
+
+    def __add__(self, other):
+        """
+        Return a ``ConditionalFreqDist`` with the counts of this one and
+        of ``other``.
+        """
+        clone = self.__class__()
+        clone += self
+        clone += other
+        return clone
+
     # @total_ordering doesn't work here, since the class inherits from a builtin class
     def __le__(self, other):
         if not isinstance(other, ConditionalFreqDist):
@@ -20,8 +20,12 @@ backoff tagger for any other SequentialBackoffTagger.
 from __future__ import print_function, unicode_literals
 
 import re
+from itertools import islice
+
 import yaml
 
+from textblob.utils import WorkerPool
+
 from nltk.probability import FreqDist, ConditionalFreqDist
 from nltk.classify.naivebayes import NaiveBayesClassifier
 from nltk.compat import python_2_unicode_compatible
@@ -100,6 +104,55 @@ class SequentialBackoffTagger(TaggerI):
         """
         raise NotImplementedError()
 
+    def choice_key(self, tokens, index, history):
+        """
+        Return a hashable value that determines the tag that
+        ``choose_tag()`` picks for the specified token, or None if
+        there is no such value.  Training uses it to memoize the
+        decisions of backoff taggers.  By default, return None.
+
+        :type tokens: list
+        :param tokens: The list of words that are being tagged.
+        :type index: int
+        :param index: The index of the word whose tag should be
+            returned.
+        :type history: list(str)
+        :param history: A list of the tags for all words before *index*.
+        """
+        return None
+
+    def _tag_one_key(self, tokens, index, history):
+        """
+        Return a hashable value that determines the tag that
+        ``tag_one()`` returns for the specified token, or None if one
+        of the taggers has no ``choice_key()``.  A tagger whose
+        ``choose_tag()`` is overridden by a subclass of the class that
+        defines its ``choice_key()`` has no ``choice_key()``, since the
+        key may not determine the new ``choose_tag()``.
+        """
+        keys = []
+        for tagger in self._taggers:
+            cls = type(tagger)
+            if (_defining_class(cls, 'choose_tag') is not
+                    _defining_class(cls, 'choice_key')):
+                return None
+            key = tagger.choice_key(tokens, index, history)
+            if key is None:
+                return None
+            keys.append(key)
+        return tuple(keys)
+
+
+def _defining_class(cls, name):
+    """
+    Return the class in the MRO of ``cls`` that defines the attribute
+    ``name``.
+    """
+    for klass in cls.__mro__:
+        if name in klass.__dict__:
+            return klass
+    return None
+
 
 @python_2_unicode_compatible
 class ContextTagger(SequentialBackoffTagger):
@@ -137,6 +190,9 @@ class ContextTagger(SequentialBackoffTagger):
         context = self.context(tokens, index, history)
         return self._context_to_tag.get(context)
 
+    def choice_key(self, tokens, index, history):
+        return (self.context(tokens, index, history),)
+
     def size(self):
         """
         :return: The number of entries in the table used by this
@@ -147,7 +203,7 @@ class ContextTagger(SequentialBackoffTagger):
     def __repr__(self):
         return '<%s: size=%d>' % (self.__class__.__name__, self.size())
 
-    def _train(self, tagged_corpus, cutoff=0, verbose=False):
+    def _train(self, tagged_corpus, cutoff=0, verbose=False, n_jobs=1):
         """
         Initialize this ContextTagger's ``_context_to_tag`` table
         based on the given training data.  In particular, for each
@@ -163,28 +219,28 @@ class ContextTagger(SequentialBackoffTagger):
         :param cutoff: If the most likely tag for a context occurs
             fewer than cutoff times, then exclude it from the
             context-to-tag table for the new tagger.
+        :param n_jobs: The number of worker processes.  If it is
+            greater than 1, the corpus is split into shards of
+            sentences, which are counted in parallel and merged.
         """
 
-        token_count = hit_count = 0
+        hit_count = 0
 
-        # A context is considered 'useful' if it's not already tagged
-        # perfectly by the backoff tagger.
-        useful_contexts = set()
-
-        # Count how many times each tag occurs in each context.
-        fd = ConditionalFreqDist()
-        for sentence in tagged_corpus:
-            tokens, tags = zip(*sentence)
-            for index, (token, tag) in enumerate(sentence):
-                # Record the event.
-                token_count += 1
-                context = self.context(tokens, index, tags[:index])
-                if context is None: continue
-                fd[context].inc(tag)
-                # If the backoff got it wrong, this context is useful:
-                if (self.backoff is None or
-                    tag != self.backoff.tag_one(tokens, index, tags[:index])):
-                    useful_contexts.add(context)
+        if n_jobs <= 1:
+            token_count, fd, useful_contexts = self._count_contexts(
+                tagged_corpus, {})
+        else:
+            token_count = 0
+            fd = ConditionalFreqDist()
+            useful_contexts = set()
+            # Each worker memoizes the backoff decisions of its shards
+            with WorkerPool(n_jobs, (self, {})) as pool:
+                shards = _shards(tagged_corpus, _SHARD_SIZE)
+                for shard_count, shard_counts, shard_useful in pool.imap(
+                        _count_contexts_in_worker, shards, ordered=False):
+                    token_count += shard_count
+                    fd += shard_counts
+                    useful_contexts |= shard_useful
 
         # Build the context_to_tag table -- for each context, figure
         # out what the most likely tag is.  Only include contexts that
@@ -205,6 +261,76 @@ class ContextTagger(SequentialBackoffTagger):
             print("size=%d, backoff=%.2f%%, pruning=%.2f%%]" % (
                 size, backoff, pruning))
 
+    def _count_contexts(self, tagged_corpus, memo):
+        """
+        Count how many times each tag occurs in each context of the
+        tagged corpus, and find the contexts that are useful, i.e.
+        that aren't already tagged perfectly by the backoff tagger.
+        Return the number of tokens, a ``ConditionalFreqDist`` of
+        tags by context and the set of useful contexts.
+
+        :param memo: A dictionary in which the backoff tagger's
+            decisions are memoized, by ``_tag_one_key()``.
+        """
+        token_count = 0
+        useful_contexts = set()
+        fd = ConditionalFreqDist()
+        backoff = self.backoff
+        for sentence in tagged_corpus:
+            tokens, tags = zip(*sentence)
+            for index, tag in enumerate(tags):
+                # Record the event.
+                token_count += 1
+                history = tags[:index]
+                context = self.context(tokens, index, history)
+                if context is None: continue
+                fd[context].inc(tag)
+                # A context is useful if the backoff got it wrong once,
+                # so there's no need to ask the backoff again.
+                if context in useful_contexts: continue
+                if backoff is None:
+                    useful_contexts.add(context)
+                    continue
+                key = backoff._tag_one_key(tokens, index, history)
+                if key is None:
+                    backoff_tag = backoff.tag_one(tokens, index, history)
+                elif key in memo:
+                    backoff_tag = memo[key]
+                else:
+                    backoff_tag = backoff.tag_one(tokens, index, history)
+                    memo[key] = backoff_tag
+                if tag != backoff_tag:
+                    useful_contexts.add(context)
+        return token_count, fd, useful_contexts
+
+
+# The number of sentences in each shard of a corpus that is counted
+# in parallel.
+_SHARD_SIZE = 2000
+
+
+def _count_contexts_in_worker(state, sentences):
+    """
+    Count a shard of a corpus in a worker process, whose state is the
+    tagger and its memo of backoff decisions.  The counts are returned
+    as plain dictionaries, which are quicker to pickle.
+    """
+    tagger, memo = state
+    token_count, fd, useful_contexts = tagger._count_contexts(
+        sentences, memo)
+    counts = dict((context, dict(fdist)) for context, fdist in fd.items())
+    return token_count, counts, useful_contexts
+
+
+def _shards(corpus, size):
+    """Generate lists of at most ``size`` sentences of the corpus."""
+    sentences = iter(corpus)
+    while True:
+        shard = list(islice(sentences, size))
+        if not shard:
+            return
+        yield shard
+
 ######################################################################
 #{ Tagger Classes
 ######################################################################
@@ -235,6 +361,9 @@ class DefaultTagger(SequentialBackoffTagger, yaml.YAMLObject):
     def choose_tag(self, tokens, index, history):
         return self._tag  # ignore token and history
 
+    def choice_key(self, tokens, index, history):
+        return ()
+
     def __repr__(self):
         return '<DefaultTagger: tag=%s>' % self._tag
 
@@ -261,18 +390,20 @@ class NgramTagger(ContextTagger, yaml.YAMLObject):
     :param cutoff: If the most likely tag for a context occurs
         fewer than *cutoff* times, then exclude it from the
         context-to-tag table for the new tagger.
+    :param n_jobs: The number of worker processes used to count
+        the training data.
     """
     yaml_tag = '!nltk.NgramTagger'
 
     def __init__(self, n, train=None, model=None,
-                 backoff=None, cutoff=0, verbose=False):
+                 backoff=None, cutoff=0, verbose=False, n_jobs=1):
         self._n = n
         self._check_params(train, model)
 
         ContextTagger.__init__(self, model, backoff)
 
         if train:
-            self._train(train, cutoff, verbose)
+            self._train(train, cutoff, verbose, n_jobs)
 
     def context(self, tokens, index, history):
         tag_context = tuple(history[max(0,index-self._n+1):index])
@@ -309,14 +440,17 @@ class UnigramTagger(NgramTagger):
     :param cutoff: The number of instances of training data the tagger must see
         in order not to use the backoff tagger
     :type cutoff: int
+    :param n_jobs: The number of worker processes used to count
+        the training data
+    :type n_jobs: int
     """
 
     yaml_tag = '!nltk.UnigramTagger'
 
     def __init__(self, train=None, model=None,
-                 backoff=None, cutoff=0, verbose=False):
+                 backoff=None, cutoff=0, verbose=False, n_jobs=1):
         NgramTagger.__init__(self, 1, train, model,
-                             backoff, cutoff, verbose)
+                             backoff, cutoff, verbose, n_jobs)
 
     def context(self, tokens, index, history):
         return tokens[index]
@@ -339,13 +473,16 @@ class BigramTagger(NgramTagger):
     :param cutoff: The number of instances of training data the tagger must see
         in order not to use the backoff tagger
     :type cutoff: int
+    :param n_jobs: The number of worker processes used to count
+        the training data
+    :type n_jobs: int
     """
     yaml_tag = '!nltk.BigramTagger'
 
     def __init__(self, train=None, model=None,
-                 backoff=None, cutoff=0, verbose=False):
+                 backoff=None, cutoff=0, verbose=False, n_jobs=1):
         NgramTagger.__init__(self, 2, train, model,
-                             backoff, cutoff, verbose)
+                             backoff, cutoff, verbose, n_jobs)
 
 
 class TrigramTagger(NgramTagger):
@@ -365,13 +502,16 @@ class TrigramTagger(NgramTagger):
     :param cutoff: The number of instances of training data the tagger must see
         in order not to use the backoff tagger
     :type cutoff: int
+    :param n_jobs: The number of worker processes used to count
+        the training data
+    :type n_jobs: int
     """
     yaml_tag = '!nltk.TrigramTagger'
 
     def __init__(self, train=None, model=None,
-                 backoff=None, cutoff=0, verbose=False):
+                 backoff=None, cutoff=0, verbose=False, n_jobs=1):
         NgramTagger.__init__(self, 3, train, model,
-                             backoff, cutoff, verbose)
+                             backoff, cutoff, verbose, n_jobs)
 
 
 class AffixTagger(ContextTagger, yaml.YAMLObject):
@@ -391,12 +531,15 @@ class AffixTagger(ContextTagger, yaml.YAMLObject):
     :param min_stem_length: Any words whose length is less than
         min_stem_length+abs(affix_length) will be assigned a
         tag of None by this tagger.
+    :param n_jobs: The number of worker processes used to count
+        the training data.
     """
 
     yaml_tag = '!nltk.AffixTagger'
 
     def __init__(self, train=None, model=None, affix_length=-3,
-                 min_stem_length=2, backoff=None, cutoff=0, verbose=False):
+                 min_stem_length=2, backoff=None, cutoff=0, verbose=False,
+                 n_jobs=1):
 
         self._check_params(train, model)
 
@@ -406,7 +549,7 @@ class AffixTagger(ContextTagger, yaml.YAMLObject):
         self._min_word_length = min_stem_length + abs(affix_length)
 
         if train:
-            self._train(train, cutoff, verbose)
+            self._train(train, cutoff, verbose, n_jobs)
 
     def context(self, tokens, index, history):
         token = tokens[index]
@@ -480,6 +623,9 @@ class RegexpTagger(SequentialBackoffTagger, yaml.YAMLObject):
           return self._map[m.lastgroup]
         return None
 
+    def choice_key(self, tokens, index, history):
+        return (tokens[index],)
+
     def __repr__(self):
         return '<Regexp Tagger: size=%d>' % self._size
 
@@ -56,40 +56,63 @@ class TreebankWordTokenizer(TokenizerI):
     CONTRACTIONS4 = [re.compile(r"(?i)\b(whad)(dd)(ya)\b"),
                      re.compile(r"(?i)\b(wha)(t)(cha)\b")]
 
-    def tokenize(self, text):
-        #starting quotes
-        text = re.sub(r'^\"', r'``', text)
-        text = re.sub(r'(``)', r' \1 ', text)
-        text = re.sub(r'([ (\[{<])"', r'\1 `` ', text)
-
-        #punctuation
-        text = re.sub(r'([:,])([^\d])', r' \1 \2', text)
-        text = re.sub(r'\.\.\.', r' ... ', text)
-        text = re.sub(r'[;@#$%&]', r' \g<0> ', text)
-        text = re.sub(r'([^\.])(\.)([\]\)}>"\']*)\s*$', r'\1 \2\3 ', text)
-        text = re.sub(r'[?!]', r' \g<0> ', text)
-
-        text = re.sub(r"([^'])' ", r"\1 ' ", text)
+    # The substitutions made by tokenize(), in order, as
+    # (regexp, replacement, triggers) tuples.  A substitution is only
+    # made if the text contains one of its triggers, i.e. one of the
+    # strings that every match contains.
+    STARTING_QUOTES = [
+        (re.compile(r'^\"'), r'``', ('"',)),
+        (re.compile(r'(``)'), r' \1 ', ('``',)),
+        (re.compile(r'([ (\[{<])"'), r'\1 `` ', ('"',)),
+    ]
+
+    PUNCTUATION = [
+        (re.compile(r'([:,])([^\d])'), r' \1 \2', (':', ',')),
+        (re.compile(r'\.\.\.'), r' ... ', ('...',)),
+        (re.compile(r'[;@#$%&]'), r' \g<0> ', tuple(';@#$%&')),
+        (re.compile(r'([^\.])(\.)([\]\)}>"\']*)\s*$'), r'\1 \2\3 ', ('.',)),
+        (re.compile(r'[?!]'), r' \g<0> ', ('?', '!')),
+        (re.compile(r"([^'])' "), r"\1 ' ", ("' ",)),
+        # parens, brackets, etc.
+        (re.compile(r'[\]\[\(\)\{\}\<\>]'), r' \g<0> ', tuple('[](){}<>')),
+        (re.compile(r'--'), r' -- ', ('--',)),
+    ]
+
+    ENDING_QUOTES = [
+        (re.compile(r'"'), " '' ", ('"',)),
+        (re.compile(r'(\S)(\'\')'), r'\1 \2 ', ("''",)),
+        (re.compile(r"([^' ])('[sS]|'[mM]|'[dD]|') "), r"\1 \2 ", ("'",)),
+        (re.compile(r"([^' ])('ll|'LL|'re|'RE|'ve|'VE|n't|N'T) "),
+         r"\1 \2 ", ("'",)),
+    ]
+
+    # Every match of CONTRACTIONS2 and CONTRACTIONS3 contains one of these
+    # (in lowercase).
+    CONTRACTION_TRIGGERS = ('not', "'", 'mme', 'nna', 'tta')
+
+    def _substitute(self, text, substitutions):
+        for regexp, repl, triggers in substitutions:
+            for trigger in triggers:
+                if trigger in text:
+                    text = regexp.sub(repl, text)
+                    break
+        return text
 
-        #parens, brackets, etc.
-        text = re.sub(r'[\]\[\(\)\{\}\<\>]', r' \g<0> ', text)
-        text = re.sub(r'--', r' -- ', text)
+    def tokenize(self, text):
+        text = self._substitute(text, self.STARTING_QUOTES)
+        text = self._substitute(text, self.PUNCTUATION)
 
         #add extra space to make things easier
         text = " " + text + " "
 
-        #ending quotes
-        text = re.sub(r'"', " '' ", text)
-        text = re.sub(r'(\S)(\'\')', r'\1 \2 ', text)
-
-        text = re.sub(r"([^' ])('[sS]|'[mM]|'[dD]|') ", r"\1 \2 ", text)
-        text = re.sub(r"([^' ])('ll|'LL|'re|'RE|'ve|'VE|n't|N'T) ", r"\1 \2 ",
-                      text)
+        text = self._substitute(text, self.ENDING_QUOTES)
 
-        for regexp in self.CONTRACTIONS2:
-            text = regexp.sub(r' \1 \2 ', text)
-        for regexp in self.CONTRACTIONS3:
-            text = regexp.sub(r' \1 \2 ', text)
+        lower = text.lower()
+        if any(trigger in lower for trigger in self.CONTRACTION_TRIGGERS):
+            for regexp in self.CONTRACTIONS2:
+                text = regexp.sub(r' \1 \2 ', text)
+            for regexp in self.CONTRACTIONS3:
+                text = regexp.sub(r' \1 \2 ', text)
 
         # We are not using CONTRACTIONS4 since
         # they are also commented out in the SED scripts
@@ -98,6 +121,30 @@ class TreebankWordTokenizer(TokenizerI):
 
         return text.split()
 
+    def span_tokenize(self, text):
+        """
+        Identify the tokens using integer offsets ``(start_i, end_i)``,
+        where ``text[start_i:end_i]`` is the corresponding token.  For the
+        ``\`\``` and ``''`` tokens that ``tokenize()`` makes of double
+        quotes, the offsets are those of the ``"`` character.
+
+            >>> s = 'They said "it\'s fine".'
+            >>> list(TreebankWordTokenizer().span_tokenize(s))
+            [(0, 4), (5, 9), (10, 11), (11, 13), (13, 15), (16, 20), (20, 21), (21, 22)]
+        """
+        i = 0
+        for token in self.tokenize(text):
+            while text[i].isspace():
+                i += 1
+            if text.startswith(token, i):
+                j = i + len(token)
+            elif token in ('``', "''") and text[i] == '"':
+                j = i + 1
+            else:
+                raise ValueError('Token %r not found at offset %d' % (token, i))
+            yield i, j
+            i = j
+
 
 if __name__ == "__main__":
     import doctest
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+'''A process-wide registry of the pickled NLTK models that TextBlob uses.
+
+``nltk.tokenize.sent_tokenize`` and ``nltk.tag.pos_tag`` look up their model
+with ``nltk.data.load`` on every call, which normalizes the resource URL
+each time. The registry loads each model once, holds on to it, and returns
+it with a single dictionary lookup afterwards.
+
+Usage:
+::
+
+    >>> from textblob import registry
+    >>> registry.preload(["punkt", "pos_tagger"])
+    >>> registry.get("punkt").tokenize("Hello world. Goodbye.")
+    ['Hello world.', 'Goodbye.']
+
+.. versionadded:: 0.8.1
+'''
+from __future__ import absolute_import
+import threading
+import time
+
+from textblob.packages import nltk
+
+#: Names of the models that TextBlob uses, mapped to their NLTK resource URLs.
+MODELS = {
+    "punkt": "tokenizers/punkt/english.pickle",
+    "pos_tagger": nltk.tag._POS_TAGGER,
+}
+
+
+class ModelRegistry(object):
+
+    '''Loads models by name and keeps them in memory.
+
+    Keeps count of the lookups that found a loaded model (``hits``) and the
+    ones that had to load it (``misses``), and the time in seconds it took to
+    load each model (``load_times``).
+
+    :param models: (optional) A dictionary of model names and NLTK resource
+        URLs. Defaults to :data:`MODELS`.
+    '''
+
+    def __init__(self, models=None):
+        self.models = dict(MODELS if models is None else models)
+        self.hits = self.misses = 0
+        self.load_times = {}
+        self._loaded = {}
+        self._lock = threading.Lock()
+
+    def get(self, name):
+        '''Return the model called ``name``, loading it if needed.
+
+        :raises: ``LookupError`` if the model's data is not installed.
+        '''
+        model = self._loaded.get(name)
+        if model is not None:
+            self.hits += 1
+            return model
+        return self._load(name)
+
+    def _load(self, name):
+        with self._lock:
+            # Another thread may have loaded it while we waited for the lock
+            model = self._loaded.get(name)
+            if model is not None:
+                self.hits += 1
+                return model
+            self.misses += 1
+            start = time.time()
+            model = nltk.data.load(self.models[name])
+            self.load_times[name] = time.time() - start
+            self._loaded[name] = model
+            return model
+
+    def preload(self, names=None):
+        '''Load the models called ``names`` (all the known models if
+        ``None``) so that later lookups don't have to.
+        '''
+        for name in (self.models if names is None else names):
+            self.get(name)
+
+    def is_loaded(self, name):
+        '''Return whether the model called ``name`` is in memory.'''
+        return name in self._loaded
+
+    def clear(self):
+        '''Forget the loaded models and reset the counters.'''
+        with self._lock:
+            self._loaded.clear()
+            self.load_times.clear()
+            self.hits = self.misses = 0
+
+
+#: The registry shared by the whole process.
+default_registry = ModelRegistry()
+
+get = default_registry.get
+preload = default_registry.preload
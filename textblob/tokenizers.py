@@ -6,10 +6,13 @@
 from __future__ import absolute_import
 
 from textblob.packages import nltk
+from textblob import registry
 from textblob.utils import strip_punc
 from textblob.base import BaseTokenizer
 from textblob.decorators import requires_nltk_corpus
 
+_treebank = nltk.tokenize.TreebankWordTokenizer()
+
 
 class WordTokenizer(BaseTokenizer):
 
@@ -42,6 +45,16 @@ class WordTokenizer(BaseTokenizer):
             return [word if word.startswith("'") else strip_punc(word, all=False)
                     for word in tokens if strip_punc(word, all=False)]
 
+    def span_tokenize(self, text):
+        '''Return a generator of ``(start, end)`` character offsets of the
+        tokens returned by :meth:`tokenize`, including punctuation. Double
+        quotes that the tokenizer turns into ``\`\``` or ``''`` tokens span
+        the original ``"`` character.
+
+        .. versionadded:: 0.8.1
+        '''
+        return _treebank.span_tokenize(text)
+
 
 class SentenceTokenizer(BaseTokenizer):
 
@@ -57,7 +70,7 @@ class SentenceTokenizer(BaseTokenizer):
     def tokenize(self, text):
         '''Return a list of sentences.'''
         ret = []
-        sentences = nltk.tokenize.sent_tokenize(text)  # Initial tokenization
+        sentences = registry.get("punkt").tokenize(text)  # Initial tokenization
         # If there's only one sentence or string of text
         if len(sentences) <= 1:
             return sentences  # return the 1-element list
@@ -77,3 +90,56 @@ class SentenceTokenizer(BaseTokenizer):
                     sentence = "".join([sentence, next_token]) # append the extra punctuation
                 ret.append(sentence)
         return ret
+
+    @requires_nltk_corpus
+    def span_tokenize(self, text):
+        '''Return a generator of ``(start, end)`` character offsets of the
+        sentences in ``text``, so that ``text[start:end]`` is a sentence. The
+        text is split as the generator is consumed, without building a list
+        of all the sentences.
+
+        As with :meth:`tokenize`, punctuation after the end of a sentence
+        (e.g. a closing parenthesis) belongs to that sentence, and a sentence
+        of a single character (e.g. the last "!" of "Wow!! !") is part of the
+        sentence before it.
+
+        .. versionadded:: 0.8.1
+        '''
+        return _sentence_spans(registry.get("punkt"), text)
+
+
+def _realigned_spans(punkt, text):
+    '''Generate the offsets of Punkt's sentences in ``text``, with the
+    punctuation that follows the end of a sentence moved into it, as
+    ``PunktSentenceTokenizer.tokenize`` does with ``realign_boundaries``.
+    '''
+    realignment = punkt._lang_vars.re_boundary_realignment
+    start = end = None
+    for sl in punkt._slices_from_text(text):
+        if start is not None:
+            match = realignment.match(text, sl.start, sl.stop)
+            if match:
+                yield start, sl.start + len(match.group(0).strip())
+                start, end = match.end(), sl.stop
+                continue
+            if start < end:
+                yield start, end
+        start, end = sl.start, sl.stop
+    if start is not None and start < end:
+        yield start, end
+
+
+def _sentence_spans(punkt, text):
+    '''Generate the offsets of the sentences in ``text``, where a sentence
+    of one character is joined with the sentence before it.
+    '''
+    previous = None
+    for start, end in _realigned_spans(punkt, text):
+        if previous is not None and end - start == 1:
+            previous = (previous[0], end)
+            continue
+        if previous is not None:
+            yield previous
+        previous = (start, end)
+    if previous is not None:
+        yield previous
@@ -1,7 +1,11 @@
 # -*- coding: utf-8 -*-
 
+import multiprocessing
 import re
 import string
+import threading
+from collections import deque
+from itertools import islice
 
 PUNCTUATION_REGEX = re.compile('[{0}]'.format(re.escape(string.punctuation)))
 
@@ -50,3 +54,172 @@ def filter_insignificant(chunk, tag_suffixes=('DT', 'CC', 'PRP$', 'PRP')):
         if ok:
             good.append((word, tag))
     return good
+
+
+def chunked(iterable, size):
+    '''Generate lists of at most ``size`` items from ``iterable``.
+
+    .. versionadded:: 0.8.1
+    '''
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, max(size, 1)))
+        if not chunk:
+            return
+        yield chunk
+
+
+class LRUCache(object):
+    '''A thread-safe dictionary that holds at most ``maxsize`` items,
+    discarding the least recently used item when it is full.
+
+    Keeps count of the lookups that were found (``hits``) and not found
+    (``misses``).
+
+    .. versionadded:: 0.8.1
+
+    :param maxsize: The maximum number of items.
+    '''
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.hits = self.misses = 0
+        self._lock = threading.Lock()
+        self._clear()
+
+    def _clear(self):
+        self._items = {}  # key => [prev, next, key, value]
+        self._root = root = []  # Sentinel of the circular linked list
+        root[:] = [root, root, None, None]
+
+    def get(self, key, default=None):
+        '''Return the value for ``key`` and mark it as most recently used,
+        or ``default`` if it is not in the cache.
+        '''
+        with self._lock:
+            link = self._items.get(key)
+            if link is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+            # Move the link to the end of the list
+            prev, next = link[0], link[1]
+            prev[1], next[0] = next, prev
+            root = self._root
+            last = root[0]
+            last[1] = root[0] = link
+            link[0], link[1] = last, root
+            return link[3]
+
+    def set(self, key, value):
+        '''Store ``value`` for ``key``, discarding the least recently used
+        item if the cache is full.
+        '''
+        with self._lock:
+            root = self._root
+            link = self._items.get(key)
+            if link is not None:
+                link[3] = value
+                return
+            if len(self._items) >= self.maxsize:
+                oldest = root[1]
+                if oldest is root:  # maxsize is 0
+                    return
+                root[1], oldest[1][0] = oldest[1], root
+                del self._items[oldest[2]]
+            last = root[0]
+            last[1] = root[0] = self._items[key] = [last, root, key, value]
+
+    def clear(self):
+        '''Remove all items and reset the counters.'''
+        with self._lock:
+            self._clear()
+            self.hits = self.misses = 0
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def __len__(self):
+        return len(self._items)
+
+
+class WorkerPool(object):
+    '''A pool of worker processes, each of which receives a copy of
+    ``state`` once, when it starts, instead of with every task. Can be used
+    as a context manager, which terminates the workers on exit.
+
+    .. versionadded:: 0.8.1
+
+    :param processes: The number of worker processes.
+    :param state: The object passed to the functions that the workers run.
+    :param initializer: (optional) A function that each worker calls with
+        ``state`` when it starts, e.g. to load models.
+    :param window: (optional) The maximum number of items that have been
+        sent to the workers but whose results haven't been yielded yet.
+        Defaults to twice the number of processes.
+    '''
+
+    def __init__(self, processes, state, initializer=None, window=None):
+        self.window = 2 * processes if window is None else max(window, 1)
+        self._pool = multiprocessing.Pool(processes=processes,
+                                          initializer=_init_worker,
+                                          initargs=(state, initializer))
+
+    def imap(self, func, iterable, ordered=True):
+        '''Generate ``func(state, item)`` for each item of ``iterable``,
+        computed by the workers. ``func`` must be a module-level function.
+        If ``ordered`` is ``False``, results are yielded as soon as they are
+        ready.
+
+        Items are read from ``iterable`` only as results are consumed, so
+        that no more than ``window`` items and results are held in memory.
+        '''
+        pending = deque()
+        for item in iterable:
+            if len(pending) >= self.window:
+                yield _next_result(pending, ordered)
+            pending.append(self._pool.apply_async(_run_in_worker,
+                                                  ((func, item),)))
+        while pending:
+            yield _next_result(pending, ordered)
+
+    def close(self):
+        '''Terminate the worker processes.'''
+        self._pool.terminate()
+        self._pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def _next_result(pending, ordered):
+    '''Remove the next result from a deque of pending results and return
+    its value. Unordered results are returned in the order they finish.
+    '''
+    if not ordered:
+        for i, result in enumerate(pending):
+            if result.ready():
+                del pending[i]
+                return result.get()
+    return pending.popleft().get()
+
+
+# The state of a WorkerPool's worker process
+_worker_state = None
+
+
+def _init_worker(state, initializer):
+    '''Initialize a worker process of a WorkerPool.'''
+    global _worker_state
+    _worker_state = state
+    if initializer is not None:
+        initializer(state)
+
+
+def _run_in_worker(task):
+    '''Run a task of a WorkerPool in a worker process.'''
+    func, item = task
+    return func(_worker_state, item)